@@ -0,0 +1,3 @@
+from geoff.main import main
+
+main()
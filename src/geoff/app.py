@@ -1,18 +1,19 @@
+from typing import List
+
 from textual import on
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal
 from textual.widgets import Header, Static
 
 from geoff.config_manager import ConfigManager
+from geoff.config_saver import ConfigSaver
 from geoff.prompt_builder import build_prompt
-from geoff.validator import PromptValidator
-from geoff.clipboard import ClipboardError, copy_to_clipboard
+from geoff.validator import PATH_CACHE_TTL, LiveValidator
 from geoff.messages import ConfigUpdated
 from geoff.widgets.study_docs import StudyDocsWidget
 from geoff.widgets.task_source import TaskSourceWidget
 from geoff.widgets.toolbar import ToolbarWidget
 from geoff.widgets.prompt_preview import PromptPreviewWidget
-from geoff.widgets.error_modal import ErrorModal
 
 
 class GeoffApp(App):
@@ -67,7 +68,15 @@ class GeoffApp(App):
         super().__init__()
         self.config_manager = ConfigManager()
         self.prompt_config = self.config_manager.resolve_config()
-        self.validator = PromptValidator()
+        # Re-checks edited fields as they change, so Run needs no full pass.
+        self.live_validator = LiveValidator()
+        # Autosaves skip fsync; flushes (exit, run) are the durable points.
+        self.config_saver = ConfigSaver(
+            lambda config: self.config_manager.save_repo_config(config, sync=False),
+            debounce=self.prompt_config.config_save_debounce,
+            on_error=self._report_save_error,
+            checkpoint=self.config_manager.sync_repo_config,
+        )
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
@@ -85,11 +94,31 @@ class GeoffApp(App):
         self.title = "geoff"
         self.theme = self.prompt_config.theme
         self.watch(self, "theme", self._update_theme_config, init=False)
+        for error in self.config_manager.template_errors:
+            self.notify(error, severity="error", timeout=15)
+        self._refresh_validation(force=True)
+        # Picks up files created or deleted outside geoff.
+        self.set_interval(PATH_CACHE_TTL, self._refresh_validation)
+
+    def on_unmount(self) -> None:
+        try:
+            self.config_saver.close()
+        except Exception:
+            # Already logged by the saver; the UI is gone.
+            pass
+        stats = self.config_saver.stats
+        if stats.saves:
+            self.log(
+                f"config saves: {stats.saves}, "
+                f"mean {stats.mean_seconds * 1000:.1f}ms, "
+                f"max {stats.max_seconds * 1000:.1f}ms"
+            )
 
     def _update_theme_config(self, theme: str) -> None:
         """Update the config when the theme changes."""
         self.prompt_config.theme = theme
-        self._save_config()
+        # Theme changes are rare; persist them straight away.
+        self._save_config(immediate=True)
 
     @on(ConfigUpdated)
     def handle_config_updated(self) -> None:
@@ -97,21 +126,70 @@ class GeoffApp(App):
         self.prompt_config.theme = self.theme
         self.query_one(PromptPreviewWidget).update_prompt()
         self._save_config()
+        self._refresh_validation()
+
+    def _refresh_validation(self, force: bool = False) -> None:
+        """Re-check changed fields and update the inputs' inline status."""
+        changed = self.live_validator.update(self.prompt_config)
+        if changed or force:
+            self.query_one(StudyDocsWidget).show_validation(self.live_validator)
+            self.query_one(TaskSourceWidget).show_validation(self.live_validator)
+
+    def _validate_for_run(self) -> List[str]:
+        self._refresh_validation()
+        errors = self.live_validator.errors
+        if not errors:
+            # Live checks never write; the breadcrumbs file is created only
+            # once a prompt is actually used.
+            errors = self.live_validator.validator.check_breadcrumbs(
+                self.prompt_config, create=True
+            )
+        return errors
+
+    def _save_config(self, immediate: bool = False) -> None:
+        """Auto-save config to repo-local .geoff/geoff.yaml.
 
-    def _save_config(self) -> None:
-        """Auto-save config to repo-local .geoff/geoff.yaml."""
+        Saves are debounced and written by a background thread unless
+        ``immediate`` is set, which writes before returning.
+        """
         self.prompt_config.theme = self.theme
+        self.config_saver.schedule(self.prompt_config)
+        if immediate:
+            self._flush_config()
+
+    def _flush_config(self) -> None:
         try:
-            self.config_manager.save_repo_config(self.prompt_config)
+            self.config_saver.flush()
         except Exception as e:
             self.notify(f"Failed to save config: {e}", severity="error")
+            return
+        self.log(
+            f"config saved in {self.config_saver.stats.last_seconds * 1000:.1f}ms"
+        )
+
+    def _report_save_error(self, error: Exception) -> None:
+        # Called from the saver thread.
+        try:
+            self.call_from_thread(
+                self.notify, f"Failed to save config: {error}", severity="error"
+            )
+        except RuntimeError:
+            pass
+
+    def _show_errors(self, errors: List[str]) -> None:
+        # Imported on the first validation failure, not at startup.
+        from geoff.widgets.error_modal import ErrorModal
+
+        self.push_screen(ErrorModal(errors))
 
     def on_toolbar_widget_copy_prompt(self, message: ToolbarWidget.CopyPrompt) -> None:
-        errors = self.validator.validate(self.prompt_config)
+        errors = self._validate_for_run()
         if errors:
-            self.push_screen(ErrorModal(errors))
+            self._show_errors(errors)
             return
 
+        from geoff.clipboard import ClipboardError, copy_to_clipboard
+
         prompt = build_prompt(self.prompt_config)
         try:
             copy_to_clipboard(prompt)
@@ -120,37 +198,32 @@ class GeoffApp(App):
             self.notify(f"Clipboard error: {e}", severity="error", timeout=15)
 
     def on_toolbar_widget_run_once(self, message: ToolbarWidget.RunOnce) -> None:
-        errors = self.validator.validate(self.prompt_config)
+        errors = self._validate_for_run()
         if errors:
-            self.push_screen(ErrorModal(errors))
+            self._show_errors(errors)
             return
 
+        self._flush_config()
         prompt = build_prompt(self.prompt_config)
-        self.exit(("run_once", prompt, self.prompt_config.model))
+        self.exit(("run_once", prompt, self.prompt_config))
 
     def on_toolbar_widget_run_loop(self, message: ToolbarWidget.RunLoop) -> None:
-        errors = self.validator.validate(self.prompt_config)
+        errors = self._validate_for_run()
         if errors:
-            self.push_screen(ErrorModal(errors))
+            self._show_errors(errors)
             return
 
+        self._flush_config()
         prompt = build_prompt(self.prompt_config)
-        self.exit(
-            (
-                "run_loop",
-                prompt,
-                self.prompt_config.model,
-                self.prompt_config.max_iterations,
-                self.prompt_config.max_stuck,
-                self.prompt_config.max_frozen,
-            )
-        )
+        self.exit(("run_loop", prompt, self.prompt_config))
 
     async def on_toolbar_widget_reset(self, message: ToolbarWidget.Reset) -> None:
         await self._reset_to_defaults()
 
     async def _reset_to_defaults(self) -> None:
         """Reset all fields to global config defaults."""
+        # A pending save would recreate the file we are about to remove.
+        self.config_saver.discard()
         repo_config_path = self.config_manager.repo_config_path
         if repo_config_path.exists():
             repo_config_path.unlink()
@@ -163,6 +236,7 @@ class GeoffApp(App):
         self.query_one(TaskSourceWidget).update_from_config(self.prompt_config)
 
         self.query_one(PromptPreviewWidget).update_prompt(self.prompt_config)
+        self._refresh_validation(force=True)
         self.notify("Reset to defaults", severity="information")
 
     def on_toolbar_widget_quit(self, message: ToolbarWidget.Quit) -> None:
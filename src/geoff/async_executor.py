@@ -0,0 +1,275 @@
+"""asyncio counterparts of the executor entry points.
+
+Child processes are started with ``asyncio.create_subprocess_exec`` and
+their output is consumed in chunks, with the frozen-output watchdog running
+as a separate task. Because nothing blocks the event loop, one loop can
+supervise any number of agents without a thread per child: the workers of
+a parallel run and the jobs of a batch all run this way.
+"""
+
+import asyncio
+import codecs
+import sys
+import time
+from pathlib import Path
+from typing import Optional, Sequence
+
+from geoff.executor import (
+    EXIT_POLL_SECONDS,
+    READ_CHUNK_SIZE,
+    LoopSummary,
+    ProcessResult,
+    _build_opencode_command,
+    _ChangeDetector,
+    _failed,
+    _iteration_record,
+    _OutputWriter,
+    _record_iteration,
+)
+from geoff.loop_state import LoopCheckpoint
+from geoff.pacing import FixedPacing, PacingPolicy
+from geoff.run_lock import RunLock, RunLockError, default_lock_path
+from geoff.run_log import IterationLog, RunRecorder
+from geoff.state_dir import ensure_state_dir
+
+TERMINATE_GRACE_SECONDS = 5
+
+
+async def _terminate(process: asyncio.subprocess.Process) -> None:
+    if process.returncode is not None:
+        return
+    try:
+        process.terminate()
+    except ProcessLookupError:
+        return
+    try:
+        await asyncio.wait_for(process.wait(), TERMINATE_GRACE_SECONDS)
+    except asyncio.TimeoutError:
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+        await process.wait()
+
+
+async def run_opencode_async(
+    cmd: Sequence[str],
+    cwd: Path,
+    max_frozen_minutes: float = 0,
+    prefix: str = "",
+    log: Optional[IterationLog] = None,
+) -> ProcessResult:
+    """Run one command, streaming its combined output to stdout.
+
+    When ``max_frozen_minutes`` is positive a watchdog task terminates the
+    child once it has produced no output for that long. Raw output is also
+    written to ``log`` when given. Cancelling the call terminates the child.
+    """
+    result = ProcessResult()
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        cwd=cwd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+    )
+    assert process.stdout is not None
+
+    writer = _OutputWriter(prefix)
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    last_activity = time.monotonic()
+    timeout_seconds = max_frozen_minutes * 60
+
+    async def pump() -> None:
+        nonlocal last_activity
+        while True:
+            try:
+                chunk = await asyncio.wait_for(
+                    process.stdout.read(READ_CHUNK_SIZE), EXIT_POLL_SECONDS
+                )
+            except asyncio.TimeoutError:
+                # Child gone and pipe idle (a grandchild may hold it open).
+                if process.returncode is not None:
+                    break
+                continue
+            if not chunk:
+                break
+            last_activity = time.monotonic()
+            result.output_bytes += len(chunk)
+            if log is not None:
+                log.write(chunk)
+            writer.write(decoder.decode(chunk))
+        writer.write(decoder.decode(b"", final=True))
+
+    async def watchdog() -> None:
+        while True:
+            remaining = timeout_seconds - (time.monotonic() - last_activity)
+            if remaining <= 0:
+                result.frozen = True
+                writer.write(
+                    f"\n{prefix}Frozen timeout reached ({max_frozen_minutes} "
+                    "minutes). Terminating iteration.\n"
+                )
+                # The pump keeps draining what the child wrote before dying.
+                await _terminate(process)
+                return
+            await asyncio.sleep(remaining)
+
+    pump_task = asyncio.create_task(pump())
+    watchdog_task = None
+    if max_frozen_minutes > 0:
+        watchdog_task = asyncio.create_task(watchdog())
+
+    try:
+        await pump_task
+        result.returncode = await process.wait()
+    finally:
+        if watchdog_task is not None:
+            watchdog_task.cancel()
+        if not pump_task.done():
+            pump_task.cancel()
+        await _terminate(process)
+
+    return result
+
+
+def _report_missing_opencode() -> None:
+    print(
+        "Error: 'opencode' command not found. Ensure Opencode is installed.",
+        file=sys.stderr,
+    )
+    sys.exit(1)
+
+
+async def execute_opencode_once_async(
+    prompt: str, exec_dir: Optional[Path] = None, model: Optional[str] = None
+) -> ProcessResult:
+    """Async version of execute_opencode_once."""
+    cwd = exec_dir or Path.cwd()
+    try:
+        return await run_opencode_async(_build_opencode_command(prompt, model), cwd)
+    except FileNotFoundError:
+        _report_missing_opencode()
+
+
+async def _run_loop_async(
+    prompt: str,
+    cwd: Path,
+    summary: LoopSummary,
+    max_iterations: int = 0,
+    max_stuck: int = 2,
+    max_frozen: int = 0,
+    model: Optional[str] = None,
+    change_detection: str = "hash",
+    label: str = "",
+    recorder: Optional[RunRecorder] = None,
+    pacing: Optional[PacingPolicy] = None,
+    checkpoint: Optional[LoopCheckpoint] = None,
+) -> None:
+    """Async version of ``executor._run_loop``; cancel the task to stop it."""
+    cmd = _build_opencode_command(prompt, model)
+    pacing = pacing or FixedPacing()
+    detector = _ChangeDetector(cwd, change_detection, label)
+
+    try:
+        while True:
+            started_at = time.time()
+            summary.iterations += 1
+            # Hashing may spawn git or walk the tree; keep it off the loop.
+            await asyncio.to_thread(detector.begin)
+            hash_seconds = detector.seconds
+
+            print(f"\n{label}--- Iteration {summary.iterations} ---")
+            agent_started = time.monotonic()
+            log = recorder.open_log(summary.iterations) if recorder else None
+            try:
+                result = await run_opencode_async(
+                    cmd, cwd=cwd, max_frozen_minutes=max_frozen, prefix=label, log=log
+                )
+            finally:
+                if recorder is not None:
+                    recorder.close_log(log)
+            agent_seconds = time.monotonic() - agent_started
+
+            has_changes, changed = await asyncio.to_thread(detector.finish)
+            hash_seconds += detector.seconds
+            stop = _record_iteration(
+                summary, has_changes, changed, max_iterations, max_stuck, label
+            )
+            delay = 0.0 if stop else pacing.delay(has_changes, _failed(result))
+            if recorder is not None:
+                recorder.record(
+                    _iteration_record(
+                        summary,
+                        started_at,
+                        agent_seconds,
+                        hash_seconds,
+                        result,
+                        has_changes,
+                        changed,
+                        delay,
+                    )
+                )
+            if checkpoint is not None:
+                checkpoint.update(
+                    summary.iterations, summary.stuck_count, detector.last_hash
+                )
+            if stop:
+                break
+
+            if delay > 0:
+                await asyncio.sleep(delay)
+    finally:
+        detector.close()
+
+
+async def execute_opencode_loop_async(
+    prompt: str,
+    max_iterations: int = 0,
+    max_stuck: int = 2,
+    max_frozen: int = 0,
+    exec_dir: Optional[Path] = None,
+    model: Optional[str] = None,
+    change_detection: str = "hash",
+    recorder: Optional[RunRecorder] = None,
+    pacing: Optional[PacingPolicy] = None,
+) -> LoopSummary:
+    """Async version of execute_opencode_loop with the same stop conditions."""
+    cwd = exec_dir or Path.cwd()
+    summary = LoopSummary()
+
+    print(
+        "Starting loop execution (max_iterations="
+        f"{max_iterations}, max_stuck={max_stuck}, max_frozen={max_frozen})"
+    )
+
+    ensure_state_dir(cwd)
+    run_lock = RunLock(default_lock_path(cwd))
+    try:
+        run_lock.acquire()
+    except RunLockError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    try:
+        await _run_loop_async(
+            prompt,
+            cwd,
+            summary,
+            max_iterations=max_iterations,
+            max_stuck=max_stuck,
+            max_frozen=max_frozen,
+            model=model,
+            change_detection=change_detection,
+            recorder=recorder,
+            pacing=pacing,
+        )
+    except asyncio.CancelledError:
+        summary.stop_reason = "cancelled"
+        print("\nLoop cancelled by user")
+        raise
+    except FileNotFoundError:
+        _report_missing_opencode()
+    finally:
+        run_lock.release()
+        print(f"\nLoop terminated after {summary.iterations} iteration(s)")
+
+    return summary
@@ -0,0 +1,234 @@
+"""Run a queue of one-off prompts with bounded concurrency.
+
+Each prompt is wrapped with the configured study docs, backpressure and
+breadcrumb sections exactly as one-off mode would wrap it, then executed
+once in its own git worktree (or its own directory under a target root).
+All jobs are supervised by one asyncio event loop, with a semaphore
+bounding how many agents run at once.
+Files the prompt refers to that are missing from a job's directory, such as
+uncommitted study docs or any doc in a fresh target directory, are copied
+there so the prompt's relative paths resolve.
+"""
+
+import asyncio
+import re
+import sys
+import time
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import List, Optional
+
+from geoff.async_executor import run_opencode_async
+from geoff.config import PromptConfig
+from geoff.executor import ProcessResult, _build_opencode_command
+from geoff.parallel import (
+    WorktreeError,
+    copy_missing_files,
+    create_worktree,
+    repo_root,
+)
+from geoff.prompt_builder import build_prompt, prompt_files
+
+PROMPT_SUFFIXES = (".md", ".txt", ".prompt")
+# Separates prompts when a single file holds several.
+PROMPT_SEPARATOR = "---"
+
+
+class BatchError(Exception):
+    """Raised when a prompt queue cannot be loaded."""
+
+    pass
+
+
+@dataclass
+class BatchJob:
+    name: str
+    prompt: str
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one batch job."""
+
+    job: BatchJob
+    directory: Optional[Path] = None
+    result: ProcessResult = field(default_factory=ProcessResult)
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def status(self) -> str:
+        if self.error:
+            return "error"
+        if self.result.frozen:
+            return "frozen"
+        return "ok" if self.result.returncode == 0 else "failed"
+
+
+def _slug(text: str) -> str:
+    slug = re.sub(r"[^A-Za-z0-9._-]+", "-", text).strip("-.")
+    return slug or "prompt"
+
+
+def load_prompt_queue(source: Path) -> List[BatchJob]:
+    """Load one-off prompts from a file or a directory.
+
+    A directory contributes one prompt per ``.md``/``.txt``/``.prompt`` file,
+    in name order. A file holds one or more prompts separated by lines that
+    contain only ``---``. Blank prompts are skipped.
+    """
+    source = Path(source)
+    jobs: List[BatchJob] = []
+
+    if source.is_dir():
+        for path in sorted(source.iterdir()):
+            if path.is_file() and path.suffix in PROMPT_SUFFIXES:
+                text = path.read_text(encoding="utf-8").strip()
+                if text:
+                    jobs.append(BatchJob(name=_slug(path.stem), prompt=text))
+    elif source.is_file():
+        chunks: List[List[str]] = [[]]
+        for line in source.read_text(encoding="utf-8").splitlines():
+            if line.strip() == PROMPT_SEPARATOR:
+                chunks.append([])
+            else:
+                chunks[-1].append(line)
+        texts = [t for t in ("\n".join(c).strip() for c in chunks) if t]
+        width = len(str(len(texts)))
+        for i, text in enumerate(texts, 1):
+            jobs.append(
+                BatchJob(name=f"{_slug(source.stem)}-{i:0{width}d}", prompt=text)
+            )
+    else:
+        raise BatchError(f"Prompt queue not found: {source}")
+
+    if not jobs:
+        raise BatchError(f"No prompts found in {source}")
+
+    # Directory names must be unique per job.
+    seen = {}
+    for job in jobs:
+        count = seen.get(job.name, 0)
+        seen[job.name] = count + 1
+        if count:
+            job.name = f"{job.name}-{count + 1}"
+    return jobs
+
+
+def wrap_prompt(config: PromptConfig, prompt: str) -> str:
+    """Build the full prompt for one job as one-off mode would."""
+    return build_prompt(replace(config, task_mode="oneoff", oneoff_prompt=prompt))
+
+
+def _prepare_directory(job: BatchJob, root: Path, target_root: Optional[Path]) -> Path:
+    if target_root is not None:
+        directory = target_root / job.name
+        directory.mkdir(parents=True, exist_ok=True)
+        return directory
+    return create_worktree(root, f"batch-{job.name}")
+
+
+def execute_batch(
+    jobs: List[BatchJob],
+    config: PromptConfig,
+    concurrency: int = 2,
+    exec_dir: Optional[Path] = None,
+    target_root: Optional[Path] = None,
+) -> List[BatchResult]:
+    """Run each job once, at most ``concurrency`` at a time.
+
+    Args:
+        jobs: Prompts to run (see load_prompt_queue)
+        config: Supplies study docs, backpressure, breadcrumbs, model and
+            the frozen timeout
+        concurrency: Maximum number of agents running at once
+        exec_dir: Repository the job worktrees are created from (defaults
+            to cwd), and where the prompt's files are copied from
+        target_root: Run each job in ``target_root/<name>`` instead of a
+            worktree
+
+    Returns:
+        One BatchResult per job, in queue order.
+    """
+    cwd = exec_dir or Path.cwd()
+    root = cwd
+    if target_root is None:
+        try:
+            root = repo_root(cwd)
+        except WorktreeError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    print(f"Starting batch execution (jobs={len(jobs)}, concurrency={concurrency})")
+
+    files = prompt_files(replace(config, task_mode="oneoff"))
+    results = [BatchResult(job=job) for job in jobs]
+    # git serialises worktree creation on its own locks; do it up front.
+    for result in results:
+        try:
+            result.directory = _prepare_directory(result.job, root, target_root)
+            copy_missing_files(files, cwd, result.directory)
+        except (WorktreeError, OSError) as e:
+            result.error = str(e)
+
+    async def run_job(result: BatchResult, slots: asyncio.Semaphore) -> None:
+        if result.error:
+            return
+        job = result.job
+        async with slots:
+            started = time.monotonic()
+            try:
+                cmd = _build_opencode_command(
+                    wrap_prompt(config, job.prompt), config.model
+                )
+                result.result = await run_opencode_async(
+                    cmd,
+                    cwd=result.directory,
+                    max_frozen_minutes=config.max_frozen,
+                    prefix=f"[{job.name}] ",
+                )
+            except FileNotFoundError:
+                result.error = "'opencode' command not found"
+            except OSError as e:
+                result.error = str(e)
+            finally:
+                result.seconds = time.monotonic() - started
+
+    async def run_jobs() -> None:
+        slots = asyncio.Semaphore(max(concurrency, 1))
+        await asyncio.gather(*(run_job(result, slots) for result in results))
+
+    try:
+        asyncio.run(run_jobs())
+    except KeyboardInterrupt:
+        print("\nBatch cancelled by user")
+        for result in results:
+            if not result.error and result.result.returncode is None:
+                result.error = "cancelled"
+
+    print(format_batch_summary(results, root))
+    return results
+
+
+def format_batch_summary(results: List[BatchResult], root: Path) -> str:
+    """Render a table of job name, status, exit code, duration and directory."""
+    rows = [("job", "status", "exit", "time", "directory")]
+    for r in results:
+        directory = "-"
+        if r.directory is not None:
+            try:
+                directory = str(r.directory.relative_to(root))
+            except ValueError:
+                directory = str(r.directory)
+        exit_code = "-" if r.result.returncode is None else str(r.result.returncode)
+        status = f"error: {r.error}" if r.error else r.status
+        rows.append((r.job.name, status, exit_code, f"{r.seconds:.1f}s", directory))
+
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    lines = ["", "Batch summary:"]
+    for row in rows:
+        lines.append("  " + "  ".join(v.ljust(w) for v, w in zip(row, widths)).rstrip())
+    ok = sum(1 for r in results if r.status == "ok")
+    lines.append(f"Succeeded: {ok}/{len(results)}")
+    return "\n".join(lines)
+
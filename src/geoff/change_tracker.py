@@ -0,0 +1,347 @@
+"""Event-driven working tree change detection using Linux inotify.
+
+The tracker talks to inotify through ctypes so it needs no extra packages or
+services. Like the ``git status`` hash it stands in for, it skips paths
+matched by ``.gitignore``/``.geoffignore`` (see ``geoff.ignore``): ignored
+directories are never watched and events for ignored files are dropped.
+It is strictly an accelerator: whenever it cannot vouch for the answer
+(not Linux, watch limit reached, event queue overflow) callers fall back
+to ``compute_repo_hash``.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+from geoff.ignore import IGNORE_FILES, IgnoreRules, parse_lines
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (
+    IN_MODIFY
+    | IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+    | IN_ONLYDIR
+)
+
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+# Directories never watched: geoff's own run state lives here. Also
+# covered by the default ignore rules; kept for paths outside any rule set.
+EXCLUDED_DIRS = {".geoff"}
+# Inside .git only ref movement matters; index/object churn is not a change.
+GIT_TRACKED_NAMES = {"HEAD", "packed-refs"}
+
+
+def _load_libc():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        name = ctypes.util.find_library("c") or "libc.so.6"
+        libc = ctypes.CDLL(name, use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [
+            ctypes.c_int,
+            ctypes.c_char_p,
+            ctypes.c_uint32,
+        ]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+def _read_ignore_lines(directory: Path, names: Set[str]) -> list:
+    lines = []
+    for ignore_name in IGNORE_FILES:
+        if ignore_name in names:
+            try:
+                text = (directory / ignore_name).read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                continue
+            lines.extend(text.splitlines())
+    return lines
+
+
+class WatchLimitReached(Exception):
+    """Raised internally when the kernel refuses more inotify watches."""
+
+    pass
+
+
+class ChangeTracker:
+    """Watch a working tree and report which paths changed between checks.
+
+    Usage::
+
+        with ChangeTracker(root) as tracker:
+            tracker.reset()
+            ...  # run an iteration
+            changed = tracker.collect()  # set of paths, or None if unknown
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self._libc = None
+        self._fd = -1
+        self._dirs: Dict[int, Path] = {}
+        # Ignore rules in effect for the entries of each watched directory.
+        self._rules: Dict[Path, IgnoreRules] = {}
+        self._changed: Set[str] = set()
+        self._overflowed = False
+        # An ignore file changed: the watched set is rebuilt after collect.
+        self._rules_stale = False
+
+    @property
+    def active(self) -> bool:
+        """Whether the tracker is running and can answer change queries."""
+        return self._fd >= 0
+
+    def start(self) -> bool:
+        """Install watches on the tree. Returns False if inotify is unusable."""
+        libc = _load_libc()
+        if libc is None:
+            return False
+
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            return False
+
+        self._libc = libc
+        self._fd = fd
+        try:
+            self._watch_tree(self.root, IgnoreRules.defaults())
+        except WatchLimitReached:
+            self.close()
+            return False
+        self._changed.clear()
+        self._rules_stale = False
+        return True
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+        self._fd = -1
+        self._dirs.clear()
+        self._rules.clear()
+        self._changed.clear()
+
+    def __enter__(self) -> "ChangeTracker":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def reset(self) -> None:
+        """Discard everything observed so far (call before an iteration)."""
+        if not self.active:
+            return
+        self._drain()
+        self._changed.clear()
+        self._overflowed = False
+
+    def collect(self) -> Optional[Set[str]]:
+        """Return paths changed since the last reset, relative to the root.
+
+        Returns None when the answer cannot be trusted: the tracker is not
+        running, the kernel event queue overflowed, or watches ran out while
+        following new directories (in which case the tracker shuts down and
+        callers should switch to hashing for the rest of the run).
+        """
+        if not self.active:
+            return None
+        self._drain()
+        if not self.active or self._overflowed:
+            return None
+        changed = set(self._changed)
+        self._changed.clear()
+        if self._rules_stale:
+            # Rare (an ignore file was edited): re-watch from scratch so
+            # newly ignored or unignored directories are handled. If that
+            # fails the tracker stays closed and the next collect says so.
+            self.close()
+            self.start()
+        return changed
+
+    def _add_watch(self, path: Path) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err == errno.ENOSPC:
+                raise WatchLimitReached(str(path))
+            # Vanished or unreadable directories are simply not watched.
+            return
+        self._dirs[wd] = path
+
+    def _rel(self, path: Path) -> Optional[str]:
+        try:
+            return path.relative_to(self.root).as_posix()
+        except ValueError:
+            return None
+
+    def _watch_tree(self, top: Path, rules: IgnoreRules, record: bool = False) -> None:
+        """Watch ``top`` and its non-ignored subdirectories.
+
+        ``rules`` are the rules in effect in ``top``'s parent (for the root,
+        the defaults); each directory adds its own ignore files.
+        """
+        stack = [(top, rules)]
+        while stack:
+            directory, parent_rules = stack.pop()
+            self._add_watch(directory)
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            rel = self._rel(directory)
+            rel = "" if rel in (None, ".") else rel
+            names = {entry.name for entry in entries}
+            dir_rules = parent_rules.extend(
+                parse_lines(_read_ignore_lines(directory, names), rel)
+            )
+            self._rules[directory] = dir_rules
+            for entry in entries:
+                path = Path(entry.path)
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if is_dir and entry.name == ".git":
+                    self._watch_git_dir(path)
+                    continue
+                entry_rel = f"{rel}/{entry.name}" if rel else entry.name
+                if entry.name in EXCLUDED_DIRS or dir_rules.is_ignored(
+                    entry_rel, is_dir
+                ):
+                    continue
+                if is_dir:
+                    stack.append((path, dir_rules))
+                elif record:
+                    self._record(path)
+
+    def _watch_git_dir(self, git_dir: Path) -> None:
+        self._add_watch(git_dir)
+        refs = git_dir / "refs"
+        if refs.is_dir():
+            for directory, _, _ in os.walk(refs):
+                self._add_watch(Path(directory))
+
+    def _follow_new_dir(self, path: Path) -> None:
+        rel_parts = path.relative_to(self.root).parts
+        if ".git" in rel_parts:
+            # New ref namespaces (refs/heads/feature/...) need watching too.
+            if "refs" in rel_parts:
+                for directory, _, _ in os.walk(path):
+                    self._add_watch(Path(directory))
+            return
+        parent_rules = self._rules.get(path.parent)
+        rel = self._rel(path)
+        if parent_rules is None or rel is None:
+            return
+        if path.name in EXCLUDED_DIRS or parent_rules.is_ignored(rel, True):
+            return
+        self._record(path)
+        self._watch_tree(path, parent_rules, record=True)
+
+    def _record(self, path: Path, is_dir: Optional[bool] = None) -> None:
+        try:
+            rel = path.relative_to(self.root)
+        except ValueError:
+            return
+        parts = rel.parts
+        if parts and parts[0] in EXCLUDED_DIRS:
+            return
+        if ".git" in parts:
+            idx = parts.index(".git")
+            inner = parts[idx + 1 :]
+            if not inner or inner[0] not in GIT_TRACKED_NAMES | {"refs"}:
+                return
+        elif parts:
+            rules = self._rules.get(path.parent)
+            if rules is None:
+                # Not a watched directory, so its parent is ignored.
+                return
+            if is_dir is None:
+                is_dir = path in self._rules or path.is_dir()
+            if rules.is_ignored(rel.as_posix(), is_dir):
+                return
+            if path.name in IGNORE_FILES:
+                self._rules_stale = True
+        self._changed.add(rel.as_posix())
+
+    def _drain(self) -> None:
+        while self.active:
+            try:
+                data = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                return
+            except OSError:
+                return
+            if not data:
+                return
+            try:
+                self._process(data)
+            except WatchLimitReached:
+                self.close()
+                return
+
+    def _process(self, data: bytes) -> None:
+        offset = 0
+        size = len(data)
+        while offset + _EVENT_HEADER.size <= size:
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                self._overflowed = True
+                continue
+
+            directory = self._dirs.get(wd)
+            if directory is None:
+                continue
+
+            if mask & IN_IGNORED:
+                self._rules.pop(self._dirs.pop(wd), None)
+                continue
+
+            if not name:
+                # Event on the watched directory itself (deleted or moved).
+                self._record(directory)
+                continue
+
+            path = directory / os.fsdecode(name)
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                self._follow_new_dir(path)
+                continue
+
+            # The event says whether it was a directory, even once deleted.
+            self._record(path, bool(mask & IN_ISDIR))
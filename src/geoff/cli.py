@@ -0,0 +1,170 @@
+"""Headless command line interface.
+
+``geoff`` with no arguments launches the TUI; any subcommand runs without
+importing Textual so it stays fast enough for cron and CI. Modules that
+only some commands need are imported inside those commands.
+"""
+
+import argparse
+import sys
+from dataclasses import replace
+from pathlib import Path
+from typing import List, Optional
+
+from geoff.config import PromptConfig
+from geoff.config_manager import ConfigManager
+from geoff.prompt_builder import build_prompt
+from geoff.validator import PromptValidator
+
+
+def _load_config(args: argparse.Namespace) -> PromptConfig:
+    config = ConfigManager().resolve_config()
+    overrides = {
+        name: getattr(args, name)
+        for name in ("model", "max_iterations", "max_stuck", "max_frozen")
+        if getattr(args, name, None) is not None
+    }
+    if getattr(args, "workers", None) is not None:
+        overrides["parallel_workers"] = args.workers
+    return replace(config, **overrides) if overrides else config
+
+
+def _check_config(config: PromptConfig, create: bool = False) -> bool:
+    """Print the config's errors; ``create`` makes a missing breadcrumbs file.
+
+    Only commands that go on to run an agent pass ``create``: checking a
+    config never writes to the repository.
+    """
+    errors = PromptValidator().validate(config, create=create)
+    for error in errors:
+        print(f"Error: {error}", file=sys.stderr)
+    return not errors
+
+
+def cmd_prompt(args: argparse.Namespace) -> int:
+    config = _load_config(args)
+    if not _check_config(config):
+        return 1
+    print(build_prompt(config))
+    return 0
+
+
+def cmd_validate(args: argparse.Namespace) -> int:
+    if not _check_config(_load_config(args)):
+        return 1
+    print("Configuration is valid")
+    return 0
+
+
+def cmd_run(args: argparse.Namespace) -> int:
+    from geoff.main import dispatch
+
+    config = _load_config(args)
+    if not _check_config(config, create=True):
+        return 1
+    return dispatch(
+        "run_once" if args.once else "run_loop", build_prompt(config), config
+    )
+
+
+def cmd_resume(args: argparse.Namespace) -> int:
+    from geoff.executor import resume_opencode_loop
+    from geoff.pacing import pacing_from_config
+
+    config = ConfigManager().resolve_config()
+    summary = resume_opencode_loop(pacing=pacing_from_config(config))
+    return 0 if summary.stop_reason != "error" else 1
+
+
+def cmd_batch(args: argparse.Namespace) -> int:
+    from geoff.batch import BatchError, execute_batch, load_prompt_queue
+
+    config = _load_config(args)
+    concurrency = args.concurrency or config.batch_concurrency
+    if concurrency < 1:
+        print("Error: concurrency must be >= 1", file=sys.stderr)
+        return 1
+
+    try:
+        jobs = load_prompt_queue(args.source)
+    except (BatchError, OSError, UnicodeDecodeError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    # Jobs run in one-off mode, so the task source settings do not apply.
+    if not _check_config(
+        replace(config, task_mode="oneoff", oneoff_prompt=jobs[0].prompt),
+        create=True,
+    ):
+        return 1
+
+    results = execute_batch(
+        jobs, config, concurrency=concurrency, target_root=args.target_dir
+    )
+    return 0 if all(r.status == "ok" for r in results) else 1
+
+
+def _add_model_option(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("-m", "--model", help="override the configured model")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="geoff",
+        description="Build agent prompts and run them through Opencode. "
+        "Run without a command to open the TUI.",
+    )
+    commands = parser.add_subparsers(dest="command", metavar="command")
+
+    run = commands.add_parser("run", help="run the configured prompt")
+    mode = run.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--once", action="store_true", help="run a single time")
+    mode.add_argument("--loop", action="store_true", help="run until stopped")
+    _add_model_option(run)
+    run.add_argument("--max-iterations", type=int, help="loop iteration limit")
+    run.add_argument("--max-stuck", type=int, help="iterations without changes")
+    run.add_argument("--max-frozen", type=int, help="minutes without output")
+    run.add_argument(
+        "--workers",
+        type=int,
+        help="parallel loops, each in its own git worktree on a geoff/worker-N "
+        "branch. Every worker gets the same prompt and picks its tasks "
+        "independently; nothing merges the worker branches",
+    )
+    run.set_defaults(func=cmd_run)
+
+    prompt = commands.add_parser("prompt", help="print the built prompt")
+    prompt.set_defaults(func=cmd_prompt)
+
+    validate = commands.add_parser("validate", help="check the configuration")
+    validate.set_defaults(func=cmd_validate)
+
+    resume = commands.add_parser("resume", help="resume an interrupted loop")
+    resume.set_defaults(func=cmd_resume)
+
+    batch = commands.add_parser("batch", help="run a queue of one-off prompts")
+    batch.add_argument("source", type=Path, help="prompt file or directory")
+    batch.add_argument(
+        "-j",
+        "--concurrency",
+        type=int,
+        help="maximum concurrent agents (default: batch_concurrency from config)",
+    )
+    batch.add_argument(
+        "--target-dir",
+        type=Path,
+        help="run each prompt in TARGET_DIR/<name> instead of a git worktree",
+    )
+    _add_model_option(batch)
+    batch.set_defaults(func=cmd_batch)
+
+    return parser
+
+
+def run_cli(argv: Optional[List[str]] = None) -> int:
+    """Run a subcommand and return its exit status."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command is None:
+        parser.print_help()
+        return 2
+    return args.func(args)
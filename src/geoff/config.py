@@ -16,6 +16,18 @@ class PromptConfig:
     max_iterations: int = 0
     max_stuck: int = 2
     max_frozen: int = 0
+    parallel_workers: int = 1
+    batch_concurrency: int = 2
+    change_detection: Literal["hash", "inotify"] = "hash"
+    log_enabled: bool = True
+    log_retain_runs: int = 20
+    log_max_run_mb: int = 0
+    telemetry_enabled: bool = True
+    pacing: Literal["adaptive", "fixed"] = "adaptive"
+    pacing_base_delay: float = 2.0
+    pacing_max_delay: float = 300.0
+    pacing_jitter: float = 0.5
+    config_save_debounce: float = 0.5
     prompt_tasklist_study: str = "follow {tasklist} and choose the most important item to address. Complete that item and no other."
     prompt_tasklist_update: str = "Update {tasklist} when the task is done. If you discover issues, immediately update {tasklist} with your findings. When resolved, update {tasklist} and remove the item."
     prompt_backpressure_header: str = "IMPORTANT:"
@@ -1,6 +1,40 @@
+import itertools
+import os
+import stat
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any, Optional
-import yaml
+from typing import Dict, Any, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, writes stay atomic
+    fcntl = None
+
+# Makes temporary names unique across threads of one process.
+_tmp_counter = itertools.count()
+
+# (yaml module, loader, dumper), resolved on first use.
+_yaml_codec = None
+
+
+def yaml_codec():
+    """Return PyYAML with its fastest safe loader and dumper.
+
+    The libyaml bindings (``CSafeLoader``/``CSafeDumper``) parse and emit
+    several times faster than the pure-Python classes and accept and
+    produce the same YAML for config data; PyYAML builds without libyaml
+    fall back to ``SafeLoader``/``SafeDumper``.
+    """
+    global _yaml_codec
+    if _yaml_codec is None:
+        import yaml  # deferred: costs ~15ms and is unused until a config exists
+
+        _yaml_codec = (
+            yaml,
+            getattr(yaml, "CSafeLoader", yaml.SafeLoader),
+            getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+        )
+    return _yaml_codec
 
 
 def load_yaml(path: Path) -> Optional[Dict[str, Any]]:
@@ -8,22 +42,151 @@ def load_yaml(path: Path) -> Optional[Dict[str, Any]]:
     if not path.exists():
         return None
 
+    yaml, loader, _ = yaml_codec()
     try:
         with open(path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+            return yaml.load(f, Loader=loader) or {}
     except Exception:
         # We might want to log this in a real app, but for now safe fail
         return None
 
 
-def save_yaml(path: Path, data: Dict[str, Any]) -> None:
-    """Write dictionary to YAML file."""
-    # Ensure directory exists
-    if path.parent:
-        path.parent.mkdir(parents=True, exist_ok=True)
+def fsync_dir(path: Path) -> None:
+    """Persist renames in directory ``path``; a no-op where unsupported."""
+    try:
+        dir_fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+def atomic_write(
+    path: Path, data: bytes, sync: bool = True, sync_dir: bool = False
+) -> None:
+    """Replace ``path`` with ``data`` so readers never see a partial file.
+
+    The bytes go to a temporary file in the same directory, which is then
+    renamed over ``path``. A symlinked ``path`` is resolved first, so the
+    link's target is replaced and the link itself stays in place.
+
+    Args:
+        path: File to replace (parent directories are created)
+        data: New contents
+        sync: fsync the file before the rename, so a crash leaves either the
+            old or the new contents on disk. Without it the swap is still
+            atomic for readers, but the new contents may not survive a crash
+            until ``sync_path`` is called.
+        sync_dir: Also fsync the directory so the rename itself is durable
+    """
+    path = Path(os.path.realpath(path))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{next(_tmp_counter)}.tmp")
+
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+            if sync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        try:
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(path).st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    if sync_dir:
+        fsync_dir(path.parent)
+
 
-    with open(path, "w", encoding="utf-8") as f:
-        yaml.safe_dump(data, f, default_flow_style=False)
+def sync_path(path: Path, sync_dir: bool = True) -> None:
+    """Make earlier unsynced writes to ``path`` durable (a checkpoint)."""
+    path = Path(os.path.realpath(path))
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except FileNotFoundError:
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    if sync_dir:
+        fsync_dir(path.parent)
+
+
+def save_yaml(
+    path: Path, data: Dict[str, Any], sync: bool = True, sync_dir: bool = False
+) -> None:
+    """Atomically write dictionary to YAML file.
+
+    Holds ``file_lock(path)`` while writing, so geoff processes sharing the
+    file take turns. Pass ``sync=False`` for high-frequency saves and call
+    ``sync_path`` at the points that must survive a crash; see
+    ``atomic_write``.
+    """
+    content = dump_yaml(data)
+    with file_lock(path):
+        atomic_write(path, content, sync=sync, sync_dir=sync_dir)
+
+
+def lock_path_for(path: Path) -> Path:
+    """Sidecar lock file for ``path``.
+
+    The data file itself cannot carry the lock: atomic writes replace its
+    inode, so a lock taken on the old inode would guard nothing. It sits
+    next to the symlink-resolved file, so every path to one file shares it.
+    """
+    path = Path(os.path.realpath(path))
+    return path.with_name(f"{path.name}.lock")
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock on ``path`` for a read-modify-write."""
+    if fcntl is None:
+        yield
+        return
+    lock_path = lock_path_for(path)
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o666)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)
+
+
+def dump_yaml(data: Dict[str, Any]) -> bytes:
+    """Serialise ``data`` exactly as save_yaml writes it."""
+    yaml, _, dumper = yaml_codec()
+    return yaml.dump(data, Dumper=dumper, default_flow_style=False).encode("utf-8")
+
+
+def write_yaml_if_changed(path: Path, data: Dict[str, Any], sync: bool = True) -> bool:
+    """Atomically write ``data`` unless ``path`` already holds those bytes.
+
+    Does not lock: callers doing a read-modify-write hold ``file_lock``
+    around the whole sequence. Returns whether the file was written.
+    """
+    new = dump_yaml(data)
+    try:
+        if Path(path).read_bytes() == new:
+            return False
+    except FileNotFoundError:
+        pass
+    atomic_write(path, new, sync=sync)
+    return True
 
 
 def ensure_config_dir(path: Path) -> None:
@@ -1,9 +1,23 @@
+import copy
+import hashlib
+import json
+import os
 from pathlib import Path
 from dataclasses import asdict, fields
-from typing import Any, Dict, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
+from geoff import __version__
 from geoff.config import PromptConfig
-from geoff.config_io import load_yaml, save_yaml
+from geoff.config_io import (
+    atomic_write,
+    file_lock,
+    load_yaml,
+    save_yaml,
+    sync_path,
+    write_yaml_if_changed,
+)
+from geoff.state_dir import STATE_DIR, ensure_state_dir
+from geoff.templates import template_errors
 
 
 BASE_PROMPT_STRING_KEYS: Set[str] = {
@@ -15,21 +29,70 @@ BASE_PROMPT_STRING_KEYS: Set[str] = {
 }
 
 
+# Identifies one version of a config file: (path, st_mtime_ns, st_size,
+# st_ino), or just (path,) while the file does not exist. Atomic saves
+# always produce a new inode, so a rewrite is seen even within one mtime
+# tick.
+StatKey = Tuple[Any, ...]
+
+
+def stat_key(path: Path) -> StatKey:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return (str(path),)
+    return (str(path), st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+_defaults_digest_value: Optional[str] = None
+
+
+def _defaults_digest() -> str:
+    """Digest of the builtin defaults, which a snapshot was merged over."""
+    global _defaults_digest_value
+    if _defaults_digest_value is None:
+        data = json.dumps(asdict(PromptConfig()), sort_keys=True).encode("utf-8")
+        _defaults_digest_value = hashlib.sha256(data).hexdigest()[:16]
+    return _defaults_digest_value
+
+
 class ConfigManager:
     def __init__(self, working_dir: Path | None = None):
         self.working_dir = working_dir or Path.cwd()
         self.global_config_path = Path.home() / ".geoff" / "geoff.yaml"
         self.repo_config_path = self.working_dir / ".geoff" / "geoff.yaml"
+        # Fully resolved config from an earlier process; see _load_snapshot.
+        self.snapshot_path = self.working_dir / ".geoff" / "cache" / "config.json"
+        self.template_errors: List[str] = []
+        # Parsed layer per path, and the last merged config per pair of
+        # layer keys; resolve_config costs two stat calls while neither
+        # file changes.
+        self._layers: Dict[Path, Tuple[StatKey, Dict[str, Any]]] = {}
+        self._resolved: Optional[Tuple[Tuple[StatKey, StatKey], PromptConfig]] = None
 
     @staticmethod
     def get_builtin_defaults() -> PromptConfig:
         return PromptConfig()
 
     def load_global_config(self) -> Dict[str, Any]:
-        return load_yaml(self.global_config_path) or {}
+        return dict(self._load_layer(self.global_config_path)[1])
 
     def load_repo_config(self) -> Dict[str, Any]:
-        return load_yaml(self.repo_config_path) or {}
+        return dict(self._load_layer(self.repo_config_path)[1])
+
+    def _load_layer(self, path: Path) -> Tuple[StatKey, Dict[str, Any]]:
+        """Parse ``path`` unless its stat key matches the cached parse."""
+        key = stat_key(path)
+        cached = self._layers.get(path)
+        if cached is not None and cached[0] == key:
+            return cached
+        # Stat before reading: if the file changes in between, the next
+        # call sees a newer key and reads it again.
+        data: Dict[str, Any] = {}
+        if len(key) > 1:
+            data = load_yaml(path) or {}
+        self._layers[path] = (key, data)
+        return key, data
 
     def _resolve_base_prompt_strings(
         self,
@@ -49,34 +112,96 @@ class ConfigManager:
 
     def _materialize_base_prompt_strings(
         self, user_conf: Dict[str, Any], repo_conf: Dict[str, Any]
-    ) -> None:
-        defaults_dict = asdict(self.get_builtin_defaults())
-
-        resolved_base = self._resolve_base_prompt_strings(
-            user_conf, repo_conf, defaults_dict
-        )
-
-        to_materialize: Dict[str, Any] = {}
-        for key in BASE_PROMPT_STRING_KEYS:
-            if key not in user_conf:
-                to_materialize[key] = resolved_base[key]
-
-        if not to_materialize:
-            return
+    ) -> Optional[Dict[str, Any]]:
+        """Write resolved base prompt strings missing from the global config.
+
+        Once every key is present nothing is locked or written, so a steady
+        state startup makes no writes. Otherwise the global file is re-read
+        under its lock, since another geoff may have filled it in meanwhile,
+        and rewritten only if its bytes change.
+
+        Returns the data written, or None if nothing was written.
+        """
+        if BASE_PROMPT_STRING_KEYS <= user_conf.keys():
+            return None
+
+        path = self.global_config_path
+        with file_lock(path):
+            current = load_yaml(path)
+            if current is None and path.exists():
+                # Unparseable; never overwrite the user's file.
+                return None
+            current = current or {}
+
+            resolved_base = self._resolve_base_prompt_strings(
+                current, repo_conf, asdict(self.get_builtin_defaults())
+            )
+            merged = current.copy()
+            for key in BASE_PROMPT_STRING_KEYS:
+                if key not in current:
+                    merged[key] = resolved_base[key]
+
+            if not write_yaml_if_changed(path, merged):
+                return None
+        return merged
+
+    def _snapshot_header(self, keys: Tuple[StatKey, StatKey]) -> Dict[str, Any]:
+        return {
+            "geoff": __version__,
+            "fields": [f.name for f in fields(PromptConfig)],
+            "defaults": _defaults_digest(),
+            "layers": [list(key) for key in keys],
+        }
 
-        if not user_conf:
-            merged = to_materialize
-            save_yaml(self.global_config_path, merged)
+    def _load_snapshot(self, keys: Tuple[StatKey, StatKey]) -> Optional[PromptConfig]:
+        """Return the snapshot's config if it was resolved from these layers.
+
+        A warm start thus reads one small JSON file and never imports or
+        runs the YAML parser.
+        """
+        try:
+            data = json.loads(self.snapshot_path.read_bytes())
+            header = self._snapshot_header(keys)
+            if any(data.get(name) != value for name, value in header.items()):
+                return None
+            return PromptConfig(**data["config"])
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            return None
+
+    def _save_snapshot(
+        self, keys: Tuple[StatKey, StatKey], config: PromptConfig
+    ) -> None:
+        # Resolving a config must not create .geoff in an unrelated directory.
+        if not (self.working_dir / STATE_DIR).is_dir():
             return
-
-        merged = user_conf.copy()
-        merged.update(to_materialize)
-        save_yaml(self.global_config_path, merged)
+        try:
+            data = json.dumps(
+                {**self._snapshot_header(keys), "config": asdict(config)},
+                separators=(",", ":"),
+            ).encode("utf-8")
+            if self.snapshot_path.exists() and self.snapshot_path.read_bytes() == data:
+                return
+            # Only a cache: no fsync, and failures just mean a cold start.
+            ensure_state_dir(self.working_dir)
+            atomic_write(self.snapshot_path, data, sync=False)
+        except (OSError, TypeError, ValueError):
+            pass
 
     def resolve_config(self) -> PromptConfig:
+        keys = (stat_key(self.global_config_path), stat_key(self.repo_config_path))
+        if self._resolved is None or self._resolved[0] != keys:
+            snapshot = self._load_snapshot(keys)
+            if snapshot is not None:
+                self.template_errors = template_errors(snapshot)
+                self._resolved = (keys, snapshot)
+        if self._resolved is not None and self._resolved[0] == keys:
+            # Callers edit the config (and its lists) in place.
+            return copy.deepcopy(self._resolved[1])
+
+        global_key, global_conf = self._load_layer(self.global_config_path)
+        repo_key, repo_conf = self._load_layer(self.repo_config_path)
+
         defaults = asdict(self.get_builtin_defaults())
-        global_conf = self.load_global_config()
-        repo_conf = self.load_repo_config()
 
         non_base_keys = {
             k: v for k, v in defaults.items() if k not in BASE_PROMPT_STRING_KEYS
@@ -96,13 +221,29 @@ class ConfigManager:
         filtered = {k: v for k, v in final_config.items() if k in valid_keys}
 
         resolved = PromptConfig(**filtered)
-
-        self._materialize_base_prompt_strings(global_conf, repo_conf)
-
+        # Compile the templates now so every render is a cache hit; any
+        # errors are kept for callers and reported again by the validator.
+        self.template_errors = template_errors(resolved)
+
+        written = self._materialize_base_prompt_strings(global_conf, repo_conf)
+        if written is not None:
+            # Our own write must not count as a change on the next call.
+            global_key = stat_key(self.global_config_path)
+            self._layers[self.global_config_path] = (global_key, written)
+
+        self._resolved = ((global_key, repo_key), copy.deepcopy(resolved))
+        self._save_snapshot((global_key, repo_key), resolved)
         return resolved
 
-    def save_repo_config(self, config: PromptConfig) -> None:
+    def save_repo_config(self, config: PromptConfig, sync: bool = True) -> None:
+        """Write the repo config; ``sync=False`` defers durability to
+        ``sync_repo_config`` (used for autosaves)."""
         data = asdict(config)
         for key in BASE_PROMPT_STRING_KEYS:
             data.pop(key, None)
-        save_yaml(self.repo_config_path, data)
+        ensure_state_dir(self.working_dir)
+        save_yaml(self.repo_config_path, data, sync=sync)
+
+    def sync_repo_config(self) -> None:
+        """Make unsynced repo config saves durable."""
+        sync_path(self.repo_config_path)
@@ -0,0 +1,203 @@
+"""Debounced write-behind saving of the repo config.
+
+The TUI posts ``ConfigUpdated`` on every keystroke. Instead of rewriting
+``.geoff/geoff.yaml`` on the UI thread each time, ``ConfigSaver`` keeps
+only the newest snapshot and writes it from a background thread once edits
+have been quiet for the debounce window (or at the latest after
+``max_delay``, so continuous typing still reaches disk). ``flush`` writes
+any pending snapshot synchronously, for exit and before a run, and is the
+durability checkpoint: background writes may skip fsync, and ``flush``
+then runs the ``checkpoint`` callback once to make them durable.
+"""
+
+import copy
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from geoff.config import PromptConfig
+
+logger = logging.getLogger(__name__)
+
+# Saves slower than this are logged as warnings (NFS homes, busy disks).
+SLOW_SAVE_SECONDS = 0.25
+
+
+@dataclass
+class SaveStats:
+    """Latency of the writes a ConfigSaver has made."""
+
+    saves: int = 0
+    last_seconds: float = 0.0
+    max_seconds: float = 0.0
+    total_seconds: float = 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.saves if self.saves else 0.0
+
+    def add(self, seconds: float) -> None:
+        self.saves += 1
+        self.last_seconds = seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.total_seconds += seconds
+
+
+class ConfigSaver:
+    """Coalesces config saves and performs them off the calling thread.
+
+    Args:
+        save: Writes one config snapshot (e.g. ConfigManager.save_repo_config)
+        debounce: Seconds without a new update before a pending save runs
+        max_delay: Upper bound on how long a pending save can be deferred
+            while updates keep arriving; defaults to ten debounce windows
+        on_error: Called with the exception when a background save fails;
+            never called while a write is in progress
+        checkpoint: Makes earlier writes durable (e.g.
+            ConfigManager.sync_repo_config); run by ``flush`` after any
+            background write
+    """
+
+    def __init__(
+        self,
+        save: Callable[[PromptConfig], None],
+        debounce: float = 0.5,
+        max_delay: Optional[float] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        checkpoint: Optional[Callable[[], None]] = None,
+    ):
+        self._save = save
+        self.debounce = debounce
+        self.max_delay = max_delay if max_delay is not None else debounce * 10
+        self.on_error = on_error
+        self.checkpoint = checkpoint
+        self.stats = SaveStats()
+
+        self._cond = threading.Condition()
+        self._pending: Optional[PromptConfig] = None
+        self._pending_seq = 0
+        self._first_pending_at = 0.0
+        self._deadline = 0.0
+        self._closed = False
+        # Serialises writes; a snapshot older than the last one written is
+        # dropped, so a slow background save can never undo a flush.
+        self._write_lock = threading.Lock()
+        self._seq = 0
+        self._written_seq = 0
+        self._needs_checkpoint = False
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def pending(self) -> bool:
+        with self._cond:
+            return self._pending is not None
+
+    def schedule(self, config: PromptConfig) -> None:
+        """Queue a snapshot of ``config`` to be written after the debounce."""
+        snapshot = copy.deepcopy(config)
+        now = time.monotonic()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("ConfigSaver is closed")
+            if self._pending is None:
+                self._first_pending_at = now
+            self._seq += 1
+            self._pending = snapshot
+            self._pending_seq = self._seq
+            self._deadline = min(
+                now + self.debounce, self._first_pending_at + self.max_delay
+            )
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="geoff-config-saver", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+
+    def flush(self) -> None:
+        """Write any pending snapshot now, on the calling thread.
+
+        Raises whatever the save function raises.
+        """
+        taken = self._take()
+        if taken is not None:
+            self._write(*taken, checkpoint=True)
+        else:
+            # Waits for a background write that is already in progress.
+            with self._write_lock:
+                self._checkpoint()
+
+    def discard(self) -> None:
+        """Drop any pending snapshot and wait for an in-flight write."""
+        self._take()
+        with self._write_lock:
+            pass
+
+    def close(self) -> None:
+        """Flush and stop the background thread."""
+        try:
+            self.flush()
+        finally:
+            with self._cond:
+                self._closed = True
+                self._cond.notify()
+            if self._thread is not None:
+                self._thread.join()
+
+    def _take(self):
+        with self._cond:
+            if self._pending is None:
+                return None
+            taken = (self._pending, self._pending_seq)
+            self._pending = None
+            return taken
+
+    def _checkpoint(self) -> None:
+        # Caller holds the write lock.
+        if self._needs_checkpoint and self.checkpoint is not None:
+            self.checkpoint()
+        self._needs_checkpoint = False
+
+    def _write(self, config: PromptConfig, seq: int, checkpoint: bool = False) -> None:
+        with self._write_lock:
+            if seq <= self._written_seq:
+                if checkpoint:
+                    self._checkpoint()
+                return
+            started = time.monotonic()
+            self._save(config)
+            self._needs_checkpoint = True
+            if checkpoint:
+                self._checkpoint()
+            seconds = time.monotonic() - started
+            self._written_seq = seq
+            self.stats.add(seconds)
+        if seconds >= SLOW_SAVE_SECONDS:
+            logger.warning(f"Saving config took {seconds * 1000:.0f}ms")
+        else:
+            logger.debug(f"Saved config in {seconds * 1000:.1f}ms")
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._closed:
+                    if self._pending is not None:
+                        remaining = self._deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._cond.wait(remaining)
+                    else:
+                        self._cond.wait()
+                if self._closed:
+                    return
+                taken = (self._pending, self._pending_seq)
+                self._pending = None
+
+            try:
+                self._write(*taken)
+            except Exception as e:
+                logger.error(f"Failed to save config: {e}")
+                if self.on_error is not None:
+                    self.on_error(e)
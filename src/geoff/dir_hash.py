@@ -0,0 +1,240 @@
+"""Change-detection hashing for directories that are not git repositories.
+
+Traversal uses ``os.scandir`` so each file costs a single ``stat``, skips
+anything matched by ``.gitignore``/``.geoffignore`` (plus a few built-in
+defaults), and fans directories out over a thread pool. A per-directory
+listing cache in ``.geoff/cache`` lets unchanged directories skip listing
+and ignore matching on the next call; file stats are always taken because
+in-place edits do not touch the parent directory's mtime.
+
+Symlinks are never followed. As in git, a link contributes its target
+string, so a link into ``$HOME`` or a link cycle costs one entry.
+"""
+
+import hashlib
+import json
+import os
+import stat
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from geoff.ignore import IGNORE_FILES, IgnoreRules, parse_lines
+
+CACHE_VERSION = 2
+
+
+def default_cache_path(root: Path) -> Path:
+    return root / ".geoff" / "cache" / "tree-hash.json"
+
+
+@dataclass
+class _DirScan:
+    rel: str
+    mtime_ns: int
+    files: List[str] = field(default_factory=list)
+    dirs: List[str] = field(default_factory=list)
+    ignore_lines: List[str] = field(default_factory=list)
+    ignore_sigs: Dict[str, List[int]] = field(default_factory=dict)
+    fingerprint: str = ""
+    hash_lines: List[str] = field(default_factory=list)
+    from_cache: bool = False
+
+
+def _join(rel: str, name: str) -> str:
+    return f"{rel}/{name}" if rel else name
+
+
+def _file_line(rel: str, path: str, st: os.stat_result) -> str:
+    if stat.S_ISLNK(st.st_mode):
+        return f"{rel}:link:{os.readlink(path)}"
+    return f"{rel}:{st.st_mtime_ns}:{st.st_size}"
+
+
+def _read_ignore_files(
+    directory: str, names: Set[str]
+) -> Tuple[List[str], Dict[str, List[int]]]:
+    lines: List[str] = []
+    sigs: Dict[str, List[int]] = {}
+    for ignore_name in IGNORE_FILES:
+        if ignore_name in names:
+            path = os.path.join(directory, ignore_name)
+            try:
+                st = os.stat(path)
+                with open(path, "r", encoding="utf-8") as f:
+                    text = f.read()
+            except (OSError, UnicodeDecodeError):
+                continue
+            sigs[ignore_name] = [st.st_mtime_ns, st.st_size]
+            lines.extend(text.splitlines())
+    return lines, sigs
+
+
+def _scan_directory(
+    root: Path, rel: str, rules: IgnoreRules, cached: Optional[Dict[str, Any]]
+) -> Tuple[_DirScan, IgnoreRules]:
+    directory = os.path.join(root, rel) if rel else str(root)
+    mtime_ns = os.stat(directory).st_mtime_ns
+
+    if (
+        cached is not None
+        and cached.get("mtime_ns") == mtime_ns
+        and cached.get("fingerprint") == rules.fingerprint
+    ):
+        scan = _DirScan(
+            rel=rel,
+            mtime_ns=mtime_ns,
+            files=cached["files"],
+            dirs=cached["dirs"],
+            ignore_lines=cached["ignore_lines"],
+            ignore_sigs=cached["ignore_sigs"],
+            fingerprint=rules.fingerprint,
+            from_cache=True,
+        )
+        prefix = f"{rel}/" if rel else ""
+        for name in scan.files:
+            path = os.path.join(directory, name)
+            try:
+                scan.hash_lines.append(
+                    _file_line(f"{prefix}{name}", path, os.lstat(path))
+                )
+            except OSError:
+                continue
+        # An ignore file edited in place leaves the directory mtime alone.
+        current_sigs = {}
+        for name in scan.ignore_sigs:
+            try:
+                st = os.stat(os.path.join(directory, name))
+            except OSError:
+                continue
+            current_sigs[name] = [st.st_mtime_ns, st.st_size]
+        if current_sigs == scan.ignore_sigs:
+            return scan, rules.extend(parse_lines(scan.ignore_lines, rel))
+
+    with os.scandir(directory) as it:
+        entries = list(it)
+    names = {entry.name for entry in entries}
+    ignore_lines, ignore_sigs = _read_ignore_files(directory, names)
+    child_rules = rules.extend(parse_lines(ignore_lines, rel))
+
+    scan = _DirScan(
+        rel=rel,
+        mtime_ns=mtime_ns,
+        ignore_lines=ignore_lines,
+        ignore_sigs=ignore_sigs,
+        fingerprint=rules.fingerprint,
+    )
+    for entry in sorted(entries, key=lambda e: e.name):
+        entry_rel = _join(rel, entry.name)
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)
+        except OSError:
+            continue
+        if child_rules.is_ignored(entry_rel, is_dir):
+            continue
+        if is_dir:
+            scan.dirs.append(entry.name)
+            continue
+        try:
+            line = _file_line(
+                entry_rel, entry.path, entry.stat(follow_symlinks=False)
+            )
+        except OSError:
+            continue
+        scan.files.append(entry.name)
+        scan.hash_lines.append(line)
+    return scan, child_rules
+
+
+def _load_cache(cache_path: Optional[Path]) -> Dict[str, Any]:
+    if cache_path is None:
+        return {}
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+        return {}
+    return data.get("dirs", {})
+
+
+def _save_cache(cache_path: Path, dirs: Dict[str, Any]) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": CACHE_VERSION, "dirs": dirs}, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def hash_directory(
+    root: Path,
+    cache_path: Optional[Path] = None,
+    max_workers: Optional[int] = None,
+    use_cache: bool = True,
+) -> str:
+    """Hash file paths, mtimes and sizes under ``root`` for change detection.
+
+    Args:
+        root: Directory to hash
+        cache_path: Listing cache location (defaults to .geoff/cache in root)
+        max_workers: Thread pool size for directory traversal
+        use_cache: Set False to neither read nor write the listing cache
+    """
+    root = Path(root)
+    if use_cache and cache_path is None:
+        cache_path = default_cache_path(root)
+    cached_dirs = _load_cache(cache_path) if use_cache else {}
+
+    new_cache: Dict[str, Any] = {}
+    hash_lines: List[str] = []
+    rescanned = False
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pending: Set[Future] = {
+            pool.submit(
+                _scan_directory, root, "", IgnoreRules.defaults(), cached_dirs.get("")
+            )
+        }
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    scan, child_rules = future.result()
+                except OSError:
+                    rescanned = True
+                    continue
+                rescanned = rescanned or not scan.from_cache
+                hash_lines.extend(scan.hash_lines)
+                new_cache[scan.rel] = {
+                    "mtime_ns": scan.mtime_ns,
+                    "fingerprint": scan.fingerprint,
+                    "files": scan.files,
+                    "dirs": scan.dirs,
+                    "ignore_lines": scan.ignore_lines,
+                    "ignore_sigs": scan.ignore_sigs,
+                }
+                for name in scan.dirs:
+                    child = _join(scan.rel, name)
+                    pending.add(
+                        pool.submit(
+                            _scan_directory,
+                            root,
+                            child,
+                            child_rules,
+                            cached_dirs.get(child),
+                        )
+                    )
+
+    if use_cache and cache_path is not None and (
+        rescanned or new_cache.keys() != cached_dirs.keys()
+    ):
+        _save_cache(cache_path, new_cache)
+
+    hash_lines.sort()
+    combined = "\n".join(hash_lines)
+    return hashlib.sha256(combined.encode()).hexdigest()[:16]
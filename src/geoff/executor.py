@@ -1,110 +1,178 @@
 import subprocess
 import sys
 import time
+import codecs
 import hashlib
 import os
 import selectors
+import threading
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Set, Tuple
+
+from geoff.change_tracker import ChangeTracker
+from geoff.dir_hash import hash_directory
+from geoff.git_reader import GitReader, UnsupportedGitState, find_git_marker
+from geoff.loop_state import (
+    LoopCheckpoint,
+    LoopState,
+    LoopStateError,
+    default_state_path,
+    load_loop_state,
+)
+from geoff.pacing import FixedPacing, PacingPolicy
+from geoff.run_lock import RunLock, RunLockError, default_lock_path
+from geoff.run_log import IterationLog, IterationRecord, RunRecorder
+from geoff.state_dir import STATE_DIR, ensure_state_dir
+
+READ_CHUNK_SIZE = 64 * 1024
+# How often an idle pipe checks whether the child has already exited.
+EXIT_POLL_SECONDS = 1.0
 
 
 def compute_repo_hash(exec_dir: Optional[Path] = None) -> str:
     """Compute a hash of the repository state for change detection.
 
-    Uses git rev-parse HEAD if in a git repo, otherwise falls back to
-    hashing the directory contents.
+    In a git repository this hashes HEAD plus the ``git status`` output.
+    Outside git it hashes the directory contents.
     """
     cwd = exec_dir or Path.cwd()
 
-    try:
-        # Check if we are in a git repository
-        subprocess.run(
-            ["git", "rev-parse", "--is-inside-work-tree"],
-            cwd=cwd,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
+    marker = find_git_marker(cwd)
+    if marker is not None or "GIT_DIR" in os.environ:
+        try:
+            return _compute_git_hash(cwd, marker)
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            pass
+
+    return hash_directory(cwd)
 
-        # Get HEAD commit hash
-        head_hash = ""
+
+def _read_head(cwd: Path, marker: Optional[Path]) -> str:
+    """HEAD's commit, or ``no-head`` in a repository without commits.
+
+    Read in-process when ``cwd`` is the top of a plain repository, which
+    saves a fork per hash; anything else asks git.
+    """
+    if marker is not None and marker.parent == cwd:
         try:
-            head_result = subprocess.run(
-                ["git", "rev-parse", "HEAD"],
-                cwd=cwd,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            head_hash = head_result.stdout.strip()
-        except subprocess.CalledProcessError:
-            # Handle empty repository with no commits
-            head_hash = "no-head"
-
-        # Get working tree status (staged, unstaged, untracked)
-        # Use -z for machine-readable output without quoting issues
-        status_result = subprocess.run(
-            ["git", "status", "--porcelain", "-z"],
+            return GitReader(cwd).read_head() or "no-head"
+        except UnsupportedGitState:
+            pass
+    try:
+        head_result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
             cwd=cwd,
             capture_output=True,
             text=True,
             check=True,
         )
-        status_raw = status_result.stdout
-
-        hash_input = [head_hash, status_raw]
-
-        # Include mtime and size for all files mentioned in status
-        # to detect content changes in modified/untracked files.
-        # Format for -z is XY PATH\0 (or XY DEST\0SOURCE\0 for renames)
-        parts = status_raw.split("\x00")
-        i = 0
-        while i < len(parts):
-            part = parts[i]
-            if not part:
-                i += 1
-                continue
-
-            if len(part) > 3:
-                path_str = part[3:]
-                fpath = cwd / path_str
-                try:
-                    if fpath.exists():
-                        st = fpath.stat()
-                        hash_input.append(f"{path_str}:{st.st_mtime}:{st.st_size}")
-                except OSError:
-                    pass
-
-            # If rename (R) or copy (C), the next NUL-terminated part is the source path
-            if part[0] in "RC":
-                i += 1
+        return head_result.stdout.strip()
+    except subprocess.CalledProcessError:
+        # Handle empty repository with no commits
+        return "no-head"
+
+
+def _compute_git_hash(cwd: Path, marker: Optional[Path] = None) -> str:
+    # Get working tree status (staged, unstaged, untracked). This also
+    # fails outside a work tree, which sends the caller to the directory
+    # hash. Use -z for machine-readable output without quoting issues.
+    status_result = subprocess.run(
+        ["git", "status", "--porcelain", "-z", "--", f":(exclude){STATE_DIR}"],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    status_raw = status_result.stdout
+
+    hash_input = [_read_head(cwd, marker), status_raw]
+
+    # Include mtime and size for all files mentioned in status
+    # to detect content changes in modified/untracked files.
+    # Format for -z is XY PATH\0 (or XY DEST\0SOURCE\0 for renames)
+    parts = status_raw.split("\x00")
+    i = 0
+    while i < len(parts):
+        part = parts[i]
+        if not part:
             i += 1
+            continue
 
-        combined = "\n".join(hash_input)
-        return hashlib.sha256(combined.encode()).hexdigest()[:16]
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        pass
-
-    hash_input = []
-    for root, dirs, files in os.walk(cwd):
-        dirs.sort()
-        for f in sorted(files):
-            fpath = Path(root) / f
-            relpath = fpath.relative_to(cwd)
+        if len(part) > 3:
+            path_str = part[3:]
+            fpath = cwd / path_str
             try:
-                mtime = fpath.stat().st_mtime
-                size = fpath.stat().st_size
-                hash_input.append(f"{relpath}:{mtime}:{size}")
+                if fpath.exists():
+                    st = fpath.stat()
+                    hash_input.append(f"{path_str}:{st.st_mtime}:{st.st_size}")
             except OSError:
                 pass
 
+        # If rename (R) or copy (C), the next NUL-terminated part is the source path
+        if part[0] in "RC":
+            i += 1
+        i += 1
+
     combined = "\n".join(hash_input)
     return hashlib.sha256(combined.encode()).hexdigest()[:16]
 
 
+@dataclass
+class LoopSummary:
+    """Outcome of a loop run, updated in place as iterations complete."""
+
+    iterations: int = 0
+    stuck_count: int = 0
+    stop_reason: str = ""
+
+
+@dataclass
+class ProcessResult:
+    """Outcome of one agent run."""
+
+    returncode: Optional[int] = None
+    frozen: bool = False
+    output_bytes: int = 0
+
+
+class _OutputWriter:
+    """Write decoded agent output, prefixing each line when a label is set."""
+
+    def __init__(self, prefix: str = ""):
+        self.prefix = prefix
+        self._at_line_start = True
+
+    def write(self, text: str) -> None:
+        if not text:
+            return
+        if self.prefix:
+            out = []
+            for i, line in enumerate(text.split("\n")):
+                if i > 0:
+                    out.append("\n")
+                    self._at_line_start = True
+                if line:
+                    if self._at_line_start:
+                        out.append(self.prefix)
+                    out.append(line)
+                    self._at_line_start = False
+            text = "".join(out)
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+
+def _build_opencode_command(prompt: str, model: Optional[str] = None) -> list[str]:
+    cmd = ["opencode", "run"]
+    if model and model != "default":
+        cmd.extend(["-m", model])
+    cmd.extend([prompt, "--log-level", "INFO"])
+    return cmd
+
+
 def execute_opencode_once(
     prompt: str, exec_dir: Optional[Path] = None, model: Optional[str] = None
-) -> None:
+) -> int:
     """Execute Opencode once with the given prompt.
 
     Exits the TUI cleanly and runs the prompt through Opencode.
@@ -112,18 +180,18 @@ def execute_opencode_once(
     Args:
         prompt: The assembled prompt to execute
         exec_dir: Directory to execute in (defaults to current working directory)
+
+    Returns:
+        Opencode's exit code, or 130 if interrupted.
     """
     cwd = exec_dir or Path.cwd()
 
-    cmd = ["opencode", "run"]
-    if model and model != "default":
-        cmd.extend(["-m", model])
-    cmd.extend([prompt, "--log-level", "INFO"])
+    cmd = _build_opencode_command(prompt, model)
 
     try:
-        subprocess.run(cmd, cwd=cwd, check=False)
+        return subprocess.run(cmd, cwd=cwd, check=False).returncode
     except KeyboardInterrupt:
-        pass
+        return 130
     except FileNotFoundError:
         print(
             "Error: 'opencode' command not found. Ensure Opencode is installed.",
@@ -139,7 +207,11 @@ def execute_opencode_loop(
     max_frozen: int = 0,
     exec_dir: Optional[Path] = None,
     model: Optional[str] = None,
-) -> None:
+    change_detection: str = "hash",
+    recorder: Optional[RunRecorder] = None,
+    pacing: Optional[PacingPolicy] = None,
+    checkpoint_path: Optional[Path] = None,
+) -> LoopSummary:
     """Execute Opencode in a loop with change detection.
 
     Runs Opencode repeatedly until user cancels, max iterations reached,
@@ -151,58 +223,144 @@ def execute_opencode_loop(
         max_stuck: Consecutive iterations with no changes before breaking
         max_frozen: Minutes without output before killing the iteration (0 disables)
         exec_dir: Directory to execute in (defaults to current working directory)
+        change_detection: "hash" to compare compute_repo_hash snapshots, or
+            "inotify" to watch the tree for the loop's lifetime (falls back
+            to hashing when inotify is unavailable or runs out of watches)
+        recorder: Where to write per-iteration output logs and telemetry
+            (None disables both)
+        pacing: Policy for the pause between iterations (defaults to a
+            fixed two seconds)
+        checkpoint_path: Where to checkpoint progress after every iteration
+            so the loop can be resumed (None disables)
+
+    Returns:
+        A LoopSummary with the iteration count and why the loop stopped.
     """
     cwd = exec_dir or Path.cwd()
-
-    stuck_count = 0
-    iteration = 0
-    has_changes = True
+    checkpoint = None
+    if checkpoint_path is not None:
+        state = LoopState(
+            prompt=prompt,
+            max_iterations=max_iterations,
+            max_stuck=max_stuck,
+            max_frozen=max_frozen,
+            model=model,
+            change_detection=change_detection,
+            run_dir=str(recorder.run_dir) if recorder is not None else None,
+        )
+        checkpoint = LoopCheckpoint(checkpoint_path, state)
 
     print(
         "Starting loop execution (max_iterations="
         f"{max_iterations}, max_stuck={max_stuck}, max_frozen={max_frozen})"
     )
+    return _supervise_loop(
+        prompt,
+        cwd,
+        LoopSummary(),
+        max_iterations=max_iterations,
+        max_stuck=max_stuck,
+        max_frozen=max_frozen,
+        model=model,
+        change_detection=change_detection,
+        recorder=recorder,
+        pacing=pacing,
+        checkpoint=checkpoint,
+    )
 
-    try:
-        while True:
-            iteration += 1
 
-            prev_hash = compute_repo_hash(cwd)
+def resume_opencode_loop(
+    exec_dir: Optional[Path] = None,
+    checkpoint_path: Optional[Path] = None,
+    recorder: Optional[RunRecorder] = None,
+    pacing: Optional[PacingPolicy] = None,
+) -> LoopSummary:
+    """Continue an interrupted loop from its checkpoint.
+
+    The prompt, limits, iteration count and stuck counter all come from the
+    checkpoint, so ``max_iterations`` keeps counting from where the previous
+    process stopped. An iteration that was in progress when it died is run
+    again. The stuck counter starts over if the repo hash differs from the
+    checkpoint's. A parallel worker is resumed from its worktree.
 
-            print(f"\n--- Iteration {iteration} ---")
+    Args:
+        exec_dir: Directory to execute in (defaults to current working directory)
+        checkpoint_path: Checkpoint to resume (defaults to .geoff/loop-state)
+        recorder: Where to write logs and telemetry; when None and the
+            checkpointed run directory still exists, recording continues there
+        pacing: Policy for the pause between iterations
 
-            cmd = ["opencode", "run"]
-            if model and model != "default":
-                cmd.extend(["-m", model])
-            cmd.extend([prompt, "--log-level", "INFO"])
+    Returns:
+        A LoopSummary covering both the original and the resumed iterations.
+    """
+    cwd = exec_dir or Path.cwd()
+    checkpoint_path = checkpoint_path or default_state_path(cwd)
 
-            if max_frozen > 0:
-                _run_opencode_with_frozen_timeout(
-                    cmd, cwd=cwd, max_frozen_minutes=max_frozen
-                )
-            else:
-                subprocess.run(cmd, cwd=cwd, check=False)
+    try:
+        state = load_loop_state(checkpoint_path)
+        if not state.resumable:
+            raise LoopStateError(
+                f"Loop already finished ({state.status}) after "
+                f"{state.iterations} iteration(s); nothing to resume"
+            )
+    except LoopStateError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
 
-            curr_hash = compute_repo_hash(cwd)
+    if recorder is None and state.run_dir and Path(state.run_dir).is_dir():
+        recorder = RunRecorder(Path(state.run_dir))
+    if recorder is not None:
+        state.run_dir = str(recorder.run_dir)
 
-            if curr_hash == prev_hash:
-                stuck_count += 1
-                print(f"No changes detected (stuck: {stuck_count}/{max_stuck})")
-            else:
-                stuck_count = 0
-                print("Changes detected")
+    stuck_count = state.stuck_count
+    if stuck_count and state.last_hash is not None:
+        # The stuck count only holds while the repo is as the loop left it.
+        if compute_repo_hash(cwd) != state.last_hash:
+            print("Repository changed since the checkpoint; stuck count reset")
+            stuck_count = 0
 
-            if max_iterations > 0 and iteration >= max_iterations:
-                print(f"Reached max iterations ({max_iterations})")
-                break
-
-            if stuck_count >= max_stuck:
-                print(f"Repo stuck for {stuck_count} consecutive iterations")
-                break
+    print(
+        f"Resuming loop after iteration {state.iterations} (max_iterations="
+        f"{state.max_iterations}, max_stuck={state.max_stuck}, "
+        f"max_frozen={state.max_frozen})"
+    )
+    return _supervise_loop(
+        state.prompt,
+        cwd,
+        LoopSummary(iterations=state.iterations, stuck_count=stuck_count),
+        max_iterations=state.max_iterations,
+        max_stuck=state.max_stuck,
+        max_frozen=state.max_frozen,
+        model=state.model,
+        change_detection=state.change_detection,
+        recorder=recorder,
+        pacing=pacing,
+        checkpoint=LoopCheckpoint(checkpoint_path, state),
+    )
 
-            time.sleep(2)
 
+def _supervise_loop(
+    prompt: str,
+    cwd: Path,
+    summary: LoopSummary,
+    checkpoint: Optional[LoopCheckpoint] = None,
+    **loop_options,
+) -> LoopSummary:
+    # Held for the loop's lifetime; taken before the checkpoint is touched
+    # so a second loop cannot clobber the running loop's state.
+    ensure_state_dir(cwd)
+    run_lock = RunLock(default_lock_path(cwd))
+    try:
+        run_lock.acquire()
+    except RunLockError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    try:
+        if checkpoint is not None:
+            checkpoint.update(summary.iterations, summary.stuck_count)
+        _run_loop(prompt, cwd, summary, checkpoint=checkpoint, **loop_options)
     except KeyboardInterrupt:
+        summary.stop_reason = "cancelled"
         print("\nLoop cancelled by user")
     except FileNotFoundError:
         print(
@@ -210,59 +368,313 @@ def execute_opencode_loop(
             file=sys.stderr,
         )
         sys.exit(1)
+    finally:
+        if checkpoint is not None:
+            checkpoint.update(
+                summary.iterations,
+                summary.stuck_count,
+                status=summary.stop_reason or "cancelled",
+            )
+        run_lock.release()
 
-    print(f"\nLoop terminated after {iteration} iteration(s)")
+    print(f"\nLoop terminated after {summary.iterations} iteration(s)")
+    return summary
 
 
-def _run_opencode_with_frozen_timeout(
-    cmd: list[str], cwd: Path, max_frozen_minutes: int
+class _ChangeDetector:
+    """Answer "did this iteration change the repo?" for one loop.
+
+    Uses a ChangeTracker when ``change_detection`` is "inotify" and it can
+    be started, otherwise compares compute_repo_hash before and after.
+    """
+
+    def __init__(self, cwd: Path, change_detection: str = "hash", label: str = ""):
+        self.cwd = cwd
+        self.label = label
+        self.tracker: Optional[ChangeTracker] = None
+        self._prev_hash: Optional[str] = None
+        # Repo hash after the latest iteration, when hashing is in use.
+        self.last_hash: Optional[str] = None
+        # Time spent detecting changes in the current iteration.
+        self.seconds = 0.0
+        if change_detection == "inotify":
+            self.tracker = ChangeTracker(cwd)
+            if not self.tracker.start():
+                print(f"{label}inotify unavailable, using repo hashing")
+
+    def begin(self) -> None:
+        started = time.monotonic()
+        self._prev_hash = None
+        if self.tracker is not None and self.tracker.active:
+            self.tracker.reset()
+        else:
+            self._prev_hash = compute_repo_hash(self.cwd)
+        self.seconds = time.monotonic() - started
+
+    def finish(self) -> Tuple[bool, Optional[Set[str]]]:
+        """Return whether anything changed and, when known, which paths."""
+        started = time.monotonic()
+        try:
+            return self._finish()
+        finally:
+            self.seconds += time.monotonic() - started
+
+    def _finish(self) -> Tuple[bool, Optional[Set[str]]]:
+        if self._prev_hash is not None:
+            self.last_hash = compute_repo_hash(self.cwd)
+            return self.last_hash != self._prev_hash, None
+
+        changed = self.tracker.collect()
+        if changed is None:
+            # Events were lost or watches ran out; without a baseline
+            # hash the safe answer is that something changed.
+            print(f"{self.label}Change tracking lost, falling back to hashing")
+            return True, None
+        return bool(changed), changed
+
+    def close(self) -> None:
+        if self.tracker is not None:
+            self.tracker.close()
+
+
+def _record_iteration(
+    summary: LoopSummary,
+    has_changes: bool,
+    changed: Optional[Set[str]],
+    max_iterations: int,
+    max_stuck: int,
+    label: str = "",
+) -> bool:
+    """Update stuck accounting after an iteration; return True to stop."""
+    if not has_changes:
+        summary.stuck_count += 1
+        print(f"{label}No changes detected (stuck: {summary.stuck_count}/{max_stuck})")
+    else:
+        summary.stuck_count = 0
+        if changed:
+            print(f"{label}Changes detected ({len(changed)} path(s))")
+        else:
+            print(f"{label}Changes detected")
+
+    if max_iterations > 0 and summary.iterations >= max_iterations:
+        summary.stop_reason = "max_iterations"
+        print(f"{label}Reached max iterations ({max_iterations})")
+        return True
+
+    if summary.stuck_count >= max_stuck:
+        summary.stop_reason = "stuck"
+        print(f"{label}Repo stuck for {summary.stuck_count} consecutive iterations")
+        return True
+
+    return False
+
+
+def _iteration_record(
+    summary: LoopSummary,
+    started_at: float,
+    agent_seconds: float,
+    hash_seconds: float,
+    result: Optional[ProcessResult],
+    has_changes: bool,
+    changed: Optional[Set[str]],
+    delay: float,
+) -> IterationRecord:
+    result = result or ProcessResult()
+    return IterationRecord(
+        iteration=summary.iterations,
+        started_at=round(started_at, 3),
+        ended_at=round(time.time(), 3),
+        agent_seconds=round(agent_seconds, 3),
+        hash_seconds=round(hash_seconds, 4),
+        output_bytes=result.output_bytes,
+        exit_code=result.returncode,
+        frozen=result.frozen,
+        stuck_count=summary.stuck_count,
+        changed=has_changes,
+        changed_paths=sorted(changed) if changed is not None else None,
+        delay_seconds=round(delay, 3),
+    )
+
+
+def _failed(result: Optional[ProcessResult]) -> bool:
+    """Whether the agent run itself failed (non-zero exit or frozen)."""
+    if result is None:
+        return False
+    return result.frozen or result.returncode not in (0, None)
+
+
+def _run_loop(
+    prompt: str,
+    cwd: Path,
+    summary: LoopSummary,
+    max_iterations: int = 0,
+    max_stuck: int = 2,
+    max_frozen: int = 0,
+    model: Optional[str] = None,
+    change_detection: str = "hash",
+    label: str = "",
+    stop_event: Optional[threading.Event] = None,
+    recorder: Optional[RunRecorder] = None,
+    pacing: Optional[PacingPolicy] = None,
+    checkpoint: Optional[LoopCheckpoint] = None,
 ) -> None:
-    timeout_seconds = max_frozen_minutes * 60
-    last_activity = time.monotonic()
+    """Run loop iterations against ``cwd``, recording progress in ``summary``.
+
+    ``label`` prefixes every status line so concurrent loops can share a
+    terminal. When ``stop_event`` is given the loop checks it between
+    iterations and always captures output so it can be prefixed. When
+    ``recorder`` is given each iteration's output and telemetry go to its
+    run directory. ``pacing`` decides the pause between iterations (a fixed
+    two seconds by default). ``checkpoint`` is updated after every iteration.
+    """
+    cmd = _build_opencode_command(prompt, model)
+    pacing = pacing or FixedPacing()
+    detector = _ChangeDetector(cwd, change_detection, label)
+
+    try:
+        while True:
+            if stop_event is not None and stop_event.is_set():
+                summary.stop_reason = "cancelled"
+                break
+
+            started_at = time.time()
+            summary.iterations += 1
+            detector.begin()
+            hash_seconds = detector.seconds
+
+            print(f"\n{label}--- Iteration {summary.iterations} ---")
+
+            agent_started = time.monotonic()
+            result = None
+            if max_frozen > 0 or label or recorder is not None:
+                log = recorder.open_log(summary.iterations) if recorder else None
+                try:
+                    result = _run_opencode_with_frozen_timeout(
+                        cmd,
+                        cwd=cwd,
+                        max_frozen_minutes=max_frozen,
+                        prefix=label,
+                        log=log,
+                    )
+                finally:
+                    if recorder is not None:
+                        recorder.close_log(log)
+            else:
+                completed = subprocess.run(cmd, cwd=cwd, check=False)
+                result = ProcessResult(returncode=completed.returncode)
+            agent_seconds = time.monotonic() - agent_started
+
+            has_changes, changed = detector.finish()
+            hash_seconds += detector.seconds
+            stop = _record_iteration(
+                summary, has_changes, changed, max_iterations, max_stuck, label
+            )
+            delay = 0.0 if stop else pacing.delay(has_changes, _failed(result))
+            if recorder is not None:
+                recorder.record(
+                    _iteration_record(
+                        summary,
+                        started_at,
+                        agent_seconds,
+                        hash_seconds,
+                        result,
+                        has_changes,
+                        changed,
+                        delay,
+                    )
+                )
+            if checkpoint is not None:
+                checkpoint.update(
+                    summary.iterations, summary.stuck_count, detector.last_hash
+                )
+            if stop:
+                break
+
+            if delay <= 0:
+                continue
+            if stop_event is None:
+                time.sleep(delay)
+            elif stop_event.wait(delay):
+                summary.stop_reason = "cancelled"
+                break
+    finally:
+        detector.close()
+
+
+def _run_opencode_with_frozen_timeout(
+    cmd: list[str],
+    cwd: Path,
+    max_frozen_minutes: int,
+    prefix: str = "",
+    log: Optional[IterationLog] = None,
+) -> ProcessResult:
+    # A limit of 0 still streams output (for prefixing) but never times out.
+    timeout_seconds = max_frozen_minutes * 60 if max_frozen_minutes > 0 else None
+    result = ProcessResult()
+    writer = _OutputWriter(prefix)
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
 
     process = subprocess.Popen(
         cmd,
         cwd=cwd,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
-        text=True,
-        bufsize=1,
+        bufsize=0,
     )
 
     if process.stdout is None:
-        process.wait()
-        return
+        result.returncode = process.wait()
+        return result
 
+    # Raw non-blocking reads: a partial line (spinners, progress bars) must
+    # never block us past the frozen deadline the way readline() would.
+    fd = process.stdout.fileno()
+    os.set_blocking(fd, False)
     selector = selectors.DefaultSelector()
-    selector.register(process.stdout, selectors.EVENT_READ)
-    frozen = False
+    selector.register(fd, selectors.EVENT_READ)
+    last_activity = time.monotonic()
 
-    try:
+    def read_available() -> bool:
+        """Forward everything readable now; return True at end of file."""
+        nonlocal last_activity
         while True:
-            if process.poll() is not None:
-                break
-
-            remaining = timeout_seconds - (time.monotonic() - last_activity)
-            if remaining <= 0:
-                frozen = True
-                break
+            try:
+                chunk = os.read(fd, READ_CHUNK_SIZE)
+            except BlockingIOError:
+                return False
+            if not chunk:
+                return True
+            last_activity = time.monotonic()
+            result.output_bytes += len(chunk)
+            if log is not None:
+                log.write(chunk)
+            writer.write(decoder.decode(chunk))
 
-            events = selector.select(timeout=remaining)
-            if not events:
-                frozen = True
-                break
+    try:
+        eof = False
+        while not eof:
+            wait = EXIT_POLL_SECONDS
+            if timeout_seconds is not None:
+                remaining = timeout_seconds - (time.monotonic() - last_activity)
+                if remaining <= 0:
+                    result.frozen = True
+                    break
+                wait = min(wait, remaining)
+
+            if not selector.select(timeout=wait):
+                # Child gone and pipe idle (a grandchild may hold it open).
+                if process.poll() is not None:
+                    break
+                continue
 
-            for key, _ in events:
-                line = key.fileobj.readline()
-                if line:
-                    last_activity = time.monotonic()
-                    print(line, end="")
+            eof = read_available()
     finally:
-        selector.unregister(process.stdout)
+        selector.close()
 
-    if frozen:
-        print(
-            f"\nFrozen timeout reached ({max_frozen_minutes} minutes). Terminating iteration."
+    if result.frozen:
+        writer.write(
+            f"\n{prefix}Frozen timeout reached ({max_frozen_minutes} minutes). "
+            "Terminating iteration.\n"
         )
         process.terminate()
         try:
@@ -270,8 +682,12 @@ def _run_opencode_with_frozen_timeout(
         except subprocess.TimeoutExpired:
             process.kill()
             process.wait()
+        # The last output before the hang usually explains it. Whatever is
+        # still in the pipe is read without waiting: a surviving grandchild
+        # may hold the write end open.
+        read_available()
 
-    for line in process.stdout:
-        print(line, end="")
-
+    writer.write(decoder.decode(b"", final=True))
     process.stdout.close()
+    result.returncode = process.wait()
+    return result
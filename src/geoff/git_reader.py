@@ -0,0 +1,243 @@
+"""In-process reader for the bits of ``.git`` that change detection needs.
+
+Resolves HEAD through loose refs and packed-refs and parses the index
+(versions 2 and 3) so the loop can tell whether HEAD moved or the index
+changed without spawning git. Anything unusual raises UnsupportedGitState
+and callers fall back to the git subprocess path.
+"""
+
+import os
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+_INDEX_HEADER = struct.Struct(">4sII")
+_ENTRY_STAT = struct.Struct(">10I20sH")
+_SUPPORTED_INDEX_VERSIONS = {2, 3}
+_UNSUPPORTED_EXTENSIONS = {b"link", b"sdir"}
+_GITLINK_MODE = 0o160000
+_SKIP_WORKTREE_FLAG = 0x4000
+_EXTENDED_FLAG = 0x4000
+_NAME_MASK = 0x0FFF
+
+# Environment variables that change how git locates the repository.
+_GIT_ENV_OVERRIDES = (
+    "GIT_DIR",
+    "GIT_WORK_TREE",
+    "GIT_INDEX_FILE",
+    "GIT_COMMON_DIR",
+    "GIT_OBJECT_DIRECTORY",
+    "GIT_CEILING_DIRECTORIES",
+    "GIT_DISCOVERY_ACROSS_FILESYSTEM",
+)
+
+
+class UnsupportedGitState(Exception):
+    """Raised when the repository layout needs the git subprocess path."""
+
+    pass
+
+
+@dataclass(frozen=True)
+class IndexEntry:
+    path: str
+    mode: int
+    sha: str
+    stage: int
+    mtime_s: int
+    mtime_ns: int
+    size: int
+
+
+@dataclass(frozen=True)
+class IndexState:
+    version: int
+    entries: List[IndexEntry]
+    checksum: str
+
+
+def find_git_marker(start: Path) -> Optional[Path]:
+    """Return the nearest ``.git`` file or directory at or above ``start``."""
+    for directory in (start, *start.parents):
+        marker = directory / ".git"
+        if marker.exists():
+            return marker
+    return None
+
+
+class GitReader:
+    """Read HEAD and index state for a worktree rooted at ``worktree``."""
+
+    def __init__(self, worktree: Path):
+        if any(name in os.environ for name in _GIT_ENV_OVERRIDES):
+            raise UnsupportedGitState("git environment overrides are set")
+
+        self.worktree = Path(worktree)
+        self.git_dir = self._locate_git_dir(self.worktree / ".git")
+        self.common_dir = self._locate_common_dir(self.git_dir)
+
+        if (self.common_dir / "reftable").exists():
+            raise UnsupportedGitState("reftable ref storage")
+        self._check_config(self.common_dir / "config")
+
+    @staticmethod
+    def _locate_git_dir(marker: Path) -> Path:
+        if marker.is_dir():
+            return marker
+        if marker.is_file():
+            # Linked worktrees and submodules use "gitdir: <path>" files.
+            try:
+                content = marker.read_text(encoding="utf-8").strip()
+            except OSError as e:
+                raise UnsupportedGitState(str(e)) from e
+            if content.startswith("gitdir:"):
+                git_dir = Path(content[len("gitdir:") :].strip())
+                if not git_dir.is_absolute():
+                    git_dir = marker.parent / git_dir
+                if git_dir.is_dir():
+                    return git_dir
+        raise UnsupportedGitState(f"no git directory at {marker}")
+
+    @staticmethod
+    def _locate_common_dir(git_dir: Path) -> Path:
+        commondir = git_dir / "commondir"
+        if not commondir.exists():
+            return git_dir
+        try:
+            target = Path(commondir.read_text(encoding="utf-8").strip())
+        except OSError as e:
+            raise UnsupportedGitState(str(e)) from e
+        if not target.is_absolute():
+            target = git_dir / target
+        return target
+
+    @staticmethod
+    def _check_config(config_path: Path) -> None:
+        try:
+            config = config_path.read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            return
+        lowered = config.lower()
+        # SHA-256 object names and alternative ref backends change the formats.
+        if "objectformat" in lowered or "refstorage" in lowered:
+            raise UnsupportedGitState("non-default repository extensions")
+
+    def resolve_ref(self, ref: str) -> Optional[str]:
+        """Resolve a ref name to an object id, following symbolic refs."""
+        for _ in range(10):
+            loose = self.common_dir / ref
+            if ref == "HEAD" or not ref.startswith("refs/"):
+                loose = self.git_dir / ref
+            try:
+                value = loose.read_text(encoding="utf-8").strip()
+            except FileNotFoundError:
+                return self._packed_ref(ref)
+            except OSError as e:
+                raise UnsupportedGitState(str(e)) from e
+
+            if value.startswith("ref:"):
+                ref = value[len("ref:") :].strip()
+                continue
+            return value or None
+        raise UnsupportedGitState("symbolic ref chain too deep")
+
+    def _packed_ref(self, ref: str) -> Optional[str]:
+        try:
+            with open(self.common_dir / "packed-refs", "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.startswith(("#", "^")):
+                        continue
+                    sha, _, name = line.rstrip("\n").partition(" ")
+                    if name == ref:
+                        return sha
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            raise UnsupportedGitState(str(e)) from e
+        return None
+
+    def read_head(self) -> Optional[str]:
+        """Return the commit HEAD points at, or None for an unborn branch."""
+        return self.resolve_ref("HEAD")
+
+    def read_index(self) -> IndexState:
+        """Parse ``.git/index``. A missing index is an empty version 2 index."""
+        try:
+            data = (self.git_dir / "index").read_bytes()
+        except FileNotFoundError:
+            return IndexState(version=2, entries=[], checksum="")
+        except OSError as e:
+            raise UnsupportedGitState(str(e)) from e
+
+        if len(data) < _INDEX_HEADER.size + 20:
+            raise UnsupportedGitState("truncated index")
+        signature, version, count = _INDEX_HEADER.unpack_from(data, 0)
+        if signature != b"DIRC":
+            raise UnsupportedGitState("bad index signature")
+        if version not in _SUPPORTED_INDEX_VERSIONS:
+            raise UnsupportedGitState(f"index version {version}")
+
+        entries = []
+        offset = _INDEX_HEADER.size
+        end = len(data) - 20
+        for _ in range(count):
+            if offset + _ENTRY_STAT.size > end:
+                raise UnsupportedGitState("truncated index entry")
+            (
+                _ctime_s,
+                _ctime_ns,
+                mtime_s,
+                mtime_ns,
+                _dev,
+                _ino,
+                mode,
+                _uid,
+                _gid,
+                size,
+                sha,
+                flags,
+            ) = _ENTRY_STAT.unpack_from(data, offset)
+            header_len = _ENTRY_STAT.size
+            if flags & _EXTENDED_FLAG:
+                if version < 3:
+                    raise UnsupportedGitState("extended flags in v2 index")
+                (extended,) = struct.unpack_from(">H", data, offset + header_len)
+                if extended & _SKIP_WORKTREE_FLAG:
+                    raise UnsupportedGitState("sparse checkout")
+                header_len += 2
+
+            if mode == _GITLINK_MODE:
+                raise UnsupportedGitState("submodules")
+
+            name_start = offset + header_len
+            name_end = data.index(b"\0", name_start)
+            if flags & _NAME_MASK != _NAME_MASK and name_end - name_start != (
+                flags & _NAME_MASK
+            ):
+                raise UnsupportedGitState("corrupt index entry name")
+            path = os.fsdecode(data[name_start:name_end])
+
+            entries.append(
+                IndexEntry(
+                    path=path,
+                    mode=mode,
+                    sha=sha.hex(),
+                    stage=(flags >> 12) & 0x3,
+                    mtime_s=mtime_s,
+                    mtime_ns=mtime_ns,
+                    size=size,
+                )
+            )
+            # Entries are NUL-padded to a multiple of eight bytes.
+            entry_len = header_len + (name_end - name_start)
+            offset += (entry_len + 8) & ~7
+
+        while offset + 8 <= end:
+            ext_sig = data[offset : offset + 4]
+            (ext_size,) = struct.unpack_from(">I", data, offset + 4)
+            if ext_sig in _UNSUPPORTED_EXTENSIONS:
+                raise UnsupportedGitState(f"index extension {ext_sig.decode()}")
+            offset += 8 + ext_size
+
+        return IndexState(version=version, entries=entries, checksum=data[-20:].hex())
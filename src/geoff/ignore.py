@@ -0,0 +1,148 @@
+"""Minimal .gitignore-style pattern matching.
+
+Supports the commonly used subset of gitignore syntax: comments, ``!``
+negation, trailing ``/`` for directories, leading or embedded ``/`` to
+anchor a pattern to the directory holding the ignore file, and the ``*``,
+``?``, ``[...]`` and ``**`` wildcards.
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple
+
+IGNORE_FILES = (".gitignore", ".geoffignore")
+
+# Always skipped: VCS metadata, geoff's own state and dependency/venv trees.
+DEFAULT_PATTERNS = (".git/", ".geoff/", "node_modules/", ".venv/", "__pycache__/")
+
+
+@dataclass(frozen=True)
+class IgnoreRule:
+    base: str
+    regex: "re.Pattern[str]"
+    negate: bool
+    dir_only: bool
+    anchored: bool
+    source: str
+
+
+def _translate(glob: str) -> str:
+    out = []
+    i = 0
+    n = len(glob)
+    while i < n:
+        c = glob[i]
+        if c == "*":
+            if glob[i : i + 3] == "**/":
+                out.append("(?:.*/)?")
+                i += 3
+                continue
+            if glob[i : i + 2] == "**":
+                out.append(".*")
+                i += 2
+                continue
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            j = glob.find("]", i + 2)
+            if j == -1:
+                out.append(re.escape(c))
+            else:
+                body = glob[i + 1 : j]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body.replace(chr(92), chr(92) * 2)}]")
+                i = j
+        elif c == "\\" and i + 1 < n:
+            i += 1
+            out.append(re.escape(glob[i]))
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+def parse_pattern(line: str, base: str = "") -> Optional[IgnoreRule]:
+    """Compile one ignore-file line; returns None for blanks and comments."""
+    source = line
+    line = line.rstrip("\n").rstrip()
+    if not line or line.startswith("#"):
+        return None
+
+    negate = line.startswith("!")
+    if negate:
+        line = line[1:]
+    elif line.startswith("\\"):
+        line = line[1:]
+
+    dir_only = line.endswith("/")
+    line = line.rstrip("/")
+    if not line:
+        return None
+
+    anchored = "/" in line
+    line = line.lstrip("/")
+
+    return IgnoreRule(
+        base=base,
+        regex=re.compile(_translate(line) + r"\Z"),
+        negate=negate,
+        dir_only=dir_only,
+        anchored=anchored,
+        source=source.rstrip("\n"),
+    )
+
+
+def parse_lines(lines: Iterable[str], base: str = "") -> List[IgnoreRule]:
+    rules = []
+    for line in lines:
+        rule = parse_pattern(line, base)
+        if rule is not None:
+            rules.append(rule)
+    return rules
+
+
+class IgnoreRules:
+    """An ordered, immutable stack of ignore rules for one directory level.
+
+    Child directories extend their parent's rules with any ignore files they
+    contain, so later (deeper) rules take precedence as in git.
+    """
+
+    def __init__(self, rules: Tuple[IgnoreRule, ...] = ()):
+        self.rules = rules
+        # Stable identity of the rule set, used to validate cached listings.
+        digest = hashlib.sha1()
+        for rule in rules:
+            digest.update(f"{rule.base}\0{rule.source}\n".encode())
+        self.fingerprint = digest.hexdigest()[:16]
+
+    @classmethod
+    def defaults(cls) -> "IgnoreRules":
+        return cls(tuple(parse_lines(DEFAULT_PATTERNS)))
+
+    def extend(self, rules: List[IgnoreRule]) -> "IgnoreRules":
+        if not rules:
+            return self
+        return IgnoreRules(self.rules + tuple(rules))
+
+    def is_ignored(self, rel_path: str, is_dir: bool) -> bool:
+        """Return whether ``rel_path`` (posix, relative to the root) is ignored."""
+        ignored = False
+        name = rel_path.rsplit("/", 1)[-1]
+        for rule in self.rules:
+            if rule.dir_only and not is_dir:
+                continue
+            if rule.base:
+                prefix = rule.base + "/"
+                if not rel_path.startswith(prefix):
+                    continue
+                local = rel_path[len(prefix) :]
+            else:
+                local = rel_path
+            target = local if rule.anchored else name
+            if rule.regex.match(target):
+                ignored = not rule.negate
+        return ignored
@@ -0,0 +1,105 @@
+"""Crash-safe loop checkpoints in ``.geoff/loop-state``.
+
+The loop rewrites the checkpoint after every iteration (write to a temporary
+file, fsync, rename over the old one), so after a reboot or a killed
+terminal the file always holds the last completed iteration and
+``resume_opencode_loop`` can carry on with the same prompt, counters and
+limits.
+
+Each worker of a parallel run checkpoints into its own worktree, where
+``geoff resume`` continues that worker alone.
+"""
+
+import json
+import time
+from dataclasses import asdict, dataclass, field, fields
+from pathlib import Path
+from typing import Optional
+
+from geoff.config_io import atomic_write
+
+STATE_VERSION = 1
+# Stop reasons after which there is nothing left to resume.
+FINISHED_STATUSES = {"max_iterations", "stuck"}
+
+
+class LoopStateError(Exception):
+    """Raised when a loop checkpoint is missing, corrupt or not resumable."""
+
+    pass
+
+
+def default_state_path(root: Path) -> Path:
+    return Path(root) / ".geoff" / "loop-state"
+
+
+@dataclass
+class LoopState:
+    prompt: str
+    max_iterations: int = 0
+    max_stuck: int = 2
+    max_frozen: int = 0
+    model: Optional[str] = None
+    change_detection: str = "hash"
+    iterations: int = 0
+    stuck_count: int = 0
+    # Repo hash after the last completed iteration, with hash detection. A
+    # resumed loop that finds a different hash starts its stuck count over.
+    last_hash: Optional[str] = None
+    # "running" while the loop is alive, otherwise its stop reason.
+    status: str = "running"
+    run_dir: Optional[str] = None
+    started_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+    version: int = STATE_VERSION
+
+    @property
+    def resumable(self) -> bool:
+        return self.status not in FINISHED_STATUSES
+
+
+def save_loop_state(path: Path, state: LoopState) -> None:
+    """Atomically replace the checkpoint at ``path``."""
+    state.updated_at = time.time()
+    data = json.dumps(asdict(state), indent=2).encode("utf-8")
+    atomic_write(path, data, sync=True, sync_dir=True)
+
+
+def load_loop_state(path: Path) -> LoopState:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError as e:
+        raise LoopStateError(f"No loop checkpoint at {path}") from e
+    except (OSError, ValueError) as e:
+        raise LoopStateError(f"Unreadable loop checkpoint {path}: {e}") from e
+
+    if not isinstance(data, dict) or data.get("version") != STATE_VERSION:
+        raise LoopStateError(f"Unsupported loop checkpoint format in {path}")
+    known = {f.name for f in fields(LoopState)}
+    try:
+        return LoopState(**{k: v for k, v in data.items() if k in known})
+    except TypeError as e:
+        raise LoopStateError(f"Incomplete loop checkpoint {path}: {e}") from e
+
+
+class LoopCheckpoint:
+    """Keeps one loop's checkpoint file in step with its progress."""
+
+    def __init__(self, path: Path, state: LoopState):
+        self.path = Path(path)
+        self.state = state
+
+    def update(
+        self,
+        iterations: int,
+        stuck_count: int,
+        last_hash: Optional[str] = None,
+        status: str = "running",
+    ) -> None:
+        self.state.iterations = iterations
+        self.state.stuck_count = stuck_count
+        if last_hash is not None:
+            self.state.last_hash = last_hash
+        self.state.status = status
+        save_loop_state(self.path, self.state)
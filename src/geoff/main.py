@@ -1,31 +1,85 @@
 import sys
-from geoff.app import GeoffApp
-from geoff.executor import execute_opencode_once, execute_opencode_loop
+from pathlib import Path
+from typing import List, Optional
 
+from geoff.config import PromptConfig
+
+
+def dispatch(action: str, prompt: str, config: PromptConfig) -> int:
+    """Run the executor matching an action returned by the TUI or CLI.
+
+    Returns an exit status: opencode's exit code for a single run, and for
+    loops 1 if the loop or any parallel worker stopped with an error.
+    """
+    # Deferred so that printing or validating a prompt never loads the
+    # executor and its change-detection machinery.
+    from geoff.executor import execute_opencode_loop, execute_opencode_once
+    from geoff.loop_state import default_state_path
+    from geoff.pacing import pacing_from_config
+    from geoff.parallel import execute_opencode_parallel
+    from geoff.prompt_builder import prompt_files
+    from geoff.run_log import RunRecorder, create_run_dir, prune_runs
+
+    if action == "run_once":
+        return execute_opencode_once(prompt, model=config.model)
+    if action == "run_loop":
+        recorder = None
+        if config.log_enabled or config.telemetry_enabled:
+            recorder = RunRecorder(
+                create_run_dir(Path.cwd()),
+                log_output=config.log_enabled,
+                telemetry=config.telemetry_enabled,
+                log_max_run_bytes=config.log_max_run_mb * 1024 * 1024,
+            )
+            prune_runs(Path.cwd(), config.log_retain_runs)
+        if config.parallel_workers > 1:
+            results = execute_opencode_parallel(
+                prompt,
+                workers=config.parallel_workers,
+                max_iterations=config.max_iterations,
+                max_stuck=config.max_stuck,
+                max_frozen=config.max_frozen,
+                model=config.model,
+                change_detection=config.change_detection,
+                recorder=recorder,
+                pacing=pacing_from_config(config),
+                checkpoint=True,
+                shared_files=prompt_files(config),
+            )
+            summaries = [result.summary for result in results]
+        else:
+            summary = execute_opencode_loop(
+                prompt,
+                max_iterations=config.max_iterations,
+                max_stuck=config.max_stuck,
+                max_frozen=config.max_frozen,
+                model=config.model,
+                change_detection=config.change_detection,
+                recorder=recorder,
+                pacing=pacing_from_config(config),
+                checkpoint_path=default_state_path(Path.cwd()),
+            )
+            summaries = [summary]
+        return 1 if any(s.stop_reason == "error" for s in summaries) else 0
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv:
+        from geoff.cli import run_cli
+
+        sys.exit(run_cli(argv))
+
+    # Only the TUI needs Textual; headless commands never import it.
+    from geoff.app import GeoffApp
 
-def main():
     app = GeoffApp()
     result = app.run()
 
     if result:
-        action, *args = result
-        if action == "run_once":
-            prompt = args[0]
-            model = args[1] if len(args) > 1 else None
-            execute_opencode_once(prompt, model=model)
-        elif action == "run_loop":
-            prompt = args[0]
-            model = args[1] if len(args) > 1 else None
-            max_iterations = args[2] if len(args) > 2 else 0
-            max_stuck = args[3] if len(args) > 3 else 2
-            max_frozen = args[4] if len(args) > 4 else 0
-            execute_opencode_loop(
-                prompt,
-                max_iterations=max_iterations,
-                max_stuck=max_stuck,
-                max_frozen=max_frozen,
-                model=model,
-            )
+        action, prompt, config = result
+        sys.exit(dispatch(action, prompt, config))
 
 
 if __name__ == "__main__":
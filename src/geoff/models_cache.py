@@ -0,0 +1,75 @@
+"""Disk cache of the model list printed by ``opencode models``.
+
+Listing models takes ``opencode`` several seconds, so the parsed list is
+kept in ``~/.geoff/cache/models.json`` with the time it was fetched. The
+TUI shows the cached list immediately and refreshes it in the background
+once it is older than the TTL (stale-while-revalidate).
+"""
+
+import json
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+from geoff import __version__
+from geoff.config_io import atomic_write
+
+# Providers rarely add models; a day keeps the list current enough.
+MODELS_CACHE_TTL = 24 * 60 * 60
+
+
+def default_models_cache_path() -> Path:
+    return Path.home() / ".geoff" / "cache" / "models.json"
+
+
+@dataclass
+class CachedModels:
+    models: List[str]
+    fetched_at: float
+
+    def is_fresh(self, ttl: float, now: Optional[float] = None) -> bool:
+        age = (time.time() if now is None else now) - self.fetched_at
+        # A clock that went backwards makes the entry stale, not immortal.
+        return 0 <= age < ttl
+
+
+class ModelsCache:
+    """Reads and writes the cached model list.
+
+    Args:
+        path: Cache file (defaults to ~/.geoff/cache/models.json)
+        ttl: Seconds after fetching before the list is refreshed
+    """
+
+    def __init__(self, path: Optional[Path] = None, ttl: float = MODELS_CACHE_TTL):
+        self.path = Path(path) if path is not None else default_models_cache_path()
+        self.ttl = ttl
+
+    def load(self) -> Optional[CachedModels]:
+        """Return the cached list, stale or not, or None if there is none."""
+        try:
+            data = json.loads(self.path.read_bytes())
+            if data.get("geoff_version") != __version__:
+                return None
+            models = data["models"]
+            if not all(isinstance(model, str) for model in models):
+                return None
+            return CachedModels(list(models), float(data["fetched_at"]))
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            return None
+
+    def store(self, models: List[str], now: Optional[float] = None) -> None:
+        data = json.dumps(
+            {
+                "geoff_version": __version__,
+                "fetched_at": time.time() if now is None else now,
+                "models": models,
+            },
+            separators=(",", ":"),
+        ).encode("utf-8")
+        try:
+            # Only a cache: no fsync, and failures just mean a slower open.
+            atomic_write(self.path, data, sync=False)
+        except OSError:
+            pass
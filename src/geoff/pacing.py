@@ -0,0 +1,88 @@
+"""Pacing policies: how long the loop waits between iterations.
+
+A fixed pause wastes time after productive iterations and is too short when
+the provider is rate-limiting. ``AdaptivePacing`` goes straight on after an
+iteration that changed the repo and backs off exponentially, with jitter,
+after failures or stuck iterations.
+"""
+
+import random
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from geoff.config import PromptConfig
+
+# Doubling past this is beyond any sensible max_delay, and would
+# eventually overflow a float in a long-running loop.
+MAX_BACKOFF_EXPONENT = 32
+
+
+class PacingPolicy(ABC):
+    """Decide the pause after an iteration. Subclasses may keep state."""
+
+    @abstractmethod
+    def delay(self, changed: bool, failed: bool) -> float:
+        pass
+
+    @abstractmethod
+    def clone(self) -> "PacingPolicy":
+        """Fresh copy with reset state, for another concurrent loop."""
+        pass
+
+
+class FixedPacing(PacingPolicy):
+    """Always wait the same number of seconds."""
+
+    def __init__(self, seconds: float = 2.0):
+        self.seconds = seconds
+
+    def delay(self, changed: bool, failed: bool) -> float:
+        return self.seconds
+
+    def clone(self) -> "FixedPacing":
+        return FixedPacing(self.seconds)
+
+
+class AdaptivePacing(PacingPolicy):
+    """No delay after productive iterations, exponential backoff otherwise.
+
+    The n-th consecutive unproductive or failed iteration waits
+    ``base_delay * 2 ** (n - 1)`` seconds, capped at ``max_delay``, reduced
+    by up to ``jitter`` (a fraction) so concurrent loops do not retry in
+    lockstep.
+    """
+
+    def __init__(
+        self,
+        base_delay: float = 2.0,
+        max_delay: float = 300.0,
+        jitter: float = 0.5,
+        rng: Optional[random.Random] = None,
+    ):
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.rng = rng or random.Random()
+        self.failures = 0
+
+    def delay(self, changed: bool, failed: bool) -> float:
+        if changed and not failed:
+            self.failures = 0
+            return 0.0
+        self.failures += 1
+        exponent = min(self.failures - 1, MAX_BACKOFF_EXPONENT)
+        backoff = min(self.max_delay, self.base_delay * 2**exponent)
+        return backoff * (1 - self.jitter * self.rng.random())
+
+    def clone(self) -> "AdaptivePacing":
+        return AdaptivePacing(self.base_delay, self.max_delay, self.jitter)
+
+
+def pacing_from_config(config: PromptConfig) -> PacingPolicy:
+    if config.pacing == "fixed":
+        return FixedPacing(config.pacing_base_delay)
+    return AdaptivePacing(
+        base_delay=config.pacing_base_delay,
+        max_delay=config.pacing_max_delay,
+        jitter=config.pacing_jitter,
+    )
@@ -0,0 +1,263 @@
+import asyncio
+import shutil
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from geoff.async_executor import _run_loop_async
+from geoff.executor import LoopSummary
+from geoff.loop_state import LoopCheckpoint, LoopState, default_state_path
+from geoff.pacing import PacingPolicy
+from geoff.run_lock import RunLock, RunLockError, default_lock_path
+from geoff.run_log import RunRecorder
+from geoff.state_dir import ensure_state_dir
+
+
+class WorktreeError(Exception):
+    """Raised when worker worktrees cannot be prepared."""
+
+    pass
+
+
+@dataclass
+class WorkerResult:
+    """Per-worker outcome of a parallel loop run."""
+
+    worker: int
+    worktree: Path
+    summary: LoopSummary = field(default_factory=LoopSummary)
+    error: Optional[str] = None
+
+
+def _git(args: List[str], cwd: Path) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        ["git", *args], cwd=cwd, capture_output=True, text=True, check=True
+    )
+
+
+def repo_root(repo_dir: Path) -> Path:
+    """Return the top level of the git repository containing ``repo_dir``."""
+    try:
+        return Path(_git(["rev-parse", "--show-toplevel"], repo_dir).stdout.strip())
+    except (subprocess.CalledProcessError, FileNotFoundError) as e:
+        raise WorktreeError(f"Not a git repository: {repo_dir}") from e
+
+
+def create_worktree(root: Path, name: str) -> Path:
+    """Create (or reuse) ``.geoff/worktrees/<name>`` on branch ``geoff/<name>``."""
+    path = ensure_state_dir(root) / "worktrees" / name
+    branch = f"geoff/{name}"
+    if (path / ".git").exists():
+        return path
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        _git(["rev-parse", "--verify", "--quiet", f"refs/heads/{branch}"], root)
+        args = ["worktree", "add", str(path), branch]
+    except subprocess.CalledProcessError:
+        args = ["worktree", "add", "-b", branch, str(path), "HEAD"]
+    try:
+        _git(args, root)
+    except subprocess.CalledProcessError as e:
+        raise WorktreeError(
+            f"Failed to create worktree {path}: {e.stderr.strip()}"
+        ) from e
+    return path
+
+
+def create_worktrees(repo_dir: Path, count: int) -> List[Path]:
+    """Create (or reuse) ``count`` git worktrees for parallel workers.
+
+    Worktrees live under ``.geoff/worktrees/worker-N`` in the repository root,
+    each on its own ``geoff/worker-N`` branch so that commits made by one
+    worker never land on another worker's checkout. Existing worktrees and
+    branches are reused so work from a previous run is not discarded.
+    """
+    root = repo_root(repo_dir)
+    return [create_worktree(root, f"worker-{n}") for n in range(1, count + 1)]
+
+
+def copy_missing_files(paths: Sequence[str], source: Path, directory: Path) -> None:
+    """Copy the files in ``paths`` that ``directory`` lacks from ``source``.
+
+    A fresh worktree only has committed files. Absolute paths and paths
+    leading out of ``directory`` already resolve the same from anywhere and
+    are left alone, as are files that exist, which keeps a worker's edits.
+    """
+    for rel in paths:
+        if not rel or Path(rel).is_absolute() or ".." in Path(rel).parts:
+            continue
+        src = source / rel
+        dest = directory / rel
+        if dest.exists() or not src.is_file():
+            continue
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(src, dest)
+
+
+def execute_opencode_parallel(
+    prompt: str,
+    workers: int,
+    max_iterations: int = 0,
+    max_stuck: int = 2,
+    max_frozen: int = 0,
+    exec_dir: Optional[Path] = None,
+    model: Optional[str] = None,
+    change_detection: str = "hash",
+    recorder: Optional[RunRecorder] = None,
+    pacing: Optional[PacingPolicy] = None,
+    checkpoint: bool = False,
+    shared_files: Sequence[str] = (),
+) -> List[WorkerResult]:
+    """Execute independent Opencode loops in ``workers`` git worktrees.
+
+    Every worker runs the same prompt with its own change detection and
+    stuck counter, so ``max_iterations`` and ``max_stuck`` apply per worker.
+    Workers do not coordinate: with a tasklist prompt each one picks its
+    own task, so several may pick the same one, and nothing merges their
+    ``geoff/worker-N`` branches back.
+    Each worker holds its worktree's run lock; a worktree that another loop
+    is already running in stops only that worker, with stop_reason "error".
+    All workers are supervised by one asyncio event loop; Ctrl-C terminates
+    their running agents.
+
+    Args:
+        prompt: The assembled prompt to execute
+        workers: Number of concurrent loops (one worktree each)
+        max_iterations: 0 for no limit, otherwise max iterations per worker
+        max_stuck: Consecutive iterations with no changes before a worker stops
+        max_frozen: Minutes without output before killing an iteration (0 disables)
+        exec_dir: Repository to create worktrees from (defaults to cwd)
+        change_detection: "hash" or "inotify", applied to each worktree
+        recorder: Run logs and telemetry; each worker records into its own
+            ``worker-N`` subdirectory (None disables)
+        pacing: Pause policy between iterations; each worker gets a fresh copy
+        checkpoint: Checkpoint each worker to ``.geoff/loop-state`` in its
+            worktree, so ``geoff resume`` run there continues that worker
+        shared_files: Paths, relative to ``exec_dir``, copied into each
+            worktree that lacks them (see prompt_builder.prompt_files)
+
+    Returns:
+        One WorkerResult per worker, in worker order.
+    """
+    cwd = exec_dir or Path.cwd()
+
+    try:
+        worktrees = create_worktrees(cwd, workers)
+    except WorktreeError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(
+        f"Starting parallel loop execution (workers={workers}, "
+        f"max_iterations={max_iterations}, max_stuck={max_stuck}, "
+        f"max_frozen={max_frozen})"
+    )
+
+    results = [
+        WorkerResult(worker=n, worktree=path) for n, path in enumerate(worktrees, 1)
+    ]
+    for result in results:
+        try:
+            copy_missing_files(shared_files, cwd, result.worktree)
+        except OSError as e:
+            result.error = str(e)
+            result.summary.stop_reason = "error"
+
+    def worker_checkpoint(
+        result: WorkerResult, worker_recorder: Optional[RunRecorder]
+    ) -> Optional[LoopCheckpoint]:
+        if not checkpoint:
+            return None
+        state = LoopState(
+            prompt=prompt,
+            max_iterations=max_iterations,
+            max_stuck=max_stuck,
+            max_frozen=max_frozen,
+            model=model,
+            change_detection=change_detection,
+            run_dir=str(worker_recorder.run_dir) if worker_recorder else None,
+        )
+        return LoopCheckpoint(default_state_path(result.worktree), state)
+
+    async def run_worker(result: WorkerResult) -> None:
+        if result.error:
+            return
+        # Another geoff loop in this worktree would fight over its files.
+        ensure_state_dir(result.worktree)
+        run_lock = RunLock(default_lock_path(result.worktree))
+        try:
+            run_lock.acquire()
+        except RunLockError as e:
+            result.error = str(e)
+            result.summary.stop_reason = "error"
+            return
+        worker_recorder = recorder.for_worker(result.worker) if recorder else None
+        loop_checkpoint = worker_checkpoint(result, worker_recorder)
+        try:
+            if loop_checkpoint is not None:
+                loop_checkpoint.update(0, 0)
+            await _run_loop_async(
+                prompt,
+                result.worktree,
+                result.summary,
+                max_iterations=max_iterations,
+                max_stuck=max_stuck,
+                max_frozen=max_frozen,
+                model=model,
+                change_detection=change_detection,
+                label=f"[worker {result.worker}] ",
+                recorder=worker_recorder,
+                pacing=pacing.clone() if pacing else None,
+                checkpoint=loop_checkpoint,
+            )
+        except asyncio.CancelledError:
+            result.summary.stop_reason = "cancelled"
+            raise
+        except FileNotFoundError:
+            result.error = "'opencode' command not found"
+            result.summary.stop_reason = "error"
+        except Exception as e:
+            result.error = str(e)
+            result.summary.stop_reason = "error"
+        finally:
+            if loop_checkpoint is not None:
+                loop_checkpoint.update(
+                    result.summary.iterations,
+                    result.summary.stuck_count,
+                    status=result.summary.stop_reason or "cancelled",
+                )
+            run_lock.release()
+
+    async def run_workers() -> None:
+        await asyncio.gather(*(run_worker(result) for result in results))
+
+    try:
+        asyncio.run(run_workers())
+    except KeyboardInterrupt:
+        print("\nParallel loop cancelled by user")
+
+    print(format_parallel_summary(results, cwd))
+    return results
+
+
+def format_parallel_summary(results: List[WorkerResult], root: Path) -> str:
+    """Render per-worker and total iteration counts."""
+    lines = ["", "Parallel run summary:"]
+    for result in results:
+        try:
+            location = result.worktree.relative_to(root)
+        except ValueError:
+            location = result.worktree
+        status = result.summary.stop_reason or "stopped"
+        if result.error:
+            status = f"error: {result.error}"
+        lines.append(
+            f"  worker {result.worker} ({location}): "
+            f"{result.summary.iterations} iteration(s), {status}"
+        )
+    total = sum(result.summary.iterations for result in results)
+    lines.append(f"Total iterations: {total}")
+    return "\n".join(lines)
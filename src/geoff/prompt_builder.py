@@ -1,48 +1,168 @@
+from typing import Callable, List, Optional, Tuple
+
 from geoff.config import PromptConfig
+from geoff.templates import render_template
 
 
-def build_prompt(config: PromptConfig) -> str:
-    lines = []
+def _breadcrumbs_file(config: PromptConfig) -> str:
+    """The breadcrumbs path, or "" when breadcrumbs are off."""
+    if config.breadcrumb_enabled:
+        return config.breadcrumbs_file.strip()
+    return ""
+
+
+def _tasklist_file(config: PromptConfig) -> str:
+    """The tasklist path, or "" when not in tasklist mode."""
+    if config.task_mode == "tasklist":
+        return config.tasklist_file.strip()
+    return ""
+
+
+def prompt_files(config: PromptConfig) -> List[str]:
+    """Files the built prompt tells the agent to study, check or update."""
+    files = [doc.strip() for doc in config.study_docs if doc and doc.strip()]
+    files.extend(f for f in (_tasklist_file(config), _breadcrumbs_file(config)) if f)
+    return files
+
+
+# Each section is rendered from its key alone, so an unchanged key means an
+# unchanged section. Keys copy mutable fields: widgets edit lists in place.
 
-    # 1. Orientation / Study Docs
-    for doc in config.study_docs:
-        if doc and doc.strip():
-            lines.append(f"study {doc.strip()}")
 
+def _study_docs_key(config: PromptConfig) -> tuple:
+    return (tuple(config.study_docs), _breadcrumbs_file(config))
+
+
+def _study_docs_lines(key: tuple) -> List[str]:
+    study_docs, breadcrumbs = key
+    # 1. Orientation / Study Docs
+    lines = [f"study {doc.strip()}" for doc in study_docs if doc and doc.strip()]
     # Breadcrumbs check line
-    if config.breadcrumb_enabled and config.breadcrumbs_file.strip():
-        lines.append(f"check {config.breadcrumbs_file.strip()}")
+    if breadcrumbs:
+        lines.append(f"check {breadcrumbs}")
+    return lines
 
-    # 2. Task Source
+
+def _task_source_key(config: PromptConfig) -> tuple:
     if config.task_mode == "tasklist":
-        if config.tasklist_file.strip():
-            lines.append(
-                config.prompt_tasklist_study.format(
-                    tasklist=config.tasklist_file.strip()
-                )
-            )
-    elif config.task_mode == "oneoff":
-        if config.oneoff_prompt.strip():
-            lines.append(config.oneoff_prompt.strip())
+        return ("tasklist", _tasklist_file(config), config.prompt_tasklist_study)
+    if config.task_mode == "oneoff":
+        return ("oneoff", config.oneoff_prompt.strip())
+    return (config.task_mode,)
+
+
+def _task_source_lines(key: tuple) -> List[str]:
+    # 2. Task Source
+    if key[0] == "tasklist":
+        _, tasklist, template = key
+        return [render_template(template, "tasklist", tasklist)] if tasklist else []
+    if key[0] == "oneoff":
+        return [key[1]] if key[1] else []
+    return []
+
+
+def _backpressure_key(config: PromptConfig) -> tuple:
+    if not config.backpressure_enabled:
+        return (False,)
+    return (
+        True,
+        config.prompt_backpressure_header,
+        tuple(config.prompt_backpressure_lines),
+    )
 
+
+def _backpressure_lines(key: tuple) -> List[str]:
     # 3. Backpressure
-    if config.backpressure_enabled:
-        lines.append(config.prompt_backpressure_header)
-        for line in config.prompt_backpressure_lines:
-            lines.append(line)
+    if not key[0]:
+        return []
+    _, header, lines = key
+    return [header, *lines]
+
+
+def _breadcrumb_key(config: PromptConfig) -> tuple:
+    breadcrumbs = _breadcrumbs_file(config)
+    if not breadcrumbs:
+        return ("",)
+    return (breadcrumbs, config.prompt_breadcrumb_instruction)
 
+
+def _breadcrumb_lines(key: tuple) -> List[str]:
     # 4. Breadcrumb Instruction
-    if config.breadcrumb_enabled and config.breadcrumbs_file.strip():
-        lines.append(
-            config.prompt_breadcrumb_instruction.format(
-                breadcrumbs=config.breadcrumbs_file.strip()
-            )
-        )
+    if not key[0]:
+        return []
+    breadcrumbs, template = key
+    return [render_template(template, "breadcrumbs", breadcrumbs)]
+
+
+def _task_update_key(config: PromptConfig) -> tuple:
+    tasklist = _tasklist_file(config)
+    if not tasklist:
+        return ("",)
+    return (tasklist, config.prompt_tasklist_update)
 
+
+def _task_update_lines(key: tuple) -> List[str]:
     # 5. Task Update
-    if config.task_mode == "tasklist" and config.tasklist_file.strip():
-        lines.append(
-            config.prompt_tasklist_update.format(tasklist=config.tasklist_file.strip())
-        )
+    if not key[0]:
+        return []
+    tasklist, template = key
+    return [render_template(template, "tasklist", tasklist)]
+
+
+SECTIONS: Tuple[
+    Tuple[str, Callable[[PromptConfig], tuple], Callable[[tuple], List[str]]], ...
+] = (
+    ("study_docs", _study_docs_key, _study_docs_lines),
+    ("task_source", _task_source_key, _task_source_lines),
+    ("backpressure", _backpressure_key, _backpressure_lines),
+    ("breadcrumb", _breadcrumb_key, _breadcrumb_lines),
+    ("task_update", _task_update_key, _task_update_lines),
+)
 
+
+def build_prompt(config: PromptConfig) -> str:
+    lines = []
+    for _, key, render in SECTIONS:
+        lines.extend(render(key(config)))
     return "\n".join(lines)
+
+
+_UNSET = object()
+
+
+class PromptCompiler:
+    """Incremental build_prompt for the live preview.
+
+    Keeps the rendered text of each section together with the inputs it was
+    rendered from, and on each compile re-renders only the sections whose
+    inputs changed. The output is always identical to build_prompt.
+    """
+
+    def __init__(self):
+        self._keys: List[object] = [_UNSET] * len(SECTIONS)
+        # None for a section that renders no lines (as opposed to one empty
+        # line), so joining segments matches joining all lines.
+        self._segments: List[Optional[str]] = [None] * len(SECTIONS)
+        self._prompt = ""
+        # Names of the sections re-rendered by the last compile.
+        self.recomputed: Tuple[str, ...] = ()
+
+    def compile(self, config: PromptConfig) -> str:
+        recomputed = []
+        for i, (name, key_fn, render) in enumerate(SECTIONS):
+            key = key_fn(config)
+            if key == self._keys[i]:
+                continue
+            lines = render(key)
+            self._keys[i] = key
+            self._segments[i] = "\n".join(lines) if lines else None
+            recomputed.append(name)
+
+        self.recomputed = tuple(recomputed)
+        if recomputed:
+            self._prompt = "\n".join(s for s in self._segments if s is not None)
+        return self._prompt
+
+    def invalidate(self) -> None:
+        """Forget all cached sections."""
+        self._keys = [_UNSET] * len(SECTIONS)
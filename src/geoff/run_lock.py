@@ -0,0 +1,108 @@
+"""Exclusive run lock for agent loops in ``.geoff/run.lock``.
+
+Two loops in one working tree see each other's edits as their own progress
+and corrupt each other's stuck detection, so each loop holds an exclusive
+``flock`` on the tree's lock file for its whole lifetime. The holder
+writes its PID and start time into the file; a second loop fails fast and
+reports them. The kernel drops the lock when the holder exits, however it
+exits, so there is never a stale lock to clean up.
+"""
+
+import json
+import os
+import socket
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: loops are not serialised
+    fcntl = None
+
+
+class RunLockError(Exception):
+    """Raised when another loop already holds the run lock."""
+
+    pass
+
+
+@dataclass
+class LockHolder:
+    pid: int
+    started_at: float
+    host: str = ""
+
+    def describe(self) -> str:
+        started = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.started_at))
+        where = f" on {self.host}" if self.host else ""
+        return f"pid {self.pid}{where}, started {started}"
+
+
+def default_lock_path(root: Path) -> Path:
+    return Path(root) / ".geoff" / "run.lock"
+
+
+def _read_holder(fd: int) -> Optional[LockHolder]:
+    try:
+        data = json.loads(os.pread(fd, 4096, 0))
+        return LockHolder(**data)
+    except (OSError, ValueError, TypeError):
+        # Empty while the holder is still writing it, or not ours.
+        return None
+
+
+class RunLock:
+    """Exclusive, non-blocking lock on one working tree.
+
+    Usable as a context manager; ``acquire`` raises RunLockError naming
+    the current holder when the lock is taken.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._fd: Optional[int] = None
+
+    @property
+    def held(self) -> bool:
+        return self._fd is not None
+
+    def acquire(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        if fcntl is not None:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                holder = _read_holder(fd)
+                os.close(fd)
+                detail = holder.describe() if holder else "holder unknown"
+                raise RunLockError(
+                    f"Another geoff loop is already running here ({detail}); "
+                    f"it holds {self.path}"
+                ) from None
+
+        holder = LockHolder(os.getpid(), time.time(), socket.gethostname())
+        os.ftruncate(fd, 0)
+        os.pwrite(fd, json.dumps(asdict(holder)).encode("utf-8"), 0)
+        self._fd = fd
+
+    def release(self) -> None:
+        if self._fd is None:
+            return
+        # Leave the file in place: after an unlink, a process that had
+        # already opened the old file could lock it while a newcomer locks
+        # a fresh one.
+        try:
+            os.ftruncate(self._fd, 0)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> "RunLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
@@ -0,0 +1,273 @@
+"""Per-run output logs and telemetry for loop runs.
+
+Each loop run gets ``.geoff/runs/<run-id>/``. ``iterations.jsonl`` holds one
+telemetry record per iteration and each iteration's combined stdout/stderr
+goes to ``iter-NNNN.log.gz``. Output is buffered up to a fixed size and
+then written as an independent gzip member, so memory use stays bounded and
+the file is valid gzip at every member boundary. A sidecar
+``iter-NNNN.log.idx`` records, per member, the first line that starts in it
+and where that member begins, so any line can be reached by decompressing a
+single member instead of the whole file.
+"""
+
+import gzip
+import json
+import os
+import shutil
+import struct
+import time
+import zlib
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+from geoff.state_dir import ensure_state_dir
+
+RUNS_DIR = Path(".geoff") / "runs"
+DEFAULT_FLUSH_BYTES = 256 * 1024
+COMPRESS_LEVEL = 6
+TELEMETRY_FILE = "iterations.jsonl"
+
+# (first line number, compressed offset of the member, offset of that line
+# within the member's uncompressed data)
+_INDEX_ENTRY = struct.Struct(">QQQ")
+
+
+def new_run_id() -> str:
+    return time.strftime("%Y%m%d-%H%M%S") + f"-{os.getpid()}"
+
+
+def create_run_dir(root: Path, run_id: Optional[str] = None) -> Path:
+    ensure_state_dir(root)
+    run_dir = Path(root) / RUNS_DIR / (run_id or new_run_id())
+    run_dir.mkdir(parents=True, exist_ok=True)
+    return run_dir
+
+
+def iteration_log_path(run_dir: Path, iteration: int) -> Path:
+    return run_dir / f"iter-{iteration:04d}.log.gz"
+
+
+def index_path_for(log_path: Path) -> Path:
+    return log_path.with_name(log_path.name[: -len(".gz")] + ".idx")
+
+
+def prune_runs(root: Path, keep: int) -> List[Path]:
+    """Delete all but the ``keep`` newest run directories (0 keeps all)."""
+    runs_root = Path(root) / RUNS_DIR
+    if keep <= 0 or not runs_root.is_dir():
+        return []
+    runs = sorted(
+        (p for p in runs_root.iterdir() if p.is_dir()),
+        key=lambda p: p.stat().st_mtime_ns,
+    )
+    removed = runs[: max(len(runs) - keep, 0)]
+    for run in removed:
+        shutil.rmtree(run, ignore_errors=True)
+    return removed
+
+
+def enforce_run_size(run_dir: Path, max_bytes: int) -> List[Path]:
+    """Rotate out the oldest iteration logs until the run fits ``max_bytes``.
+
+    The newest log is always kept, even if it alone exceeds the limit.
+    """
+    if max_bytes <= 0:
+        return []
+    logs = sorted(run_dir.glob("iter-*.log.gz"))
+    sizes = {}
+    for log in logs:
+        try:
+            sizes[log] = log.stat().st_size + index_path_for(log).stat().st_size
+        except OSError:
+            sizes[log] = 0
+    total = sum(sizes.values())
+    removed = []
+    for log in logs[:-1]:
+        if total <= max_bytes:
+            break
+        for path in (log, index_path_for(log)):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+        total -= sizes[log]
+        removed.append(log)
+    return removed
+
+
+class IterationLog:
+    """Stream one iteration's raw output into a gzip log plus line index."""
+
+    def __init__(self, path: Path, flush_bytes: int = DEFAULT_FLUSH_BYTES):
+        self.path = Path(path)
+        self.flush_bytes = flush_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._data: BinaryIO = open(self.path, "wb")
+        self._index: BinaryIO = open(index_path_for(self.path), "wb")
+        self._buffer = bytearray()
+        self._lines = 0
+        self._at_line_start = True
+        self.bytes_written = 0
+
+    def write(self, data: bytes) -> None:
+        self._buffer += data
+        self.bytes_written += len(data)
+        while len(self._buffer) >= self.flush_bytes:
+            # Prefer member boundaries on line boundaries so index entries
+            # point at the start of a member.
+            cut = self._buffer.rfind(b"\n", 0, self.flush_bytes) + 1
+            self._flush_member(cut or self.flush_bytes)
+
+    def _flush_member(self, size: int) -> None:
+        chunk = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        if not chunk:
+            return
+
+        if self._at_line_start:
+            first_line, line_offset = self._lines, 0
+        else:
+            # The member continues a line; index the first line starting in it.
+            first_line, line_offset = self._lines + 1, chunk.find(b"\n") + 1
+        if self._at_line_start or 0 < line_offset < len(chunk):
+            self._index.write(
+                _INDEX_ENTRY.pack(first_line, self._data.tell(), line_offset)
+            )
+
+        compressor = zlib.compressobj(COMPRESS_LEVEL, zlib.DEFLATED, 31)
+        self._data.write(compressor.compress(chunk) + compressor.flush())
+        self._lines += chunk.count(b"\n")
+        self._at_line_start = chunk.endswith(b"\n")
+
+    def flush(self) -> None:
+        self._flush_member(len(self._buffer))
+        self._data.flush()
+        self._index.flush()
+
+    def close(self) -> None:
+        if self._data.closed:
+            return
+        self.flush()
+        self._data.close()
+        self._index.close()
+
+    def __enter__(self) -> "IterationLog":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def read_index(log_path: Path) -> List[Tuple[int, int, int]]:
+    try:
+        data = index_path_for(Path(log_path)).read_bytes()
+    except FileNotFoundError:
+        return []
+    usable = len(data) - len(data) % _INDEX_ENTRY.size
+    return [
+        _INDEX_ENTRY.unpack_from(data, offset)
+        for offset in range(0, usable, _INDEX_ENTRY.size)
+    ]
+
+
+def iter_log_lines(log_path: Path, start_line: int = 0) -> Iterator[bytes]:
+    """Yield lines (with newlines) from ``start_line`` onwards.
+
+    Seeks to the nearest indexed member at or before ``start_line`` and only
+    decompresses from there.
+    """
+    entries = read_index(log_path)
+    line, offset, skip = 0, 0, 0
+    for entry in entries:
+        if entry[0] > start_line:
+            break
+        line, offset, skip = entry
+
+    with open(log_path, "rb") as f:
+        f.seek(offset)
+        with gzip.GzipFile(fileobj=f, mode="rb") as gz:
+            gz.read(skip)
+            for current, text in enumerate(gz, start=line):
+                if current >= start_line:
+                    yield text
+
+
+@dataclass
+class IterationRecord:
+    """Telemetry for one loop iteration (one line of iterations.jsonl)."""
+
+    iteration: int
+    started_at: float
+    ended_at: float
+    agent_seconds: float
+    hash_seconds: float
+    output_bytes: Optional[int]
+    exit_code: Optional[int]
+    frozen: bool
+    stuck_count: int
+    changed: bool
+    # None when the change detector cannot say which paths changed.
+    changed_paths: Optional[List[str]] = None
+    # Pause chosen by the pacing policy before the next iteration.
+    delay_seconds: Optional[float] = None
+
+
+class RunRecorder:
+    """Owns a run directory: iteration logs plus the telemetry stream."""
+
+    def __init__(
+        self,
+        run_dir: Path,
+        log_output: bool = True,
+        telemetry: bool = True,
+        log_max_run_bytes: int = 0,
+    ):
+        self.run_dir = Path(run_dir)
+        self.log_output = log_output
+        self.telemetry = telemetry
+        self.log_max_run_bytes = log_max_run_bytes
+        self.run_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def telemetry_path(self) -> Path:
+        return self.run_dir / TELEMETRY_FILE
+
+    def for_worker(self, worker: int) -> "RunRecorder":
+        """Recorder for one of several concurrent loops sharing this run."""
+        return RunRecorder(
+            self.run_dir / f"worker-{worker}",
+            log_output=self.log_output,
+            telemetry=self.telemetry,
+            log_max_run_bytes=self.log_max_run_bytes,
+        )
+
+    def open_log(self, iteration: int) -> Optional[IterationLog]:
+        if not self.log_output:
+            return None
+        return IterationLog(iteration_log_path(self.run_dir, iteration))
+
+    def close_log(self, log: Optional[IterationLog]) -> None:
+        if log is None:
+            return
+        log.close()
+        enforce_run_size(self.run_dir, self.log_max_run_bytes)
+
+    def record(self, record: IterationRecord) -> None:
+        if not self.telemetry:
+            return
+        # One short append per iteration keeps the file valid after a crash.
+        with open(self.telemetry_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(asdict(record), separators=(",", ":")) + "\n")
+
+
+def read_telemetry(path: Path) -> List[IterationRecord]:
+    """Load iteration records, skipping a torn final line."""
+    records = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                records.append(IterationRecord(**json.loads(line)))
+            except (ValueError, TypeError):
+                continue
+    return records
@@ -0,0 +1,38 @@
+"""geoff's per-repository state directory, ``.geoff``.
+
+Run logs, caches, worktrees, checkpoints and locks are local to one
+machine, so the directory carries its own ``.gitignore`` that keeps them
+out of ``git status`` and ``git add -A``. ``geoff.yaml`` is not ignored:
+a repository may commit its geoff config.
+"""
+
+from pathlib import Path
+
+STATE_DIR = ".geoff"
+
+STATE_GITIGNORE = """\
+# Written by geoff: machine-local state that should not be committed.
+runs/
+cache/
+worktrees/
+loop-state
+*.lock
+*.tmp
+"""
+
+
+def ensure_state_dir(root: Path) -> Path:
+    """Create ``root/.geoff`` with its ``.gitignore`` and return its path.
+
+    An existing ``.gitignore`` is left alone, so local edits survive.
+    """
+    state_dir = Path(root) / STATE_DIR
+    state_dir.mkdir(parents=True, exist_ok=True)
+    gitignore = state_dir / ".gitignore"
+    if not gitignore.exists():
+        try:
+            with open(gitignore, "x", encoding="utf-8") as f:
+                f.write(STATE_GITIGNORE)
+        except FileExistsError:
+            pass
+    return state_dir
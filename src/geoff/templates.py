@@ -0,0 +1,114 @@
+"""Prompt templates compiled to literal/placeholder segments.
+
+``prompt_tasklist_study``, ``prompt_tasklist_update`` and
+``prompt_breadcrumb_instruction`` are ``str.format`` templates. Each one is
+parsed once into a tuple of segments, so rendering is a join, and a
+placeholder the template cannot use (a typo such as ``{taskilst}``) is
+reported by the validator instead of raising ``KeyError`` while the user
+types.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from string import Formatter
+from typing import Dict, List, Optional, Tuple
+
+from geoff.config import PromptConfig
+
+# Template config keys and the one placeholder each may use.
+TEMPLATE_PLACEHOLDERS: Dict[str, str] = {
+    "prompt_tasklist_study": "tasklist",
+    "prompt_tasklist_update": "tasklist",
+    "prompt_breadcrumb_instruction": "breadcrumbs",
+}
+
+
+class TemplateError(Exception):
+    """Raised when a prompt template cannot be compiled."""
+
+    pass
+
+
+@dataclass(frozen=True)
+class Segment:
+    literal: str
+    # Placeholder rendered after the literal, if any.
+    field: Optional[str] = None
+    conversion: Optional[str] = None
+    format_spec: str = ""
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    source: str
+    segments: Tuple[Segment, ...]
+
+    def render(self, value: str) -> str:
+        """Render with ``value`` substituted for the placeholder."""
+        parts = []
+        for segment in self.segments:
+            parts.append(segment.literal)
+            if segment.field is None:
+                continue
+            if segment.conversion or segment.format_spec:
+                parts.append(_format_field(value, segment))
+            else:
+                parts.append(value)
+        return "".join(parts)
+
+
+def _format_field(value: str, segment: Segment) -> str:
+    converted = {"r": repr, "s": str, "a": ascii}[segment.conversion or "s"](value)
+    return format(converted, segment.format_spec)
+
+
+@lru_cache(maxsize=64)
+def compile_template(source: str, placeholder: str) -> CompiledTemplate:
+    """Parse ``source`` once; later calls with the same text are free.
+
+    Raises:
+        TemplateError: If the template is malformed or uses any placeholder
+            other than ``placeholder``.
+    """
+    segments = []
+    try:
+        for literal, field, spec, conversion in Formatter().parse(source):
+            if field is None:
+                segments.append(Segment(literal))
+                continue
+            if field != placeholder:
+                shown = "{" + field + "}" if field else "{}"
+                raise TemplateError(
+                    f"unknown placeholder {shown} (expected {{{placeholder}}})"
+                )
+            if conversion not in (None, "r", "s", "a"):
+                raise TemplateError(f"unknown conversion !{conversion}")
+            if spec and "{" in spec:
+                raise TemplateError("nested placeholders are not supported")
+            segments.append(Segment(literal, field, conversion, spec or ""))
+    except ValueError as e:
+        raise TemplateError(str(e)) from e
+    return CompiledTemplate(source, tuple(segments))
+
+
+def render_template(source: str, placeholder: str, value: str) -> str:
+    """Render a template, or return it verbatim if it does not compile.
+
+    The live preview renders on every keystroke, so a broken template is
+    shown as written; the validator reports it before anything is run.
+    """
+    try:
+        return compile_template(source, placeholder).render(value)
+    except (TemplateError, ValueError):
+        return source
+
+
+def template_errors(config: PromptConfig) -> List[str]:
+    """Compile the config's templates and describe any that fail."""
+    errors = []
+    for key, placeholder in TEMPLATE_PLACEHOLDERS.items():
+        try:
+            compile_template(getattr(config, key), placeholder)
+        except TemplateError as e:
+            errors.append(f"Invalid template {key}: {e}")
+    return errors
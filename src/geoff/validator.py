@@ -1,58 +1,154 @@
+import os
+import time
 from pathlib import Path
-from typing import List
+from typing import Callable, Dict, Hashable, Iterator, List, Optional, Set, Tuple
 
 from geoff.config import PromptConfig
+from geoff.templates import TEMPLATE_PLACEHOLDERS, template_errors
+
+# How long a path existence check is trusted. Long enough that one edit
+# (or a Run) never stats the same file twice, short enough that files
+# created or deleted outside geoff show up within a refresh.
+PATH_CACHE_TTL = 1.0
+
+# Config fields checked by check_settings, which touches no files.
+SETTINGS_FIELDS: Tuple[str, ...] = (
+    "max_iterations",
+    "max_stuck",
+    "max_frozen",
+    "parallel_workers",
+    "batch_concurrency",
+    "log_retain_runs",
+    "log_max_run_mb",
+    "pacing",
+    "pacing_base_delay",
+    "pacing_max_delay",
+    "pacing_jitter",
+    "config_save_debounce",
+    *TEMPLATE_PLACEHOLDERS,
+)
+
+
+class PathCache:
+    """Remembers whether paths exist for ``ttl`` seconds."""
+
+    def __init__(
+        self, ttl: float = PATH_CACHE_TTL, clock: Callable[[], float] = time.monotonic
+    ):
+        self.ttl = ttl
+        self.clock = clock
+        self._entries: Dict[Path, Tuple[float, bool]] = {}
+
+    def exists(self, path: Path) -> bool:
+        now = self.clock()
+        cached = self._entries.get(path)
+        if cached is not None and now - cached[0] < self.ttl:
+            return cached[1]
+        # Raises like Path.exists for paths that cannot be checked at all.
+        exists = path.exists()
+        self._entries[path] = (now, exists)
+        return exists
+
+    def invalidate(self, path: Optional[Path] = None) -> None:
+        """Forget ``path``, or every path."""
+        if path is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(path, None)
 
 
 class PromptValidator:
-    def __init__(self, execution_dir: Path | None = None):
+    def __init__(
+        self,
+        execution_dir: Path | None = None,
+        path_cache: Optional[PathCache] = None,
+    ):
         self.execution_dir = execution_dir or Path.cwd()
+        self.path_cache = path_cache
 
-    def validate(self, config: PromptConfig) -> List[str]:
-        errors: List[str] = []
+    def _exists(self, path: Path) -> bool:
+        if self.path_cache is None:
+            return path.exists()
+        return self.path_cache.exists(path)
+
+    def validate(self, config: PromptConfig, create: bool = True) -> List[str]:
+        """Check the whole config before a run.
 
+        Args:
+            config: Config to check
+            create: Create a missing breadcrumbs file, which the agent
+                appends to. Pass False to check without writing anything.
+        """
+        errors: List[str] = []
         for doc in config.study_docs:
-            if not doc or not doc.strip():
-                errors.append("Study doc path cannot be empty")
-            else:
-                doc_path = self.execution_dir / doc
-                if not doc_path.exists():
-                    errors.append(f"Study doc file not found: {doc}")
-
-        if config.breadcrumb_enabled:
-            if not config.breadcrumbs_file or not config.breadcrumbs_file.strip():
-                errors.append(
-                    "Breadcrumbs file path cannot be empty when breadcrumb is enabled"
-                )
-            else:
-                breadcrumbs_path = self.execution_dir / config.breadcrumbs_file
-                try:
-                    if not breadcrumbs_path.exists():
-                        # Check if filename is valid before creating
-                        try:
-                            # Validate the filename by attempting to create the path
-                            breadcrumbs_path.parent.mkdir(parents=True, exist_ok=True)
-                            breadcrumbs_path.write_text("")
-                        except (OSError, ValueError, PermissionError) as e:
-                            errors.append(
-                                f"Invalid breadcrumbs file path: {config.breadcrumbs_file}"
-                            )
-                except (OSError, PermissionError):
-                    # Can't even check if file exists due to permissions
-                    errors.append(
-                        f"Invalid breadcrumbs file path: {config.breadcrumbs_file}"
-                    )
-
-        if config.task_mode == "tasklist":
-            if not config.tasklist_file or not config.tasklist_file.strip():
-                errors.append("Tasklist file path cannot be empty in tasklist mode")
-            else:
-                tasklist_path = self.execution_dir / config.tasklist_file
-                if not tasklist_path.exists():
-                    errors.append(f"Tasklist file not found: {config.tasklist_file}")
-        elif config.task_mode == "oneoff":
-            if not config.oneoff_prompt or not config.oneoff_prompt.strip():
-                errors.append("One-off prompt cannot be empty in one-off mode")
+            errors.extend(self.check_study_doc(doc))
+        errors.extend(self.check_breadcrumbs(config, create=create))
+        errors.extend(self.check_tasklist(config))
+        errors.extend(self.check_oneoff(config))
+        errors.extend(self.check_settings(config))
+        return errors
+
+    def check_study_doc(self, doc: str) -> List[str]:
+        if not doc or not doc.strip():
+            return ["Study doc path cannot be empty"]
+        if not self._exists(self.execution_dir / doc):
+            return [f"Study doc file not found: {doc}"]
+        return []
+
+    def check_breadcrumbs(
+        self, config: PromptConfig, create: bool = False
+    ) -> List[str]:
+        """Check the breadcrumbs path.
+
+        Args:
+            config: Config to check
+            create: Create the file if it is missing. Otherwise a missing
+                file is only checked to be creatable, and nothing is written.
+        """
+        if not config.breadcrumb_enabled:
+            return []
+        if not config.breadcrumbs_file or not config.breadcrumbs_file.strip():
+            return ["Breadcrumbs file path cannot be empty when breadcrumb is enabled"]
+
+        invalid = [f"Invalid breadcrumbs file path: {config.breadcrumbs_file}"]
+        breadcrumbs_path = self.execution_dir / config.breadcrumbs_file
+        try:
+            if self._exists(breadcrumbs_path):
+                return []
+        except (OSError, ValueError):
+            # Can't even check if file exists due to permissions
+            return invalid
+
+        if not create:
+            return [] if _creatable(breadcrumbs_path) else invalid
+        try:
+            breadcrumbs_path.parent.mkdir(parents=True, exist_ok=True)
+            breadcrumbs_path.write_text("")
+        except (OSError, ValueError):
+            return invalid
+        if self.path_cache is not None:
+            self.path_cache.invalidate(breadcrumbs_path)
+        return []
+
+    def check_tasklist(self, config: PromptConfig) -> List[str]:
+        if config.task_mode != "tasklist":
+            return []
+        if not config.tasklist_file or not config.tasklist_file.strip():
+            return ["Tasklist file path cannot be empty in tasklist mode"]
+        if not self._exists(self.execution_dir / config.tasklist_file):
+            return [f"Tasklist file not found: {config.tasklist_file}"]
+        return []
+
+    def check_oneoff(self, config: PromptConfig) -> List[str]:
+        if config.task_mode != "oneoff":
+            return []
+        if not config.oneoff_prompt or not config.oneoff_prompt.strip():
+            return ["One-off prompt cannot be empty in one-off mode"]
+        return []
+
+    def check_settings(self, config: PromptConfig) -> List[str]:
+        """Check the loop, logging, pacing and template settings."""
+        errors: List[str] = []
 
         if config.max_iterations < 0:
             errors.append("Max iterations must be >= 0")
@@ -63,7 +159,145 @@ class PromptValidator:
         if config.max_frozen < 0:
             errors.append("Frozen must be >= 0")
 
+        if config.parallel_workers < 1:
+            errors.append("Parallel workers must be >= 1")
+
+        if config.batch_concurrency < 1:
+            errors.append("Batch concurrency must be >= 1")
+
+        if config.log_retain_runs < 0:
+            errors.append("Log retention must be >= 0")
+
+        if config.log_max_run_mb < 0:
+            errors.append("Log size limit must be >= 0")
+
+        if config.pacing not in ("adaptive", "fixed"):
+            errors.append(f"Unknown pacing policy: {config.pacing}")
+
+        if config.pacing_base_delay < 0:
+            errors.append("Pacing base delay must be >= 0")
+
+        if config.pacing_max_delay < config.pacing_base_delay:
+            errors.append("Pacing max delay must be >= base delay")
+
+        if not 0 <= config.pacing_jitter <= 1:
+            errors.append("Pacing jitter must be between 0 and 1")
+
+        if config.config_save_debounce < 0:
+            errors.append("Config save debounce must be >= 0")
+
+        errors.extend(template_errors(config))
+
         return errors
 
     def is_valid(self, config: PromptConfig) -> bool:
         return len(self.validate(config)) == 0
+
+
+def _creatable(path: Path) -> bool:
+    """Whether ``path`` could be created, judged without writing anything."""
+    try:
+        parent = path.parent
+        while not parent.exists():
+            if parent.parent == parent:
+                return False
+            parent = parent.parent
+        return parent.is_dir() and os.access(parent, os.W_OK | os.X_OK)
+    except (OSError, ValueError):
+        return False
+
+
+# (field, key, reads files, check). Fields are "study_doc:<index>",
+# "breadcrumbs", "tasklist", "oneoff" and "settings".
+FieldCheck = Tuple[str, Hashable, bool, Callable[[], List[str]]]
+
+
+def _field_checks(
+    validator: PromptValidator, config: PromptConfig
+) -> Iterator[FieldCheck]:
+    for i, doc in enumerate(config.study_docs):
+        yield (
+            f"study_doc:{i}",
+            doc,
+            True,
+            lambda doc=doc: validator.check_study_doc(doc),
+        )
+    yield (
+        "breadcrumbs",
+        (config.breadcrumb_enabled, config.breadcrumbs_file),
+        True,
+        lambda: validator.check_breadcrumbs(config),
+    )
+    yield (
+        "tasklist",
+        (config.task_mode, config.tasklist_file),
+        True,
+        lambda: validator.check_tasklist(config),
+    )
+    yield (
+        "oneoff",
+        (config.task_mode, config.oneoff_prompt),
+        False,
+        lambda: validator.check_oneoff(config),
+    )
+    yield (
+        "settings",
+        tuple(getattr(config, name) for name in SETTINGS_FIELDS),
+        False,
+        lambda: validator.check_settings(config),
+    )
+
+
+class LiveValidator:
+    """Incremental validation for the TUI.
+
+    Keeps each field's errors together with the inputs they were computed
+    from, and on each update re-checks only the fields whose inputs changed,
+    plus fields that read files once their path checks have expired. Errors
+    are those of PromptValidator.validate, except that a missing breadcrumbs
+    file is never created here.
+    """
+
+    def __init__(self, execution_dir: Path | None = None, ttl: float = PATH_CACHE_TTL):
+        self.path_cache = PathCache(ttl)
+        self.validator = PromptValidator(execution_dir, path_cache=self.path_cache)
+        self.ttl = ttl
+        # field -> (key, checked at, reads files, errors)
+        self._fields: Dict[str, Tuple[Hashable, float, bool, List[str]]] = {}
+        # Names of the fields re-checked by the last update.
+        self.rechecked: Tuple[str, ...] = ()
+
+    def update(self, config: PromptConfig) -> Set[str]:
+        """Bring the results up to date; return the fields whose errors changed."""
+        now = self.path_cache.clock()
+        changed: Set[str] = set()
+        rechecked = []
+        fields = {}
+        for name, key, reads_files, check in _field_checks(self.validator, config):
+            cached = self._fields.get(name)
+            if (
+                cached is not None
+                and cached[0] == key
+                and not (reads_files and now - cached[1] >= self.ttl)
+            ):
+                fields[name] = cached
+                continue
+            errors = check()
+            rechecked.append(name)
+            fields[name] = (key, now, reads_files, errors)
+            if cached is None or cached[3] != errors:
+                changed.add(name)
+
+        changed.update(name for name in self._fields if name not in fields)
+        self._fields = fields
+        self.rechecked = tuple(rechecked)
+        return changed
+
+    def field_errors(self, field: str) -> List[str]:
+        cached = self._fields.get(field)
+        return list(cached[3]) if cached is not None else []
+
+    @property
+    def errors(self) -> List[str]:
+        """All errors, in the order PromptValidator.validate reports them."""
+        return [error for _, _, _, errors in self._fields.values() for error in errors]
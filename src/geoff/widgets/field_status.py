@@ -0,0 +1,9 @@
+from typing import List
+
+from textual.widget import Widget
+
+
+def show_field_errors(widget: Widget, errors: List[str]) -> None:
+    """Mark ``widget`` as invalid and explain why in its tooltip."""
+    widget.set_class(bool(errors), "field-error")
+    widget.tooltip = "\n".join(errors) if errors else None
@@ -1,7 +1,7 @@
 from textual.widgets import Static
 from textual.containers import VerticalScroll
 from geoff.config import PromptConfig
-from geoff.prompt_builder import build_prompt
+from geoff.prompt_builder import PromptCompiler
 
 
 class PromptPreviewWidget(VerticalScroll):
@@ -22,7 +22,9 @@ class PromptPreviewWidget(VerticalScroll):
     def __init__(self, config: PromptConfig, **kwargs):
         super().__init__(**kwargs)
         self.config_data = config
-        self.prompt_text = Static(build_prompt(config))
+        # Re-renders only the sections an edit touched.
+        self.compiler = PromptCompiler()
+        self.prompt_text = Static(self.compiler.compile(config))
 
     def compose(self):
         yield self.prompt_text
@@ -30,4 +32,6 @@ class PromptPreviewWidget(VerticalScroll):
     def update_prompt(self, config: PromptConfig | None = None):
         if config:
             self.config_data = config
-        self.prompt_text.update(build_prompt(self.config_data))
+        prompt = self.compiler.compile(self.config_data)
+        if self.compiler.recomputed:
+            self.prompt_text.update(prompt)
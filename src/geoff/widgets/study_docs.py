@@ -1,6 +1,7 @@
 from textual.app import ComposeResult
 from textual.containers import Vertical, Horizontal
 import asyncio
+import heapq
 import re
 import subprocess
 from textual import events
@@ -10,17 +11,33 @@ from textual import on
 
 from geoff.config import PromptConfig
 from geoff.messages import ConfigUpdated
+from geoff.models_cache import ModelsCache
+from geoff.validator import LiveValidator
+from geoff.widgets.field_status import show_field_errors
+
+# Model ids as ``opencode models`` prints them: provider/model.
+MODEL_PATTERN = re.compile(r"[A-Za-z0-9_.-]+/[A-Za-z0-9_.-]+")
 
 
 class DocRow(Horizontal):
-    def __init__(self, doc: str, index: int, **kwargs):
+    """One study doc.
+
+    ``index`` is the doc's position in ``config.study_docs`` and changes as
+    rows above it are removed. ``key`` names the row's widget ids and stays
+    fixed for the row's lifetime.
+    """
+
+    def __init__(self, doc: str, index: int, key: int | None = None, **kwargs):
+        self.key = index if key is None else key
+        kwargs.setdefault("id", f"doc-row-{self.key}")
+        kwargs.setdefault("classes", "doc-row")
         super().__init__(**kwargs)
         self.doc = doc
         self.index = index
 
     def compose(self) -> ComposeResult:
-        yield Input(value=self.doc, classes="doc-input", id=f"doc-input-{self.index}")
-        yield Button("X", classes="remove-btn", id=f"remove-doc-{self.index}")
+        yield Input(value=self.doc, classes="doc-input", id=f"doc-input-{self.key}")
+        yield Button("X", classes="remove-btn", id=f"remove-doc-{self.key}")
 
 
 class ModelSelect(Select):
@@ -185,19 +202,43 @@ class StudyDocsWidget(Static):
         border: none;
         text-style: underline;
     }
+
+    StudyDocsWidget .field-error {
+        color: $error;
+    }
     """
 
-    def __init__(self, config: PromptConfig, **kwargs):
+    def __init__(
+        self,
+        config: PromptConfig,
+        models_cache: ModelsCache | None = None,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
         self.config = config
+        self.models_cache = models_cache or ModelsCache()
+        # Loaded: the select lists real models (possibly from a stale
+        # cache). Fresh: no refresh is needed this session.
         self._models_loaded = False
+        self._models_fresh = False
         self._models_loading = False
+        self._models_requested = False
+        self._model_list: list[str] = []
+        # Doc rows in list order. New rows take the smallest free key, so a
+        # freshly built list has the keys 0..n-1.
+        self._rows: list[DocRow] = []
+        self._free_keys: list[int] = []
+        self._next_key = 0
 
     def compose(self) -> ComposeResult:
         yield Label("Orientation / Study Docs", classes="section-title")
         with Vertical(id="docs-list"):
-            for i, doc in enumerate(self.config.study_docs):
-                yield DocRow(doc, i, classes="doc-row", id=f"doc-row-{i}")
+            self._rows = [
+                DocRow(doc, i) for i, doc in enumerate(self.config.study_docs)
+            ]
+            self._free_keys = []
+            self._next_key = len(self._rows)
+            yield from self._rows
 
             yield Button("+ Add Doc", id="add-doc-btn", variant="primary")
 
@@ -223,6 +264,20 @@ class StudyDocsWidget(Static):
                 placeholder="Path to breadcrumbs file",
             )
 
+    def on_mount(self) -> None:
+        cached = self.models_cache.load()
+        if cached is not None and cached.models:
+            self._models_loaded = True
+            self._apply_model_options(cached.models)
+            if cached.is_fresh(self.models_cache.ttl):
+                self._models_fresh = True
+                return
+        self.run_worker(
+            self._load_models_if_needed(requested=False),
+            group="models",
+            exit_on_error=False,
+        )
+
     def _initial_model_options(self) -> list[tuple[str, str]]:
         options = ["default"]
         if self.config.model and self.config.model not in options:
@@ -230,10 +285,9 @@ class StudyDocsWidget(Static):
         return [(model, model) for model in options]
 
     def _parse_models_output(self, output: str) -> list[str]:
-        pattern = re.compile(r"[A-Za-z0-9_.-]+/[A-Za-z0-9_.-]+")
         models = []
         seen = set()
-        for match in pattern.finditer(output):
+        for match in MODEL_PATTERN.finditer(output):
             model = match.group(0)
             if model not in seen:
                 seen.add(model)
@@ -259,7 +313,14 @@ class StudyDocsWidget(Static):
 
         return models, None
 
+    def _fetch_and_cache_models(self) -> tuple[list[str], str | None]:
+        models, error = self._fetch_opencode_models()
+        if models:
+            self.models_cache.store(models)
+        return models, error
+
     def _apply_model_options(self, models: list[str]) -> None:
+        self._model_list = list(models)
         options = ["default"]
         for model in models:
             if model not in options:
@@ -273,38 +334,67 @@ class StudyDocsWidget(Static):
         if self.config.model in options:
             select.value = self.config.model
 
-    async def _load_models_if_needed(self) -> None:
-        if self._models_loaded or self._models_loading:
+    async def _load_models_if_needed(self, requested: bool = True) -> None:
+        """Fetch the model list unless this session already has a fresh one.
+
+        Args:
+            requested: The user opened the select. Errors are only reported
+                for requested loads that leave the select without models;
+                background refreshes of a cached list fail quietly.
+        """
+        self._models_requested = self._models_requested or requested
+        if self._models_fresh or self._models_loading:
             return
 
         self._models_loading = True
-        models, error = await asyncio.to_thread(self._fetch_opencode_models)
-        self._models_loading = False
+        try:
+            models, error = await asyncio.to_thread(self._fetch_and_cache_models)
+        finally:
+            self._models_loading = False
 
         if error:
-            if self.app:
+            if self._models_requested and not self._models_loaded and self.app:
                 self.app.notify(error, severity="warning")
             return
 
         if models:
             self._models_loaded = True
-            self._apply_model_options(models)
+            self._models_fresh = True
+            # Swap in the refreshed list only if it differs from the cache.
+            if models != self._model_list:
+                self._apply_model_options(models)
+
+    def show_validation(self, live: LiveValidator) -> None:
+        """Mark the doc and breadcrumbs inputs that have errors."""
+        for row in self._rows:
+            show_field_errors(
+                row.query_one(Input), live.field_errors(f"study_doc:{row.index}")
+            )
+        show_field_errors(
+            self.query_one("#breadcrumbs-input", Input),
+            live.field_errors("breadcrumbs"),
+        )
 
     @on(Button.Pressed, "#add-doc-btn")
     async def add_doc(self):
         self.config.study_docs.append("docs/SPEC.md")
+        # Mount the row first so the update marks the new input.
+        await self._mount_doc_rows(self.config.study_docs[-1:])
         self.post_message(ConfigUpdated())
-        await self.recompose_docs_list()
 
     @on(Button.Pressed, ".remove-btn")
     async def remove_doc(self, event: Button.Pressed):
         doc_row = event.button.parent
         if isinstance(doc_row, DocRow):
-            index = doc_row.index
-            if 0 <= index < len(self.config.study_docs):
-                self.config.study_docs.pop(index)
-                self.post_message(ConfigUpdated())
-                await self.recompose_docs_list()
+            await self.remove_doc_row(doc_row)
+
+    async def remove_doc_row(self, doc_row: DocRow) -> None:
+        index = doc_row.index
+        if not 0 <= index < len(self.config.study_docs):
+            return
+        self.config.study_docs.pop(index)
+        await self._unmount_doc_rows(self._rows[index : index + 1])
+        self.post_message(ConfigUpdated())
 
     @on(Checkbox.Changed, "#breadcrumbs-checkbox")
     def on_breadcrumb_toggled(self, event: Checkbox.Changed):
@@ -330,26 +420,110 @@ class StudyDocsWidget(Static):
             doc_row = event.input.parent
             if isinstance(doc_row, DocRow):
                 index = doc_row.index
-                if 0 <= index < len(self.config.study_docs):
+                if (
+                    0 <= index < len(self.config.study_docs)
+                    # Not an echo of update_from_config setting the value.
+                    and self.config.study_docs[index] != event.value
+                ):
                     self.config.study_docs[index] = event.value
+                    doc_row.doc = event.value
                     self.post_message(ConfigUpdated())
 
-    async def recompose_docs_list(self):
+    def _new_row(self, doc: str, index: int) -> DocRow:
+        if self._free_keys:
+            key = heapq.heappop(self._free_keys)
+        else:
+            key = self._next_key
+            self._next_key += 1
+        return DocRow(doc, index, key)
+
+    async def _mount_doc_rows(self, docs: list[str]) -> None:
+        """Append rows for ``docs`` after the last row, above the Add button."""
+        rows = [self._new_row(doc, len(self._rows) + i) for i, doc in enumerate(docs)]
+        if not rows:
+            return
         docs_list = self.query_one("#docs-list", Vertical)
-        # Remove all children except the button (which is last)
-        # But wait, Button is INSIDE docs-list in my new compose method?
-        # Yes:
-        # with Vertical(id="docs-list"):
-        #     ... rows ...
-        #     yield Button
-
-        # So I should clear all and rebuild all.
-        await docs_list.remove_children()
-
-        for i, doc in enumerate(self.config.study_docs):
-            await docs_list.mount(DocRow(doc, i, classes="doc-row", id=f"doc-row-{i}"))
+        if self._rows:
+            mounted = docs_list.mount_all(rows, after=self._rows[-1])
+        else:
+            mounted = docs_list.mount_all(rows, before=self.query_one("#add-doc-btn"))
+        self._rows.extend(rows)
+        await mounted
+
+    async def _unmount_doc_rows(self, rows: list[DocRow]) -> None:
+        """Remove ``rows`` and shift the indices of the rows below them."""
+        if not rows:
+            return
+        gone = set(rows)
+        self._rows = [row for row in self._rows if row not in gone]
+        for index, row in enumerate(self._rows):
+            row.index = index
+        await self._remove_rows(rows)
+
+    async def _remove_rows(self, rows: list[DocRow]) -> None:
+        for row in rows:
+            # Input.Changed events still queued for the row are dropped.
+            row.index = -1
+            heapq.heappush(self._free_keys, row.key)
+        await self.query_one("#docs-list", Vertical).remove_children(rows)
+
+    async def _sync_doc_rows(self) -> None:
+        """Make the rows match ``config.study_docs`` with the fewest changes.
+
+        Rows are keyed by their doc: a row whose doc is still listed is kept
+        untouched, and moved only if the order changed. Rows whose doc is
+        gone are reused, in order, for docs that have no row, changing only
+        the input text. Rows are mounted or removed only for the difference
+        in length.
+        """
+        docs = self.config.study_docs
+        by_doc: dict[str, list[DocRow]] = {}
+        for row in reversed(self._rows):
+            by_doc.setdefault(row.doc, []).append(row)
+        matched = [by_doc[doc].pop() if by_doc.get(doc) else None for doc in docs]
+        kept = {row for row in matched if row is not None}
+        spare = [row for row in self._rows if row not in kept]
+
+        for i, doc in enumerate(docs):
+            if matched[i] is None and spare:
+                row = matched[i] = spare.pop(0)
+                row.doc = doc
+                row.query_one(Input).value = doc
+        # Queued Input.Changed events are handled during the awaits below,
+        # and write to the doc at the row's index: set the final ones first.
+        placed = [row for row in matched if row is not None]
+        for index, row in enumerate(matched):
+            if row is not None:
+                row.index = index
+        order, self._rows = self._rows, placed
+        if spare:
+            order = [row for row in order if row not in spare]
+            await self._remove_rows(spare)
 
-        await docs_list.mount(Button("+ Add Doc", id="add-doc-btn", variant="primary"))
+        docs_list = self.query_one("#docs-list", Vertical)
+        if placed != order:
+            # Chains every row after the first, so no other row ends up
+            # between them.
+            for previous, row in zip(placed, placed[1:]):
+                docs_list.move_child(row, after=previous)
+
+        # New rows go after the previous existing row; rows above every
+        # existing row go before the first one, or the Add button.
+        before = self.query_one("#add-doc-btn")
+        pending: list[DocRow] = []
+        for i in range(len(docs) - 1, -1, -1):
+            if matched[i] is None:
+                matched[i] = self._new_row(docs[i], i)
+                pending.append(matched[i])
+                continue
+            if pending:
+                await docs_list.mount_all(reversed(pending), after=matched[i])
+                pending = []
+            before = matched[i]
+        if pending:
+            await docs_list.mount_all(reversed(pending), before=before)
+
+        self._rows = matched
 
     async def update_from_config(self, config: PromptConfig) -> None:
         self.config = config
@@ -369,4 +543,4 @@ class StudyDocsWidget(Static):
         breadcrumbs_checkbox = self.query_one("#breadcrumbs-checkbox", Checkbox)
         breadcrumbs_checkbox.value = config.breadcrumb_enabled
 
-        await self.recompose_docs_list()
+        await self._sync_doc_rows()
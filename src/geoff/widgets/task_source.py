@@ -14,6 +14,8 @@ from textual.validation import Number, Function
 
 from geoff.config import PromptConfig
 from geoff.messages import ConfigUpdated
+from geoff.validator import LiveValidator
+from geoff.widgets.field_status import show_field_errors
 
 
 class TaskSourceWidget(Static):
@@ -156,6 +158,10 @@ class TaskSourceWidget(Static):
         margin-top: 1;
     }
 
+    TaskSourceWidget .field-error {
+        color: $error;
+    }
+
     TaskSourceWidget .section-subtitle {
         color: $text-muted;
         text-style: bold;
@@ -259,6 +265,15 @@ class TaskSourceWidget(Static):
         self.query_one("#oneoff-label").display = not is_tasklist
         self.query_one("#oneoff-input").display = not is_tasklist
 
+    def show_validation(self, live: LiveValidator) -> None:
+        """Mark the task inputs that have errors."""
+        show_field_errors(
+            self.query_one("#tasklist-input", Input), live.field_errors("tasklist")
+        )
+        show_field_errors(
+            self.query_one("#oneoff-input", TextArea), live.field_errors("oneoff")
+        )
+
     @on(RadioSet.Changed, "#mode-radios")
     def on_mode_changed(self, event: RadioSet.Changed) -> None:
         if event.pressed.id == "mode-tasklist":
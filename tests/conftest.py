@@ -0,0 +1,38 @@
+import asyncio
+import os
+import signal
+import subprocess
+
+import pytest
+
+
+GIT_ENV = {
+    **os.environ,
+    "GIT_AUTHOR_NAME": "test",
+    "GIT_AUTHOR_EMAIL": "test@test.com",
+    "GIT_COMMITTER_NAME": "test",
+    "GIT_COMMITTER_EMAIL": "test@test.com",
+}
+
+
+def git(cwd, *args) -> str:
+    """Run git in ``cwd`` with a fixed identity and return its stdout."""
+    return subprocess.run(
+        ["git", *args], cwd=cwd, capture_output=True, text=True, env=GIT_ENV
+    ).stdout.strip()
+
+
+async def interrupted(*args, **kwargs):
+    """Stand-in agent run that is interrupted with Ctrl-C while it runs."""
+    os.kill(os.getpid(), signal.SIGINT)
+    await asyncio.sleep(30)
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    """A git repository with one commit containing README.md."""
+    git(tmp_path, "init")
+    (tmp_path / "README.md").write_text("hello")
+    git(tmp_path, "add", "README.md")
+    git(tmp_path, "commit", "-m", "initial")
+    return tmp_path
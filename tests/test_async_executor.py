@@ -0,0 +1,159 @@
+import asyncio
+import os
+import sys
+import time
+from unittest.mock import patch
+
+import pytest
+
+from geoff.async_executor import (
+    execute_opencode_loop_async,
+    execute_opencode_once_async,
+    run_opencode_async,
+)
+from geoff.run_lock import RunLock, default_lock_path
+
+
+def _python(code: str):
+    return [sys.executable, "-c", code]
+
+
+class TestRunOpencodeAsync:
+    """Tests for running a single child process."""
+
+    @pytest.mark.asyncio
+    async def test_streams_output_and_returns_exit_code(self, tmp_path, capsys):
+        result = await run_opencode_async(
+            _python("print('hi'); raise SystemExit(3)"), tmp_path
+        )
+
+        assert result.returncode == 3
+        assert result.frozen is False
+        assert result.output_bytes > 0
+        assert "hi" in capsys.readouterr().out
+
+    @pytest.mark.asyncio
+    async def test_decodes_multibyte_characters_across_chunks(self, tmp_path, capsys):
+        code = (
+            "import sys, time\n"
+            "data = 'caf\\u00e9'.encode()\n"
+            "sys.stdout.buffer.write(data[:-1]); sys.stdout.flush()\n"
+            "time.sleep(0.1)\n"
+            "sys.stdout.buffer.write(data[-1:] + b'\\n'); sys.stdout.flush()\n"
+        )
+
+        await run_opencode_async(_python(code), tmp_path)
+
+        assert "café" in capsys.readouterr().out
+
+    @pytest.mark.asyncio
+    async def test_watchdog_terminates_silent_process(self, tmp_path, capsys):
+        result = await run_opencode_async(
+            _python("import time; time.sleep(30)"),
+            tmp_path,
+            max_frozen_minutes=0.01,
+        )
+
+        assert result.frozen is True
+        assert result.returncode != 0
+        assert "Frozen timeout reached" in capsys.readouterr().out
+
+    @pytest.mark.asyncio
+    async def test_cancelling_terminates_the_child(self, tmp_path):
+        pid_file = tmp_path / "pid"
+        task = asyncio.create_task(
+            run_opencode_async(
+                _python(
+                    f"import os, time; open({str(pid_file)!r}, 'w')"
+                    ".write(str(os.getpid())); time.sleep(30)"
+                ),
+                tmp_path,
+            )
+        )
+        while not pid_file.exists() or not pid_file.read_text():
+            await asyncio.sleep(0.05)
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        pid = int(pid_file.read_text())
+        with pytest.raises(ProcessLookupError):
+            os.kill(pid, 0)
+
+    @pytest.mark.asyncio
+    async def test_returns_when_a_grandchild_holds_the_pipe(self, tmp_path, capsys):
+        code = (
+            "import subprocess, sys\n"
+            "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'])\n"
+            "print('parent done')\n"
+        )
+        started = time.monotonic()
+
+        result = await run_opencode_async(_python(code), tmp_path)
+
+        assert result.returncode == 0
+        assert time.monotonic() - started < 10
+        assert "parent done" in capsys.readouterr().out
+
+
+class TestExecuteOpencodeOnceAsync:
+    """Tests for the async single-run entry point."""
+
+    @pytest.mark.asyncio
+    async def test_exits_when_opencode_missing(self, tmp_path):
+        with patch(
+            "geoff.async_executor._build_opencode_command",
+            return_value=["geoff-definitely-missing-binary"],
+        ):
+            with pytest.raises(SystemExit) as exc_info:
+                await execute_opencode_once_async("prompt", exec_dir=tmp_path)
+
+        assert exc_info.value.code == 1
+
+
+class TestExecuteOpencodeLoopAsync:
+    """Tests for the async loop entry points."""
+
+    @pytest.mark.asyncio
+    async def test_stops_after_max_stuck(self, tmp_path):
+        with patch(
+            "geoff.async_executor._build_opencode_command",
+            return_value=_python("pass"),
+        ), patch("geoff.executor.compute_repo_hash", return_value="same"), patch(
+            "geoff.async_executor.asyncio.sleep"
+        ):
+            summary = await execute_opencode_loop_async(
+                "prompt", max_stuck=2, exec_dir=tmp_path
+            )
+
+        assert summary.iterations == 2
+        assert summary.stuck_count == 2
+        assert summary.stop_reason == "stuck"
+
+    @pytest.mark.asyncio
+    async def test_stops_after_max_iterations(self, tmp_path):
+        hashes = iter(str(i) for i in range(100))
+        with patch(
+            "geoff.async_executor._build_opencode_command",
+            return_value=_python("pass"),
+        ), patch(
+            "geoff.executor.compute_repo_hash", side_effect=lambda _: next(hashes)
+        ), patch(
+            "geoff.async_executor.asyncio.sleep"
+        ):
+            summary = await execute_opencode_loop_async(
+                "prompt", max_iterations=3, exec_dir=tmp_path
+            )
+
+        assert summary.iterations == 3
+        assert summary.stop_reason == "max_iterations"
+
+    @pytest.mark.asyncio
+    async def test_exits_when_tree_is_locked(self, tmp_path, capsys):
+        with RunLock(default_lock_path(tmp_path)):
+            with pytest.raises(SystemExit) as exc_info:
+                await execute_opencode_loop_async("prompt", exec_dir=tmp_path)
+
+        assert exc_info.value.code == 1
+        assert "already running" in capsys.readouterr().err
@@ -0,0 +1,232 @@
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from geoff.batch import (
+    BatchError,
+    BatchJob,
+    BatchResult,
+    execute_batch,
+    format_batch_summary,
+    load_prompt_queue,
+    wrap_prompt,
+)
+from geoff.config import PromptConfig
+from geoff.executor import ProcessResult
+from geoff.prompt_builder import build_prompt
+from tests.conftest import interrupted
+
+
+class TestLoadPromptQueue:
+    def test_directory_yields_one_prompt_per_file(self, tmp_path):
+        (tmp_path / "b-fix.md").write_text("fix the bug")
+        (tmp_path / "a-docs.txt").write_text("write docs\n")
+        (tmp_path / "notes.json").write_text("{}")
+        (tmp_path / "empty.md").write_text("   ")
+
+        jobs = load_prompt_queue(tmp_path)
+
+        assert jobs == [
+            BatchJob(name="a-docs", prompt="write docs"),
+            BatchJob(name="b-fix", prompt="fix the bug"),
+        ]
+
+    def test_file_splits_on_separator_lines(self, tmp_path):
+        source = tmp_path / "queue.md"
+        source.write_text("first\nprompt\n---\nsecond\n---\n\n")
+
+        jobs = load_prompt_queue(source)
+
+        assert jobs == [
+            BatchJob(name="queue-1", prompt="first\nprompt"),
+            BatchJob(name="queue-2", prompt="second"),
+        ]
+
+    def test_missing_source(self, tmp_path):
+        with pytest.raises(BatchError):
+            load_prompt_queue(tmp_path / "nope")
+
+    def test_empty_directory(self, tmp_path):
+        with pytest.raises(BatchError):
+            load_prompt_queue(tmp_path)
+
+    def test_duplicate_names_are_made_unique(self, tmp_path):
+        (tmp_path / "a b.md").write_text("one")
+        (tmp_path / "a-b.md").write_text("two")
+
+        names = [job.name for job in load_prompt_queue(tmp_path)]
+
+        assert names == ["a-b", "a-b-2"]
+
+
+class TestWrapPrompt:
+    def test_matches_oneoff_mode(self):
+        config = PromptConfig(task_mode="tasklist")
+
+        wrapped = wrap_prompt(config, "do the thing")
+
+        assert wrapped == build_prompt(
+            PromptConfig(task_mode="oneoff", oneoff_prompt="do the thing")
+        )
+        assert config.task_mode == "tasklist"
+
+
+class TestExecuteBatch:
+    @patch("geoff.batch._build_opencode_command")
+    def test_runs_each_job_in_its_own_target_dir(self, mock_cmd, tmp_path, capsys):
+        mock_cmd.side_effect = lambda prompt, model: [
+            sys.executable,
+            "-c",
+            "import os; open('ran.txt', 'w').write(os.getcwd())",
+        ]
+        jobs = [BatchJob("one", "a"), BatchJob("two", "b"), BatchJob("three", "c")]
+
+        results = execute_batch(
+            jobs,
+            PromptConfig(),
+            concurrency=2,
+            exec_dir=tmp_path,
+            target_root=tmp_path / "targets",
+        )
+
+        assert [r.status for r in results] == ["ok", "ok", "ok"]
+        for job in jobs:
+            assert (tmp_path / "targets" / job.name / "ran.txt").exists()
+        out = capsys.readouterr().out
+        assert "Batch summary:" in out
+        assert "Succeeded: 3/3" in out
+
+    @patch("geoff.batch._build_opencode_command")
+    def test_respects_concurrency_limit(self, mock_cmd, tmp_path):
+        # Each job records how many jobs are running alongside it.
+        counter = tmp_path / "running"
+        counter.mkdir()
+        code = (
+            "import os, time, uuid\n"
+            f"d = {str(counter)!r}\n"
+            "me = os.path.join(d, uuid.uuid4().hex)\n"
+            "open(me, 'w').close()\n"
+            "time.sleep(0.3)\n"
+            "open('peak', 'w').write(str(len(os.listdir(d))))\n"
+            "os.remove(me)\n"
+        )
+        mock_cmd.return_value = [sys.executable, "-c", code]
+        jobs = [BatchJob(f"job{i}", "p") for i in range(4)]
+
+        execute_batch(
+            jobs,
+            PromptConfig(),
+            concurrency=2,
+            exec_dir=tmp_path,
+            target_root=tmp_path / "targets",
+        )
+
+        peaks = [
+            int((tmp_path / "targets" / job.name / "peak").read_text()) for job in jobs
+        ]
+        assert max(peaks) <= 2
+
+    @patch("geoff.batch._build_opencode_command")
+    def test_uses_git_worktrees_by_default(self, mock_cmd, git_repo):
+        tmp_path = git_repo
+        mock_cmd.return_value = [sys.executable, "-c", "raise SystemExit(2)"]
+
+        results = execute_batch(
+            [BatchJob("fix", "p")], PromptConfig(), exec_dir=tmp_path
+        )
+
+        worktree = tmp_path / ".geoff" / "worktrees" / "batch-fix"
+        assert results[0].directory == worktree
+        assert (results[0].directory / "README.md").exists()
+        assert results[0].status == "failed"
+        assert results[0].result.returncode == 2
+
+    @patch("geoff.batch._build_opencode_command")
+    def test_copies_study_docs_into_target_dirs(self, mock_cmd, tmp_path):
+        mock_cmd.return_value = [
+            sys.executable,
+            "-c",
+            "open('seen.txt', 'w').write(open('docs/SPEC.md').read())",
+        ]
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "SPEC.md").write_text("spec")
+        kept = tmp_path / "targets" / "two" / "docs" / "SPEC.md"
+        kept.parent.mkdir(parents=True)
+        kept.write_text("edited by an earlier run")
+        config = PromptConfig(study_docs=["docs/SPEC.md", "docs/missing.md"])
+
+        results = execute_batch(
+            [BatchJob("one", "a"), BatchJob("two", "b")],
+            config,
+            exec_dir=tmp_path,
+            target_root=tmp_path / "targets",
+        )
+
+        assert [r.status for r in results] == ["ok", "ok"]
+        assert (tmp_path / "targets" / "one" / "seen.txt").read_text() == "spec"
+        assert kept.read_text() == "edited by an earlier run"
+        assert not (tmp_path / "targets" / "one" / "docs" / "missing.md").exists()
+
+    @patch("geoff.batch._build_opencode_command")
+    def test_copies_uncommitted_study_docs_into_worktrees(self, mock_cmd, git_repo):
+        mock_cmd.return_value = [sys.executable, "-c", "pass"]
+        (git_repo / "NOTES.md").write_text("draft")
+
+        results = execute_batch(
+            [BatchJob("fix", "p")],
+            PromptConfig(study_docs=["NOTES.md"]),
+            exec_dir=git_repo,
+        )
+
+        assert (results[0].directory / "NOTES.md").read_text() == "draft"
+
+    @patch("geoff.batch._build_opencode_command")
+    def test_missing_opencode_is_reported_per_job(self, mock_cmd, tmp_path):
+        mock_cmd.return_value = ["geoff-definitely-missing-binary"]
+
+        results = execute_batch(
+            [BatchJob("one", "p")],
+            PromptConfig(),
+            exec_dir=tmp_path,
+            target_root=tmp_path / "targets",
+        )
+
+        assert results[0].status == "error"
+        assert "not found" in results[0].error
+
+
+    @patch("geoff.batch.run_opencode_async")
+    def test_ctrl_c_marks_unfinished_jobs_cancelled(self, mock_run, tmp_path, capsys):
+        mock_run.side_effect = interrupted
+
+        results = execute_batch(
+            [BatchJob("one", "a"), BatchJob("two", "b")],
+            PromptConfig(),
+            exec_dir=tmp_path,
+            target_root=tmp_path / "targets",
+        )
+
+        assert [r.error for r in results] == ["cancelled", "cancelled"]
+        assert "Batch cancelled by user" in capsys.readouterr().out
+
+
+class TestFormatBatchSummary:
+    def test_table_lists_every_job(self, tmp_path):
+        results = [
+            BatchResult(
+                BatchJob("one", "p"),
+                directory=tmp_path / "one",
+                result=ProcessResult(returncode=0),
+                seconds=1.25,
+            ),
+            BatchResult(BatchJob("two", "p"), error="boom"),
+        ]
+
+        summary = format_batch_summary(results, tmp_path)
+
+        lines = summary.splitlines()
+        assert lines[2].split() == ["job", "status", "exit", "time", "directory"]
+        assert lines[3].split() == ["one", "ok", "0", "1.2s", "one"]
+        assert lines[4].split() == ["two", "error:", "boom", "-", "0.0s", "-"]
+        assert lines[-1] == "Succeeded: 1/2"
@@ -0,0 +1,204 @@
+import os
+import subprocess
+import sys
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from geoff.change_tracker import ChangeTracker, WatchLimitReached
+from geoff.executor import execute_opencode_loop
+
+pytestmark = pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="inotify is Linux-only"
+)
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    tracker = ChangeTracker(tmp_path)
+    assert tracker.start()
+    yield tracker
+    tracker.close()
+
+
+class TestChangeTracker:
+    def test_no_changes_reports_empty_set(self, tracker):
+        tracker.reset()
+        assert tracker.collect() == set()
+
+    def test_reports_created_file(self, tracker, tmp_path):
+        tracker.reset()
+        (tmp_path / "new.txt").write_text("hello")
+        assert tracker.collect() == {"new.txt"}
+
+    def test_reports_modified_and_deleted_files(self, tmp_path):
+        (tmp_path / "a.txt").write_text("a")
+        (tmp_path / "b.txt").write_text("b")
+        with ChangeTracker(tmp_path) as tracker:
+            tracker.reset()
+            (tmp_path / "a.txt").write_text("changed")
+            (tmp_path / "b.txt").unlink()
+            assert tracker.collect() == {"a.txt", "b.txt"}
+
+    def test_follows_new_directories(self, tracker, tmp_path):
+        tracker.reset()
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "mod.py").write_text("x = 1")
+        assert tracker.collect() >= {"pkg", "pkg/mod.py"}
+
+        tracker.reset()
+        (tmp_path / "pkg" / "mod.py").write_text("x = 2")
+        assert tracker.collect() == {"pkg/mod.py"}
+
+    def test_reset_discards_earlier_events(self, tracker, tmp_path):
+        (tmp_path / "before.txt").write_text("x")
+        tracker.reset()
+        assert tracker.collect() == set()
+
+    def test_ignores_geoff_state_dir(self, tracker, tmp_path):
+        tracker.reset()
+        (tmp_path / ".geoff").mkdir()
+        (tmp_path / ".geoff" / "state").write_text("x")
+        assert tracker.collect() == set()
+
+    def test_reports_head_movement_but_not_index_churn(self, tmp_path):
+        env = {
+            **os.environ,
+            "GIT_AUTHOR_NAME": "test",
+            "GIT_AUTHOR_EMAIL": "test@test.com",
+            "GIT_COMMITTER_NAME": "test",
+            "GIT_COMMITTER_EMAIL": "test@test.com",
+        }
+        subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True)
+        subprocess.run(
+            ["git", "commit", "--allow-empty", "-m", "one"],
+            cwd=tmp_path,
+            capture_output=True,
+            env=env,
+        )
+        with ChangeTracker(tmp_path) as tracker:
+            tracker.reset()
+            subprocess.run(["git", "status"], cwd=tmp_path, capture_output=True)
+            assert tracker.collect() == set()
+
+            subprocess.run(
+                ["git", "commit", "--allow-empty", "-m", "two"],
+                cwd=tmp_path,
+                capture_output=True,
+                env=env,
+            )
+            changed = tracker.collect()
+            assert any(path.startswith(".git/refs/heads/") for path in changed)
+
+    def test_ignores_gitignored_paths(self, tmp_path):
+        (tmp_path / ".gitignore").write_text(".pytest_cache/\n*.log\nbuild/\n")
+        (tmp_path / "build").mkdir()
+        with ChangeTracker(tmp_path) as tracker:
+            assert tmp_path / "build" not in tracker._dirs.values()
+            tracker.reset()
+            (tmp_path / ".pytest_cache" / "v").mkdir(parents=True)
+            (tmp_path / ".pytest_cache" / "v" / "nodeids").write_text("[]")
+            (tmp_path / "__pycache__").mkdir()
+            (tmp_path / "__pycache__" / "m.pyc").write_bytes(b"x")
+            (tmp_path / "run.log").write_text("x")
+            (tmp_path / "build" / "out.o").write_text("x")
+            assert tracker.collect() == set()
+
+            (tmp_path / "src.py").write_text("x")
+            assert tracker.collect() == {"src.py"}
+
+    def test_nested_ignore_files_and_negation(self, tmp_path):
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / ".gitignore").write_text("*.tmp\n!keep.tmp\n")
+        with ChangeTracker(tmp_path) as tracker:
+            tracker.reset()
+            (tmp_path / "pkg" / "scratch.tmp").write_text("x")
+            (tmp_path / "pkg" / "keep.tmp").write_text("x")
+            (tmp_path / "top.tmp").write_text("x")
+            assert tracker.collect() == {"pkg/keep.tmp", "top.tmp"}
+
+    def test_editing_gitignore_rebuilds_watches(self, tmp_path):
+        (tmp_path / "out").mkdir()
+        with ChangeTracker(tmp_path) as tracker:
+            tracker.reset()
+            (tmp_path / ".gitignore").write_text("out/\n")
+            assert tracker.collect() == {".gitignore"}
+            assert tracker.active
+
+            tracker.reset()
+            (tmp_path / "out" / "artifact").write_text("x")
+            assert tracker.collect() == set()
+
+    def test_collect_returns_none_when_inactive(self, tmp_path):
+        tracker = ChangeTracker(tmp_path)
+        assert tracker.collect() is None
+
+    def test_start_fails_when_watches_run_out(self, tmp_path):
+        tracker = ChangeTracker(tmp_path)
+        with patch.object(
+            ChangeTracker, "_add_watch", side_effect=WatchLimitReached("x")
+        ):
+            assert tracker.start() is False
+        assert not tracker.active
+
+
+class TestLoopWithChangeTracker:
+    @patch("geoff.executor.time.sleep")
+    @patch("geoff.executor.compute_repo_hash")
+    @patch("geoff.executor.subprocess.run")
+    def test_detects_changes_without_hashing(
+        self, mock_run, mock_hash, mock_sleep, tmp_path
+    ):
+        def agent(*args, **kwargs):
+            (tmp_path / f"out{mock_run.call_count}.txt").write_text("x")
+            return MagicMock()
+
+        mock_run.side_effect = agent
+
+        summary = execute_opencode_loop(
+            "prompt",
+            max_iterations=3,
+            max_stuck=1,
+            exec_dir=tmp_path,
+            change_detection="inotify",
+        )
+
+        assert summary.iterations == 3
+        assert summary.stuck_count == 0
+        mock_hash.assert_not_called()
+
+    @patch("geoff.executor.time.sleep")
+    @patch("geoff.executor.subprocess.run")
+    def test_stuck_when_tree_untouched(self, mock_run, mock_sleep, tmp_path):
+        mock_run.return_value = MagicMock()
+
+        summary = execute_opencode_loop(
+            "prompt",
+            max_iterations=0,
+            max_stuck=2,
+            exec_dir=tmp_path,
+            change_detection="inotify",
+        )
+
+        assert summary.iterations == 2
+        assert summary.stop_reason == "stuck"
+
+    @patch("geoff.executor.time.sleep")
+    @patch("geoff.executor.compute_repo_hash", return_value="same")
+    @patch("geoff.executor.subprocess.run")
+    @patch("geoff.executor.ChangeTracker.start", return_value=False)
+    def test_falls_back_to_hashing(
+        self, mock_start, mock_run, mock_hash, mock_sleep, tmp_path
+    ):
+        mock_run.return_value = MagicMock()
+
+        summary = execute_opencode_loop(
+            "prompt",
+            max_iterations=0,
+            max_stuck=1,
+            exec_dir=tmp_path,
+            change_detection="inotify",
+        )
+
+        assert summary.stop_reason == "stuck"
+        assert mock_hash.call_count == 2
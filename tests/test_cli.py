@@ -0,0 +1,204 @@
+import os
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from geoff.cli import run_cli
+from geoff.config import PromptConfig
+from geoff.executor import LoopSummary, ProcessResult
+from geoff.parallel import WorkerResult
+from geoff.prompt_builder import build_prompt
+
+# Cold start budget for headless commands, measured as cumulative import
+# time of the CLI entry point (interpreter start-up excluded).
+IMPORT_BUDGET_US = 100_000
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    """A repo with the default docs and an isolated home directory."""
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "SPEC.md").write_text("spec")
+    (tmp_path / "docs" / "PLAN.md").write_text("plan")
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+class TestPromptCommand:
+    def test_prints_built_prompt(self, workspace, capsys):
+        assert run_cli(["prompt"]) == 0
+
+        assert capsys.readouterr().out == build_prompt(PromptConfig()) + "\n"
+
+    def test_does_not_create_breadcrumbs(self, workspace):
+        assert run_cli(["prompt"]) == 0
+
+        assert not (workspace / "docs" / "BREADCRUMBS.md").exists()
+
+    def test_invalid_config_exits_non_zero(self, workspace, capsys):
+        (workspace / "docs" / "SPEC.md").unlink()
+
+        assert run_cli(["prompt"]) == 1
+
+        captured = capsys.readouterr()
+        assert captured.out == ""
+        assert "Study doc file not found: docs/SPEC.md" in captured.err
+
+
+class TestValidateCommand:
+    def test_valid(self, workspace, capsys):
+        assert run_cli(["validate"]) == 0
+        assert "Configuration is valid" in capsys.readouterr().out
+
+    def test_invalid(self, workspace, capsys):
+        (workspace / "docs" / "PLAN.md").unlink()
+
+        assert run_cli(["validate"]) == 1
+        assert "Tasklist file not found" in capsys.readouterr().err
+        assert not (workspace / "docs" / "BREADCRUMBS.md").exists()
+
+    def test_does_not_create_breadcrumbs(self, workspace):
+        assert run_cli(["validate"]) == 0
+
+        assert not (workspace / "docs" / "BREADCRUMBS.md").exists()
+
+
+class TestRunCommand:
+    @patch("geoff.main.dispatch", return_value=0)
+    def test_once(self, mock_dispatch, workspace):
+        assert run_cli(["run", "--once"]) == 0
+
+        action, prompt, config = mock_dispatch.call_args[0]
+        assert action == "run_once"
+        assert prompt == build_prompt(config)
+        # The agent appends to it, so a run creates it up front.
+        assert (workspace / "docs" / "BREADCRUMBS.md").exists()
+
+    @patch("geoff.main.dispatch", return_value=0)
+    def test_loop_with_overrides(self, mock_dispatch, workspace):
+        assert run_cli(["run", "--loop", "--max-iterations", "3", "-m", "a/b"]) == 0
+
+        action, _, config = mock_dispatch.call_args[0]
+        assert action == "run_loop"
+        assert config.max_iterations == 3
+        assert config.model == "a/b"
+
+    @patch("geoff.executor.subprocess.run")
+    def test_once_exits_with_opencode_status(self, mock_run, workspace):
+        mock_run.return_value.returncode = 3
+
+        assert run_cli(["run", "--once"]) == 3
+
+    @patch("geoff.executor.compute_repo_hash", return_value="same")
+    @patch("geoff.executor._run_opencode_with_frozen_timeout")
+    def test_loop_exits_zero_when_stopped_normally(
+        self, mock_run, mock_hash, workspace
+    ):
+        mock_run.return_value = ProcessResult(returncode=0)
+
+        assert run_cli(["run", "--loop", "--max-iterations", "1"]) == 0
+
+    @patch("geoff.parallel.execute_opencode_parallel")
+    def test_loop_exits_non_zero_when_a_worker_errors(self, mock_parallel, workspace):
+        mock_parallel.return_value = [
+            WorkerResult(1, workspace, LoopSummary(1, 0, "max_iterations")),
+            WorkerResult(2, workspace, LoopSummary(0, 0, "error"), "locked"),
+        ]
+
+        assert run_cli(["run", "--loop", "--workers", "2"]) == 1
+        shared = mock_parallel.call_args.kwargs["shared_files"]
+        assert "docs/SPEC.md" in shared
+        assert "docs/PLAN.md" in shared
+
+    def test_requires_a_mode(self, workspace):
+        with pytest.raises(SystemExit):
+            run_cli(["run"])
+
+    @patch("geoff.main.dispatch")
+    def test_invalid_config_does_not_run(self, mock_dispatch, workspace):
+        (workspace / "docs" / "SPEC.md").unlink()
+
+        assert run_cli(["run", "--loop"]) == 1
+        mock_dispatch.assert_not_called()
+
+
+class TestBatchCommand:
+    @pytest.fixture
+    def queue(self, workspace):
+        (workspace / "queue.md").write_text("first\n---\nsecond\n")
+        return workspace / "queue.md"
+
+    @patch("geoff.batch.execute_batch")
+    def test_invalid_config_does_not_run(self, mock_batch, queue, capsys):
+        (queue.parent / "docs" / "SPEC.md").unlink()
+
+        assert run_cli(["batch", str(queue)]) == 1
+        mock_batch.assert_not_called()
+        assert "Study doc file not found" in capsys.readouterr().err
+
+    @patch("geoff.batch.execute_batch", return_value=[])
+    def test_task_source_settings_are_not_checked(self, mock_batch, queue):
+        # Jobs run in one-off mode; a missing tasklist does not matter.
+        (queue.parent / "docs" / "PLAN.md").unlink()
+
+        assert run_cli(["batch", str(queue)]) == 0
+        jobs = mock_batch.call_args[0][0]
+        assert [job.prompt for job in jobs] == ["first", "second"]
+
+
+class TestHeadlessImports:
+    def _run(self, workspace, code):
+        env = {**os.environ, "HOME": str(workspace / "home")}
+        return subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            cwd=workspace,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+    def test_prompt_does_not_import_tui_or_executor(self, workspace):
+        result = self._run(
+            workspace,
+            "import sys\n"
+            "from geoff.main import main\n"
+            "try:\n"
+            "    main(['prompt'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print(sorted(m for m in ('textual', 'geoff.app', 'geoff.executor')"
+            " if m in sys.modules))\n",
+        )
+
+        assert result.stdout.strip().splitlines()[-1] == "[]"
+
+    def test_warm_start_does_not_import_yaml(self, workspace):
+        code = (
+            "import sys\n"
+            "from geoff.cli import run_cli\n"
+            "run_cli(['prompt'])\n"
+            "print('yaml' in sys.modules)\n"
+        )
+        # The snapshot is kept only in a repo that already has .geoff.
+        (workspace / ".geoff").mkdir()
+        cold = self._run(workspace, code)
+        warm = self._run(workspace, code)
+
+        assert cold.stdout.strip().splitlines()[-1] == "True"
+        assert warm.stdout.strip().splitlines()[-1] == "False"
+
+    def test_cold_start_import_budget(self, workspace):
+        result = self._run(workspace, "import geoff.main, geoff.cli")
+
+        cumulative = {}
+        for line in result.stderr.splitlines():
+            parts = line.split("|")
+            if len(parts) == 3 and parts[1].strip().isdigit():
+                cumulative[parts[2].strip()] = int(parts[1])
+        total = cumulative["geoff.main"] + cumulative.get("geoff.cli", 0)
+
+        assert total < IMPORT_BUDGET_US, f"headless imports took {total} us"
@@ -14,6 +14,16 @@ def test_config_defaults():
     assert config.max_iterations == 0
     assert config.max_stuck == 2
     assert config.max_frozen == 0
+    assert config.parallel_workers == 1
+    assert config.batch_concurrency == 2
+    assert config.change_detection == "hash"
+    assert config.log_enabled is True
+    assert config.log_retain_runs == 20
+    assert config.log_max_run_mb == 0
+    assert config.telemetry_enabled is True
+    assert config.pacing == "adaptive"
+    assert config.pacing_base_delay == 2.0
+    assert config.config_save_debounce == 0.5
 
 
 def test_config_custom_values():
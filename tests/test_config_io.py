@@ -1,5 +1,23 @@
+import os
+import stat
 from pathlib import Path
-from geoff.config_io import load_yaml, save_yaml, ensure_config_dir
+from unittest.mock import patch
+
+import pytest
+import yaml
+from hypothesis import given, settings, strategies as st
+
+from geoff import config_io
+from geoff.config_io import (
+    atomic_write,
+    ensure_config_dir,
+    file_lock,
+    load_yaml,
+    lock_path_for,
+    save_yaml,
+    sync_path,
+    write_yaml_if_changed,
+)
 
 
 def test_load_yaml_missing(tmp_path):
@@ -33,3 +51,170 @@ def test_save_yaml_creates_parents(tmp_path):
     save_yaml(path, data)
     assert path.exists()
     assert load_yaml(path) == data
+
+
+class TestAtomicWrites:
+    def test_replaces_without_leaving_temp_files(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        save_yaml(path, {"a": 1})
+        save_yaml(path, {"a": 2})
+
+        assert load_yaml(path) == {"a": 2}
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "config.yaml",
+            "config.yaml.lock",
+        ]
+
+    def test_failed_write_keeps_old_contents(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        save_yaml(path, {"a": 1})
+
+        with patch("geoff.config_io.os.replace", side_effect=OSError("boom")):
+            with pytest.raises(OSError):
+                save_yaml(path, {"a": 2})
+
+        assert load_yaml(path) == {"a": 1}
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_preserves_file_mode(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        save_yaml(path, {"a": 1})
+        os.chmod(path, 0o600)
+
+        save_yaml(path, {"a": 2})
+
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+    def test_fsync_modes(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        with patch("geoff.config_io.os.fsync") as mock_fsync:
+            save_yaml(path, {"a": 1}, sync=False)
+            assert mock_fsync.call_count == 0
+
+            save_yaml(path, {"a": 1})
+            assert mock_fsync.call_count == 1
+
+            save_yaml(path, {"a": 1}, sync_dir=True)
+            assert mock_fsync.call_count == 3
+
+    def test_sync_path_checkpoint(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        save_yaml(path, {"a": 1}, sync=False)
+
+        with patch("geoff.config_io.os.fsync") as mock_fsync:
+            sync_path(path)
+            sync_path(tmp_path / "missing.yaml")
+
+        # The file and its directory, nothing for the missing file.
+        assert mock_fsync.call_count == 2
+
+    def test_atomic_write_bytes(self, tmp_path):
+        path = tmp_path / "nested" / "blob"
+        atomic_write(path, b"\x00\x01" * 100_000)
+        assert path.read_bytes() == b"\x00\x01" * 100_000
+
+    def test_writes_through_symlink(self, tmp_path):
+        dotfiles = tmp_path / "dotfiles"
+        dotfiles.mkdir()
+        target = dotfiles / "geoff.yaml"
+        target.write_text("a: 1\n")
+        link = tmp_path / ".geoff" / "geoff.yaml"
+        link.parent.mkdir()
+        link.symlink_to(target)
+
+        save_yaml(link, {"a": 2})
+
+        assert link.is_symlink()
+        assert load_yaml(target) == {"a": 2}
+        assert lock_path_for(link) == lock_path_for(target)
+        assert lock_path_for(link).parent == dotfiles
+        assert sorted(p.name for p in link.parent.iterdir()) == ["geoff.yaml"]
+
+
+def _config_like(text):
+    # Keys are PromptConfig field names.
+    return st.dictionaries(
+        st.from_regex(r"[a-z][a-z_]{0,24}", fullmatch=True),
+        st.one_of(
+            text,
+            st.booleans(),
+            st.integers(),
+            st.floats(allow_nan=False),
+            st.none(),
+            st.lists(text, max_size=5),
+        ),
+        max_size=8,
+    )
+
+
+# Outside printable ASCII the emitters may fold escaped scalars differently;
+# the loaded values are still identical.
+printable = st.text(
+    alphabet=st.characters(min_codepoint=32, max_codepoint=126), max_size=120
+)
+
+
+class TestYamlCodec:
+    @pytest.fixture
+    def pure_codec(self, monkeypatch):
+        monkeypatch.setattr(config_io, "_yaml_codec", None)
+        monkeypatch.delattr(yaml, "CSafeLoader", raising=False)
+        monkeypatch.delattr(yaml, "CSafeDumper", raising=False)
+        yield
+        config_io._yaml_codec = None
+
+    @pytest.mark.skipif(not yaml.__with_libyaml__, reason="PyYAML built without libyaml")
+    def test_prefers_libyaml(self):
+        _, loader, dumper = config_io.yaml_codec()
+        assert loader is yaml.CSafeLoader
+        assert dumper is yaml.CSafeDumper
+
+    def test_falls_back_without_libyaml(self, pure_codec, tmp_path):
+        _, loader, dumper = config_io.yaml_codec()
+        assert loader is yaml.SafeLoader
+        assert dumper is yaml.SafeDumper
+
+        path = tmp_path / "config.yaml"
+        save_yaml(path, {"study_docs": ["a.md"]})
+        assert load_yaml(path) == {"study_docs": ["a.md"]}
+
+    @given(data=_config_like(st.text(max_size=120)))
+    @settings(max_examples=200)
+    def test_round_trip_matches_pure_python(self, data):
+        _, loader, dumper = config_io.yaml_codec()
+        fast = yaml.dump(data, Dumper=dumper, default_flow_style=False)
+        pure = yaml.safe_dump(data, default_flow_style=False)
+
+        assert yaml.load(fast, Loader=loader) == data
+        assert yaml.safe_load(fast) == data
+        assert yaml.load(pure, Loader=loader) == data
+
+    @given(data=_config_like(printable))
+    @settings(max_examples=200)
+    def test_dump_is_byte_identical_for_printable_text(self, data):
+        _, _, dumper = config_io.yaml_codec()
+
+        assert yaml.dump(
+            data, Dumper=dumper, default_flow_style=False
+        ) == yaml.safe_dump(data, default_flow_style=False)
+
+
+class TestWriteIfChanged:
+    def test_skips_identical_bytes(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        assert write_yaml_if_changed(path, {"a": 1}) is True
+        before = os.stat(path).st_ino
+
+        assert write_yaml_if_changed(path, {"a": 1}) is False
+        assert os.stat(path).st_ino == before
+
+        assert write_yaml_if_changed(path, {"a": 2}) is True
+        assert load_yaml(path) == {"a": 2}
+
+    def test_file_lock_uses_sidecar(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        with file_lock(path):
+            write_yaml_if_changed(path, {"a": 1})
+
+        assert lock_path_for(path).exists()
+        assert load_yaml(path) == {"a": 1}
@@ -1,7 +1,8 @@
 from pathlib import Path
-from geoff.config_manager import ConfigManager, BASE_PROMPT_STRING_KEYS
+from unittest.mock import patch
+from geoff.config_manager import ConfigManager, BASE_PROMPT_STRING_KEYS, stat_key
 from geoff.config import PromptConfig
-from geoff.config_io import load_yaml, save_yaml
+from geoff.config_io import atomic_write, load_yaml, save_yaml
 from hypothesis import given, settings, HealthCheck
 from hypothesis.strategies import lists, text
 
@@ -403,3 +404,205 @@ def test_reset_scenario_with_global_oneoff_prompt(tmp_path):
     loaded = load_yaml(global_path)
     assert loaded.get("oneoff_prompt") == "This should persist after reset"
     assert loaded.get("task_mode") == "oneoff"
+
+
+def test_resolve_reports_template_errors(tmp_path):
+    cm = ConfigManager(working_dir=tmp_path)
+    cm.global_config_path = tmp_path / "global.yaml"
+    save_yaml(cm.global_config_path, {"prompt_tasklist_study": "do {tasks}"})
+
+    config = cm.resolve_config()
+
+    assert config.prompt_tasklist_study == "do {tasks}"
+    assert cm.template_errors == [
+        "Invalid template prompt_tasklist_study: unknown placeholder {tasks} "
+        "(expected {tasklist})"
+    ]
+
+
+class TestResolveCache:
+    def _manager(self, tmp_path):
+        cm = ConfigManager(working_dir=tmp_path)
+        cm.global_config_path = tmp_path / "global.yaml"
+        return cm
+
+    def test_unchanged_files_are_not_reparsed(self, tmp_path):
+        cm = self._manager(tmp_path)
+        save_yaml(cm.repo_config_path, {"max_iterations": 5})
+        first = cm.resolve_config()
+
+        with patch("geoff.config_manager.load_yaml") as mock_load, patch(
+            "geoff.config_manager.save_yaml"
+        ) as mock_save:
+            second = cm.resolve_config()
+
+        mock_load.assert_not_called()
+        mock_save.assert_not_called()
+        assert second == first
+        assert second.max_iterations == 5
+
+    def test_returned_config_is_independent(self, tmp_path):
+        cm = self._manager(tmp_path)
+        first = cm.resolve_config()
+        first.study_docs.append("docs/EXTRA.md")
+
+        assert cm.resolve_config().study_docs == ["docs/SPEC.md"]
+
+    def test_changed_layer_is_reparsed_alone(self, tmp_path):
+        cm = self._manager(tmp_path)
+        save_yaml(cm.repo_config_path, {"max_iterations": 5})
+        cm.resolve_config()
+
+        save_yaml(cm.repo_config_path, {"max_iterations": 6})
+        with patch(
+            "geoff.config_manager.load_yaml", side_effect=load_yaml
+        ) as mock_load:
+            config = cm.resolve_config()
+
+        assert config.max_iterations == 6
+        assert [c.args[0] for c in mock_load.call_args_list] == [cm.repo_config_path]
+
+    def test_removed_layer_invalidates(self, tmp_path):
+        cm = self._manager(tmp_path)
+        save_yaml(cm.repo_config_path, {"max_iterations": 5})
+        cm.resolve_config()
+
+        cm.repo_config_path.unlink()
+
+        assert cm.resolve_config().max_iterations == 0
+
+    def test_stat_key_tracks_inode_size_and_mtime(self, tmp_path):
+        path = tmp_path / "a.yaml"
+        assert stat_key(path) == (str(path),)
+
+        save_yaml(path, {"a": 1})
+        before = stat_key(path)
+        save_yaml(path, {"a": 1})
+
+        assert stat_key(path) != before
+
+
+class TestMaterializeWrites:
+    def _manager(self, tmp_path):
+        cm = ConfigManager(working_dir=tmp_path)
+        cm.global_config_path = tmp_path / "home" / "geoff.yaml"
+        return cm
+
+    def test_steady_state_makes_no_writes(self, tmp_path):
+        self._manager(tmp_path).resolve_config()
+        before = stat_key(tmp_path / "home" / "geoff.yaml")
+
+        with patch("geoff.config_io.atomic_write") as mock_write:
+            self._manager(tmp_path).resolve_config()
+
+        mock_write.assert_not_called()
+        assert stat_key(tmp_path / "home" / "geoff.yaml") == before
+
+    def test_rereads_under_lock_before_writing(self, tmp_path):
+        cm = self._manager(tmp_path)
+        # Another process completes the file after this one read it.
+        other = self._manager(tmp_path)
+        other.resolve_config()
+
+        with patch("geoff.config_io.atomic_write") as mock_write:
+            assert cm._materialize_base_prompt_strings({}, {}) is None
+
+        mock_write.assert_not_called()
+
+    def test_unparseable_global_config_is_left_alone(self, tmp_path):
+        cm = self._manager(tmp_path)
+        cm.global_config_path.parent.mkdir()
+        cm.global_config_path.write_text("key: [unclosed\n")
+
+        config = cm.resolve_config()
+
+        assert config == PromptConfig()
+        assert cm.global_config_path.read_text() == "key: [unclosed\n"
+
+    def test_concurrent_resolves_write_once(self, tmp_path):
+        from concurrent.futures import ThreadPoolExecutor
+
+        with patch("geoff.config_io.atomic_write", wraps=atomic_write) as mock_write:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                configs = list(
+                    pool.map(lambda _: self._manager(tmp_path).resolve_config(), range(8))
+                )
+
+        assert all(c == PromptConfig() for c in configs)
+        assert mock_write.call_count == 1
+        written = load_yaml(tmp_path / "home" / "geoff.yaml")
+        assert BASE_PROMPT_STRING_KEYS <= written.keys()
+
+
+class TestConfigSnapshot:
+    def _manager(self, tmp_path):
+        # Snapshots are only kept where .geoff already exists.
+        (tmp_path / ".geoff").mkdir(exist_ok=True)
+        cm = ConfigManager(working_dir=tmp_path)
+        cm.global_config_path = tmp_path / "home" / "geoff.yaml"
+        return cm
+
+    def test_warm_start_skips_yaml(self, tmp_path):
+        save_yaml(tmp_path / ".geoff" / "geoff.yaml", {"max_iterations": 7})
+        cold = self._manager(tmp_path).resolve_config()
+        assert self._manager(tmp_path).snapshot_path.exists()
+
+        with patch("geoff.config_manager.load_yaml") as mock_load:
+            warm = self._manager(tmp_path).resolve_config()
+
+        mock_load.assert_not_called()
+        assert warm == cold
+        assert warm.max_iterations == 7
+
+    def test_changed_layer_invalidates_snapshot(self, tmp_path):
+        self._manager(tmp_path).resolve_config()
+        save_yaml(tmp_path / ".geoff" / "geoff.yaml", {"max_iterations": 9})
+
+        assert self._manager(tmp_path).resolve_config().max_iterations == 9
+        # ...and the snapshot now describes the new layers.
+        with patch("geoff.config_manager.load_yaml") as mock_load:
+            assert self._manager(tmp_path).resolve_config().max_iterations == 9
+        mock_load.assert_not_called()
+
+    def test_other_version_is_ignored(self, tmp_path):
+        cm = self._manager(tmp_path)
+        cm.resolve_config()
+
+        with patch("geoff.config_manager.__version__", "0.0.0-other"):
+            with patch(
+                "geoff.config_manager.load_yaml", side_effect=load_yaml
+            ) as mock_load:
+                self._manager(tmp_path).resolve_config()
+
+        assert mock_load.called
+
+    def test_changed_defaults_are_not_served_from_snapshot(self, tmp_path):
+        self._manager(tmp_path).resolve_config()
+
+        with patch("geoff.config_manager._defaults_digest", return_value="other"):
+            with patch(
+                "geoff.config_manager.load_yaml", side_effect=load_yaml
+            ) as mock_load:
+                self._manager(tmp_path).resolve_config()
+
+        assert mock_load.called
+
+    def test_no_snapshot_without_state_dir(self, tmp_path):
+        cm = ConfigManager(working_dir=tmp_path)
+        cm.global_config_path = tmp_path / "home" / "geoff.yaml"
+
+        assert cm.resolve_config() == PromptConfig()
+        assert not (tmp_path / ".geoff").exists()
+
+    def test_corrupt_snapshot_is_ignored(self, tmp_path):
+        cm = self._manager(tmp_path)
+        cm.resolve_config()
+        cm.snapshot_path.write_text("{not json")
+
+        assert self._manager(tmp_path).resolve_config() == PromptConfig()
+
+    def test_unwritable_cache_dir_still_resolves(self, tmp_path):
+        cm = self._manager(tmp_path)
+        (tmp_path / ".geoff" / "cache").write_text("not a directory")
+
+        assert cm.resolve_config() == PromptConfig()
@@ -0,0 +1,166 @@
+import threading
+import time
+
+import pytest
+
+from geoff.config import PromptConfig
+from geoff.config_saver import ConfigSaver
+
+
+class Recorder:
+    def __init__(self, delay=0.0):
+        self.saved = []
+        self.threads = []
+        self.delay = delay
+
+    def __call__(self, config):
+        time.sleep(self.delay)
+        self.saved.append(config.max_iterations)
+        self.threads.append(threading.current_thread().name)
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+class TestConfigSaver:
+    def test_coalesces_updates_within_debounce(self):
+        save = Recorder()
+        saver = ConfigSaver(save, debounce=0.05)
+        config = PromptConfig()
+
+        for i in range(50):
+            config.max_iterations = i
+            saver.schedule(config)
+
+        assert wait_for(lambda: save.saved)
+        saver.close()
+        assert save.saved == [49]
+        assert save.threads == ["geoff-config-saver"]
+
+    def test_schedule_snapshots_the_config(self):
+        save = Recorder()
+        saver = ConfigSaver(save, debounce=10)
+        config = PromptConfig(max_iterations=1)
+
+        saver.schedule(config)
+        config.max_iterations = 2
+        saver.flush()
+
+        assert save.saved == [1]
+        saver.close()
+
+    def test_flush_writes_synchronously(self):
+        save = Recorder()
+        saver = ConfigSaver(save, debounce=10)
+
+        saver.schedule(PromptConfig(max_iterations=3))
+        assert saver.pending
+        saver.flush()
+
+        assert save.saved == [3]
+        assert save.threads == [threading.current_thread().name]
+        assert not saver.pending
+        saver.close()
+
+    def test_max_delay_bounds_continuous_updates(self):
+        save = Recorder()
+        saver = ConfigSaver(save, debounce=0.05, max_delay=0.1)
+        config = PromptConfig()
+
+        started = time.monotonic()
+        while not save.saved and time.monotonic() - started < 1.0:
+            config.max_iterations += 1
+            saver.schedule(config)
+            time.sleep(0.01)
+
+        assert save.saved
+        saver.close()
+
+    def test_stale_background_write_never_overwrites_flush(self):
+        save = Recorder(delay=0.1)
+        saver = ConfigSaver(save, debounce=0)
+
+        saver.schedule(PromptConfig(max_iterations=1))
+        assert wait_for(lambda: not saver.pending)
+        saver.schedule(PromptConfig(max_iterations=2))
+        saver.flush()
+        saver.close()
+
+        assert save.saved[-1] == 2
+
+    def test_discard_drops_pending(self):
+        save = Recorder()
+        saver = ConfigSaver(save, debounce=10)
+
+        saver.schedule(PromptConfig())
+        saver.discard()
+        saver.close()
+
+        assert save.saved == []
+
+    def test_close_flushes(self):
+        save = Recorder()
+        saver = ConfigSaver(save, debounce=10)
+
+        saver.schedule(PromptConfig(max_iterations=7))
+        saver.close()
+
+        assert save.saved == [7]
+        with pytest.raises(RuntimeError):
+            saver.schedule(PromptConfig())
+
+    def test_records_latency(self):
+        saver = ConfigSaver(Recorder(delay=0.02), debounce=10)
+
+        saver.schedule(PromptConfig())
+        saver.flush()
+        saver.close()
+
+        assert saver.stats.saves == 1
+        assert saver.stats.last_seconds >= 0.02
+        assert saver.stats.max_seconds == saver.stats.mean_seconds
+
+    def test_background_error_reported(self):
+        errors = []
+
+        def failing_save(config):
+            raise OSError("read-only file system")
+
+        saver = ConfigSaver(failing_save, debounce=0, on_error=errors.append)
+        saver.schedule(PromptConfig())
+
+        assert wait_for(lambda: errors)
+        assert str(errors[0]) == "read-only file system"
+        saver.close()
+
+    def test_flush_raises_save_errors(self):
+        def failing_save(config):
+            raise OSError("disk full")
+
+        saver = ConfigSaver(failing_save, debounce=10)
+        saver.schedule(PromptConfig())
+
+        with pytest.raises(OSError):
+            saver.flush()
+        saver.close()
+
+    def test_flush_checkpoints_background_writes(self):
+        save = Recorder()
+        checkpoints = []
+        saver = ConfigSaver(save, debounce=0, checkpoint=lambda: checkpoints.append(1))
+
+        saver.schedule(PromptConfig(max_iterations=1))
+        assert wait_for(lambda: save.saved)
+        assert checkpoints == []
+
+        saver.flush()
+        saver.flush()
+        saver.close()
+
+        assert checkpoints == [1]
@@ -23,3 +23,15 @@ def test_geoff_package_importable():
         import geoff
     except ImportError:
         pytest.fail("Could not import geoff package")
+
+
+def test_version_matches_pyproject():
+    """geoff.__version__ keys caches, so it must track the released version."""
+    import tomllib
+    from pathlib import Path
+
+    import geoff
+
+    pyproject = Path(__file__).resolve().parents[1] / "pyproject.toml"
+    with open(pyproject, "rb") as f:
+        assert geoff.__version__ == tomllib.load(f)["project"]["version"]
@@ -0,0 +1,138 @@
+import json
+import os
+from unittest.mock import patch
+
+from geoff import dir_hash
+from geoff.dir_hash import default_cache_path, hash_directory
+
+
+def make_tree(root):
+    (root / "src").mkdir()
+    (root / "src" / "main.py").write_text("print('hi')")
+    (root / "README.md").write_text("readme")
+
+
+class TestHashDirectory:
+    def test_stable_for_unchanged_tree(self, tmp_path):
+        make_tree(tmp_path)
+
+        assert hash_directory(tmp_path) == hash_directory(tmp_path)
+
+    def test_cached_and_uncached_hashes_agree(self, tmp_path):
+        make_tree(tmp_path)
+
+        cold = hash_directory(tmp_path, use_cache=False)
+        hash_directory(tmp_path)
+        warm = hash_directory(tmp_path)
+
+        assert cold == warm
+
+    def test_detects_in_place_edit_with_warm_cache(self, tmp_path):
+        make_tree(tmp_path)
+        hash_directory(tmp_path)
+        before = hash_directory(tmp_path)
+
+        target = tmp_path / "src" / "main.py"
+        target.write_text("print('changed!')")
+
+        assert hash_directory(tmp_path) != before
+
+    def test_detects_new_file_in_subdirectory(self, tmp_path):
+        make_tree(tmp_path)
+        before = hash_directory(tmp_path)
+
+        (tmp_path / "src" / "new.py").write_text("")
+
+        assert hash_directory(tmp_path) != before
+
+    def test_skips_default_ignored_directories(self, tmp_path):
+        make_tree(tmp_path)
+        before = hash_directory(tmp_path)
+
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / "node_modules" / "dep.js").write_text("x")
+        (tmp_path / ".venv").mkdir()
+        (tmp_path / ".venv" / "python").write_text("x")
+
+        assert hash_directory(tmp_path) == before
+
+    def test_honours_gitignore_and_geoffignore(self, tmp_path):
+        make_tree(tmp_path)
+        (tmp_path / ".gitignore").write_text("build/\n")
+        (tmp_path / "src" / ".geoffignore").write_text("*.tmp\n")
+        before = hash_directory(tmp_path)
+
+        (tmp_path / "build").mkdir()
+        (tmp_path / "build" / "out.bin").write_text("x")
+        (tmp_path / "src" / "scratch.tmp").write_text("x")
+
+        assert hash_directory(tmp_path) == before
+
+    def test_ignore_file_edit_is_picked_up_from_cache(self, tmp_path):
+        make_tree(tmp_path)
+        (tmp_path / "logs").mkdir()
+        (tmp_path / "logs" / "a.log").write_text("x")
+        (tmp_path / ".gitignore").write_text("logs/\n")
+        hash_directory(tmp_path)
+        ignored = hash_directory(tmp_path)
+
+        (tmp_path / ".gitignore").write_text("# nothing ignored\n")
+
+        assert hash_directory(tmp_path) != ignored
+        assert hash_directory(tmp_path) == hash_directory(tmp_path, use_cache=False)
+
+    def test_persists_listing_cache_under_geoff(self, tmp_path):
+        make_tree(tmp_path)
+
+        hash_directory(tmp_path)
+
+        cache = json.loads(default_cache_path(tmp_path).read_text())
+        assert set(cache["dirs"]) == {"", "src"}
+        assert cache["dirs"]["src"]["files"] == ["main.py"]
+
+    def test_corrupt_cache_is_ignored(self, tmp_path):
+        make_tree(tmp_path)
+        cache_path = default_cache_path(tmp_path)
+        cache_path.parent.mkdir(parents=True)
+        cache_path.write_text("{not json")
+
+        assert hash_directory(tmp_path) == hash_directory(tmp_path, use_cache=False)
+
+    def test_unreadable_subdirectory_is_skipped(self, tmp_path):
+        make_tree(tmp_path)
+        locked = tmp_path / "locked"
+        locked.mkdir()
+        os.chmod(locked, 0)
+        try:
+            assert len(hash_directory(tmp_path)) == 16
+        finally:
+            os.chmod(locked, 0o755)
+
+    def test_symlink_cycle_is_not_followed(self, tmp_path):
+        make_tree(tmp_path)
+        (tmp_path / "src" / "loop").symlink_to("..")
+        (tmp_path / "back").symlink_to("src")
+
+        with patch(
+            "geoff.dir_hash._scan_directory", wraps=dir_hash._scan_directory
+        ) as scan:
+            hash_directory(tmp_path, use_cache=False)
+
+        assert scan.call_count == 2
+
+    def test_symlinks_hash_their_target_not_its_contents(self, tmp_path):
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "big.txt").write_text("x")
+        root = tmp_path / "root"
+        root.mkdir()
+        (root / "home").symlink_to(outside)
+        before = hash_directory(root)
+
+        (outside / "big.txt").write_text("changed")
+        (outside / "new.txt").write_text("new")
+        assert hash_directory(root) == before
+
+        (root / "home").unlink()
+        (root / "home").symlink_to(tmp_path)
+        assert hash_directory(root) != before
@@ -2,6 +2,7 @@ import pytest
 import subprocess
 import tempfile
 import os
+import time
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 import sys
@@ -10,7 +11,10 @@ from geoff.executor import (
     compute_repo_hash,
     execute_opencode_once,
     execute_opencode_loop,
+    _OutputWriter,
+    _run_opencode_with_frozen_timeout,
 )
+from geoff.run_lock import RunLock, default_lock_path
 
 
 class TestComputeRepoHash:
@@ -48,6 +52,20 @@ class TestComputeRepoHash:
         assert len(result) == 16
         assert result.isalnum()
 
+    def test_geoff_state_dir_is_not_a_change(self, tmp_path):
+        """Run logs written under .geoff must not look like agent work."""
+        subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True)
+        (tmp_path / "tracked.txt").write_text("content")
+        subprocess.run(["git", "add", "."], cwd=tmp_path, capture_output=True)
+        (tmp_path / ".geoff").mkdir()
+
+        hash1 = compute_repo_hash(tmp_path)
+        (tmp_path / ".geoff" / "runs" / "run").mkdir(parents=True)
+        (tmp_path / ".geoff" / "runs" / "run" / "iter-0001.log.gz").write_bytes(b"x")
+        hash2 = compute_repo_hash(tmp_path)
+
+        assert hash1 == hash2
+
     def test_consistent_hash_for_same_content(self, tmp_path):
         """Same directory content should produce same hash."""
         (tmp_path / "file.txt").write_text("content")
@@ -201,12 +219,18 @@ class TestExecuteOpencodeOnce:
 
         assert mock_run.call_args[1]["check"] is False
 
+    @patch("geoff.executor.subprocess.run")
+    def test_returns_opencode_exit_code(self, mock_run, tmp_path):
+        mock_run.return_value.returncode = 2
+
+        assert execute_opencode_once("prompt", tmp_path) == 2
+
     @patch("geoff.executor.subprocess.run")
     def test_handles_keyboard_interrupt(self, mock_run, tmp_path):
         """Should handle KeyboardInterrupt gracefully."""
         mock_run.side_effect = KeyboardInterrupt()
 
-        execute_opencode_once("prompt", tmp_path)
+        assert execute_opencode_once("prompt", tmp_path) == 130
 
         mock_run.assert_called()
 
@@ -412,6 +436,29 @@ class TestExecuteOpencodeLoop:
 
         assert exc_info.value.code == 1
 
+    @patch("geoff.executor.time.sleep")
+    @patch("geoff.executor.compute_repo_hash")
+    @patch("geoff.executor.subprocess.run")
+    def test_refuses_to_run_while_another_loop_holds_lock(
+        self, mock_run, mock_hash, mock_sleep, tmp_path, capsys
+    ):
+        """A second loop in the same tree should exit without running."""
+        mock_hash.return_value = "abc123"
+        checkpoint_path = tmp_path / "loop_state.json"
+
+        with RunLock(default_lock_path(tmp_path)):
+            with pytest.raises(SystemExit) as exc_info:
+                execute_opencode_loop(
+                    "prompt",
+                    exec_dir=tmp_path,
+                    checkpoint_path=checkpoint_path,
+                )
+
+        assert exc_info.value.code == 1
+        assert "already running" in capsys.readouterr().err
+        mock_run.assert_not_called()
+        assert not checkpoint_path.exists()
+
     @patch("geoff.executor.time.sleep")
     @patch("geoff.executor.compute_repo_hash")
     @patch("geoff.executor.subprocess.run")
@@ -471,3 +518,116 @@ class TestExecuteOpencodeLoop:
         cmd = mock_run.call_args[0][0]
         assert "-m" in cmd
         assert "x/y" in cmd
+
+    @patch("geoff.executor.time.sleep")
+    @patch("geoff.executor.compute_repo_hash")
+    @patch("geoff.executor.subprocess.run")
+    def test_returns_loop_summary(self, mock_run, mock_hash, mock_sleep, tmp_path):
+        """Should report iteration count and stop reason."""
+        mock_run.return_value = MagicMock()
+        mock_hash.return_value = "same"
+
+        summary = execute_opencode_loop(
+            "prompt", max_iterations=0, max_stuck=2, exec_dir=tmp_path
+        )
+
+        assert summary.iterations == 2
+        assert summary.stuck_count == 2
+        assert summary.stop_reason == "stuck"
+
+
+class TestOutputWriter:
+    """Tests for per-line output prefixing."""
+
+    def test_prefixes_lines_split_across_chunks(self, capsys):
+        writer = _OutputWriter("[w1] ")
+        writer.write("hel")
+        writer.write("lo\nwor")
+        writer.write("ld\n")
+
+        assert capsys.readouterr().out == "[w1] hello\n[w1] world\n"
+
+    def test_no_prefix_passes_text_through(self, capsys):
+        writer = _OutputWriter()
+        writer.write("a\nb")
+
+        assert capsys.readouterr().out == "a\nb"
+
+
+class TestRunOpencodeWithFrozenTimeout:
+    """Tests for the streaming runner used when max_frozen is set."""
+
+    def test_returns_exit_code_and_output_size(self, tmp_path, capsys):
+        result = _run_opencode_with_frozen_timeout(
+            [sys.executable, "-c", "print('hi'); raise SystemExit(3)"],
+            cwd=tmp_path,
+            max_frozen_minutes=0,
+        )
+
+        assert result.returncode == 3
+        assert result.frozen is False
+        assert result.output_bytes == 3
+        assert capsys.readouterr().out == "hi\n"
+
+    def test_partial_line_does_not_stall_frozen_timeout(self, tmp_path, capsys):
+        """A child stuck after printing without a newline must still time out."""
+        code = (
+            "import sys, time\n"
+            "sys.stdout.write('spinner'); sys.stdout.flush()\n"
+            "time.sleep(30)\n"
+        )
+
+        started = time.monotonic()
+        result = _run_opencode_with_frozen_timeout(
+            [sys.executable, "-c", code], cwd=tmp_path, max_frozen_minutes=0.01
+        )
+
+        assert time.monotonic() - started < 10
+        assert result.frozen is True
+        out = capsys.readouterr().out
+        assert "spinner" in out
+        assert "Frozen timeout reached" in out
+
+    def test_output_written_while_terminating_is_kept(self, tmp_path, capsys):
+        """What a frozen child prints on SIGTERM reaches the console and log."""
+        code = (
+            "import signal, sys, time\n"
+            "def stop(*_):\n"
+            "    sys.stdout.write('stuck waiting for the API\\n')\n"
+            "    sys.stdout.flush()\n"
+            "    sys.exit(1)\n"
+            "signal.signal(signal.SIGTERM, stop)\n"
+            "print('working', flush=True)\n"
+            "time.sleep(30)\n"
+        )
+        log = MagicMock()
+
+        result = _run_opencode_with_frozen_timeout(
+            [sys.executable, "-c", code],
+            cwd=tmp_path,
+            max_frozen_minutes=0.01,
+            log=log,
+        )
+
+        assert result.frozen is True
+        assert "stuck waiting for the API" in capsys.readouterr().out
+        logged = b"".join(call.args[0] for call in log.write.call_args_list)
+        assert logged == b"working\nstuck waiting for the API\n"
+
+    def test_decodes_multibyte_characters_split_across_reads(self, tmp_path, capsys):
+        code = (
+            "import sys, time\n"
+            "data = 'caf\\u00e9'.encode()\n"
+            "sys.stdout.buffer.write(data[:-1]); sys.stdout.flush()\n"
+            "time.sleep(0.1)\n"
+            "sys.stdout.buffer.write(data[-1:] + b'\\n'); sys.stdout.flush()\n"
+        )
+
+        _run_opencode_with_frozen_timeout(
+            [sys.executable, "-c", code],
+            cwd=tmp_path,
+            max_frozen_minutes=0,
+            prefix="> ",
+        )
+
+        assert capsys.readouterr().out == "> café\n"
@@ -0,0 +1,193 @@
+import os
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from geoff.executor import compute_repo_hash
+from geoff.git_reader import GitReader, UnsupportedGitState
+from tests.conftest import git
+
+
+@pytest.fixture
+def repo(tmp_path):
+    git(tmp_path, "init")
+    (tmp_path / "a.txt").write_text("a")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "b.txt").write_text("b")
+    git(tmp_path, "add", ".")
+    git(tmp_path, "commit", "-m", "initial")
+    return tmp_path
+
+
+class TestReadHead:
+    def test_resolves_loose_ref(self, repo):
+        assert GitReader(repo).read_head() == git(repo, "rev-parse", "HEAD")
+
+    def test_resolves_packed_ref(self, repo):
+        git(repo, "pack-refs", "--all")
+        assert not any((repo / ".git" / "refs" / "heads").iterdir())
+
+        assert GitReader(repo).read_head() == git(repo, "rev-parse", "HEAD")
+
+    def test_detached_head(self, repo):
+        sha = git(repo, "rev-parse", "HEAD")
+        git(repo, "checkout", "--detach")
+
+        assert GitReader(repo).read_head() == sha
+
+    def test_unborn_branch(self, tmp_path):
+        git(tmp_path, "init")
+
+        assert GitReader(tmp_path).read_head() is None
+
+    def test_linked_worktree(self, repo, tmp_path_factory):
+        other = tmp_path_factory.mktemp("wt") / "checkout"
+        git(repo, "worktree", "add", "-b", "feature", str(other))
+
+        reader = GitReader(other)
+
+        assert reader.read_head() == git(repo, "rev-parse", "HEAD")
+        assert [e.path for e in reader.read_index().entries] == ["a.txt", "sub/b.txt"]
+
+
+class TestReadIndex:
+    def test_matches_ls_files(self, repo):
+        expected = [
+            line.split(maxsplit=3) for line in git(repo, "ls-files", "-s").splitlines()
+        ]
+
+        entries = GitReader(repo).read_index().entries
+
+        assert [(f"{e.mode:o}", e.sha, str(e.stage), e.path) for e in entries] == [
+            tuple(row) for row in expected
+        ]
+
+    def test_missing_index_is_empty(self, tmp_path):
+        git(tmp_path, "init")
+
+        assert GitReader(tmp_path).read_index().entries == []
+
+    def test_index_version_4_unsupported(self, repo):
+        git(repo, "update-index", "--index-version", "4")
+
+        with pytest.raises(UnsupportedGitState):
+            GitReader(repo).read_index()
+
+    def test_submodule_entries_unsupported(self, repo):
+        sha = git(repo, "rev-parse", "HEAD")
+        git(repo, "update-index", "--add", "--cacheinfo", f"160000,{sha},vendor")
+
+        with pytest.raises(UnsupportedGitState):
+            GitReader(repo).read_index()
+
+    def test_git_dir_override_unsupported(self, repo):
+        with patch.dict(os.environ, {"GIT_DIR": str(repo / ".git")}):
+            with pytest.raises(UnsupportedGitState):
+                GitReader(repo)
+
+
+class TestRepoHash:
+    def test_only_spawns_git_status(self, repo):
+        with patch("geoff.executor.subprocess.run", wraps=subprocess.run) as mock_run:
+            compute_repo_hash(repo)
+
+        assert [c.args[0][1] for c in mock_run.call_args_list] == ["status"]
+
+    def test_stable_when_nothing_changes(self, repo):
+        assert compute_repo_hash(repo) == compute_repo_hash(repo)
+
+    def test_git_status_does_not_change_hash(self, repo):
+        before = compute_repo_hash(repo)
+        git(repo, "status")
+
+        assert compute_repo_hash(repo) == before
+
+    def test_changes_on_modification(self, repo):
+        before = compute_repo_hash(repo)
+        (repo / "sub" / "b.txt").write_text("changed")
+
+        assert compute_repo_hash(repo) != before
+
+    def test_changes_on_untracked_file_in_subdir(self, repo):
+        before = compute_repo_hash(repo)
+        (repo / "sub" / "new.txt").write_text("new")
+
+        assert compute_repo_hash(repo) != before
+
+    def test_changes_on_staging_and_commit(self, repo):
+        (repo / "a.txt").write_text("a2")
+        modified = compute_repo_hash(repo)
+
+        git(repo, "add", "a.txt")
+        staged = compute_repo_hash(repo)
+        git(repo, "commit", "-m", "second")
+        committed = compute_repo_hash(repo)
+
+        assert len({modified, staged, committed}) == 3
+
+    def test_changes_on_deletion(self, repo):
+        before = compute_repo_hash(repo)
+        (repo / "a.txt").unlink()
+
+        assert compute_repo_hash(repo) != before
+
+    def test_ignored_files_do_not_change_hash(self, repo):
+        (repo / ".gitignore").write_text(".pytest_cache/\n*.log\n")
+        before = compute_repo_hash(repo)
+        (repo / ".pytest_cache" / "v").mkdir(parents=True)
+        (repo / ".pytest_cache" / "v" / "nodeids").write_text("[]")
+        (repo / "sub" / "run.log").write_text("x")
+
+        assert compute_repo_hash(repo) == before
+
+    def test_honours_info_exclude(self, repo):
+        (repo / ".git" / "info").mkdir(exist_ok=True)
+        (repo / ".git" / "info" / "exclude").write_text("scratch/\n")
+        before = compute_repo_hash(repo)
+        (repo / "scratch").mkdir()
+        (repo / "scratch" / "notes").write_text("x")
+
+        assert compute_repo_hash(repo) == before
+
+    def test_honours_core_excludes_file(self, repo, tmp_path_factory):
+        excludes = tmp_path_factory.mktemp("home") / "ignore"
+        excludes.write_text("*.swp\n")
+        git(repo, "config", "core.excludesFile", str(excludes))
+        before = compute_repo_hash(repo)
+        (repo / "sub" / "b.txt.swp").write_text("x")
+
+        assert compute_repo_hash(repo) == before
+
+    def test_temp_file_created_and_deleted(self, repo):
+        before = compute_repo_hash(repo)
+
+        (repo / "sub" / "tmp.swp").write_text("x")
+        (repo / "sub" / "tmp.swp").unlink()
+        (repo / "scratch").mkdir()
+        (repo / "scratch").rmdir()
+
+        assert compute_repo_hash(repo) == before
+
+    def test_asks_git_for_head_when_reader_cannot(self, repo):
+        before = compute_repo_hash(repo)
+
+        with patch(
+            "geoff.executor.GitReader.read_head",
+            side_effect=UnsupportedGitState("test"),
+        ):
+            assert compute_repo_hash(repo) == before
+
+    def test_unborn_branch(self, tmp_path):
+        git(tmp_path, "init")
+        (tmp_path / "a.txt").write_text("a")
+
+        assert compute_repo_hash(tmp_path) == compute_repo_hash(tmp_path)
+
+    def test_non_git_directory_skips_git(self, tmp_path):
+        (tmp_path / "file.txt").write_text("x")
+
+        with patch("geoff.executor.subprocess.run") as mock_run:
+            compute_repo_hash(tmp_path)
+
+        mock_run.assert_not_called()
@@ -0,0 +1,74 @@
+import pytest
+
+from geoff.ignore import IgnoreRules, parse_lines, parse_pattern
+
+
+def rules_for(*lines, base=""):
+    return IgnoreRules().extend(parse_lines(lines, base))
+
+
+class TestParsePattern:
+    def test_skips_blank_and_comment_lines(self):
+        assert parse_pattern("") is None
+        assert parse_pattern("   ") is None
+        assert parse_pattern("# comment") is None
+
+    def test_escaped_hash_is_literal(self):
+        rules = rules_for("\\#notes")
+        assert rules.is_ignored("#notes", False)
+
+
+class TestIsIgnored:
+    @pytest.mark.parametrize(
+        "path,is_dir,expected",
+        [
+            ("debug.log", False, True),
+            ("nested/dir/debug.log", False, True),
+            ("debug.txt", False, False),
+        ],
+    )
+    def test_unanchored_glob_matches_at_any_depth(self, path, is_dir, expected):
+        assert rules_for("*.log").is_ignored(path, is_dir) is expected
+
+    def test_negation_reincludes(self):
+        rules = rules_for("*.log", "!keep.log")
+        assert rules.is_ignored("drop.log", False)
+        assert not rules.is_ignored("keep.log", False)
+
+    def test_leading_slash_anchors_to_base(self):
+        rules = rules_for("/build")
+        assert rules.is_ignored("build", True)
+        assert not rules.is_ignored("src/build", True)
+
+    def test_trailing_slash_only_matches_directories(self):
+        rules = rules_for("out/")
+        assert rules.is_ignored("out", True)
+        assert not rules.is_ignored("out", False)
+
+    def test_double_star(self):
+        rules = rules_for("docs/**/*.tmp")
+        assert rules.is_ignored("docs/a.tmp", False)
+        assert rules.is_ignored("docs/a/b/c.tmp", False)
+        assert not rules.is_ignored("other/a.tmp", False)
+
+    def test_character_class(self):
+        rules = rules_for("file[0-9].txt", "tmp[!a].txt")
+        assert rules.is_ignored("file3.txt", False)
+        assert not rules.is_ignored("filex.txt", False)
+        assert rules.is_ignored("tmpb.txt", False)
+        assert not rules.is_ignored("tmpa.txt", False)
+
+    def test_rules_from_subdirectory_apply_only_below_it(self):
+        rules = rules_for("*.gen", base="pkg")
+        assert rules.is_ignored("pkg/a.gen", False)
+        assert not rules.is_ignored("a.gen", False)
+
+    def test_defaults_skip_dependency_and_state_dirs(self):
+        rules = IgnoreRules.defaults()
+        for name in (".git", ".geoff", "node_modules", ".venv", "__pycache__"):
+            assert rules.is_ignored(name, True)
+            assert rules.is_ignored(f"sub/{name}", True)
+
+    def test_fingerprint_tracks_rules(self):
+        assert rules_for("*.log").fingerprint == rules_for("*.log").fingerprint
+        assert rules_for("*.log").fingerprint != rules_for("*.tmp").fingerprint
@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import patch, MagicMock
 from pathlib import Path
+from geoff.config import PromptConfig
 from textual.widgets import Input, Checkbox, TextArea, RadioButton
 from geoff.widgets.prompt_preview import PromptPreviewWidget
 from geoff.widgets.task_source import TaskSourceWidget
@@ -120,3 +121,50 @@ async def test_theme_persistence_and_reactivity(mock_config_manager, tmp_path):
         # Verify it's saved to the actual config object passed to the mock
         saved_config = mock_config_manager.save_repo_config.call_args[0][0]
         assert saved_config.theme == "dracula"
+
+
+@pytest.mark.asyncio
+async def test_edits_are_saved_behind_and_flushed_on_exit(mock_config_manager):
+    from geoff.app import GeoffApp
+
+    mock_config_manager.resolve_config.side_effect = lambda: PromptConfig(
+        config_save_debounce=60
+    )
+    app = GeoffApp()
+    async with app.run_test(size=(120, 80)) as pilot:
+        mock_config_manager.save_repo_config.reset_mock()
+        app.query_one("#tasklist-input", Input).value = "typed/plan.md"
+        await pilot.pause()
+
+        # Still inside the debounce window: nothing written yet.
+        mock_config_manager.save_repo_config.assert_not_called()
+
+    mock_config_manager.save_repo_config.assert_called_once()
+    saved_config = mock_config_manager.save_repo_config.call_args[0][0]
+    assert saved_config.tasklist_file == "typed/plan.md"
+
+
+@pytest.mark.asyncio
+async def test_inputs_show_live_validation_status(mock_config_manager, tmp_path):
+    from geoff.app import GeoffApp
+
+    breadcrumbs = tmp_path / "notes" / "BREADCRUMBS.md"
+    tasklist = tmp_path / "PLAN.md"
+    tasklist.write_text("")
+    app = GeoffApp()
+    async with app.run_test(size=(120, 80)) as pilot:
+        tasklist_input = app.query_one("#tasklist-input", Input)
+        tasklist_input.value = str(tmp_path / "missing.md")
+        app.query_one("#breadcrumbs-input", Input).value = str(breadcrumbs)
+        await pilot.pause()
+
+        assert tasklist_input.has_class("field-error")
+        assert "Tasklist file not found" in str(tasklist_input.tooltip)
+
+        tasklist_input.value = str(tasklist)
+        await pilot.pause()
+
+        assert not tasklist_input.has_class("field-error")
+        assert tasklist_input.tooltip is None
+        # Checking a missing breadcrumbs file must not create it.
+        assert not breadcrumbs.parent.exists()
@@ -0,0 +1,186 @@
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from geoff.executor import execute_opencode_loop, resume_opencode_loop
+from geoff.loop_state import (
+    LoopState,
+    LoopStateError,
+    default_state_path,
+    load_loop_state,
+    save_loop_state,
+)
+
+
+class TestLoopStateFile:
+    def test_round_trip(self, tmp_path):
+        path = default_state_path(tmp_path)
+        state = LoopState(prompt="do it", max_iterations=10, iterations=3)
+
+        save_loop_state(path, state)
+        loaded = load_loop_state(path)
+
+        assert loaded.prompt == "do it"
+        assert loaded.max_iterations == 10
+        assert loaded.iterations == 3
+        assert loaded.status == "running"
+
+    def test_save_leaves_no_temp_files(self, tmp_path):
+        path = default_state_path(tmp_path)
+        save_loop_state(path, LoopState(prompt="p"))
+        save_loop_state(path, LoopState(prompt="p", iterations=1))
+
+        assert [p.name for p in path.parent.iterdir()] == ["loop-state"]
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(LoopStateError):
+            load_loop_state(default_state_path(tmp_path))
+
+    def test_corrupt_file(self, tmp_path):
+        path = default_state_path(tmp_path)
+        path.parent.mkdir(parents=True)
+        path.write_text("{not json")
+
+        with pytest.raises(LoopStateError):
+            load_loop_state(path)
+
+    def test_unknown_version(self, tmp_path):
+        path = default_state_path(tmp_path)
+        path.parent.mkdir(parents=True)
+        path.write_text(json.dumps({"version": 99, "prompt": "p"}))
+
+        with pytest.raises(LoopStateError):
+            load_loop_state(path)
+
+    def test_finished_states_are_not_resumable(self):
+        assert LoopState(prompt="p", status="running").resumable
+        assert LoopState(prompt="p", status="cancelled").resumable
+        assert not LoopState(prompt="p", status="stuck").resumable
+        assert not LoopState(prompt="p", status="max_iterations").resumable
+
+
+@patch("geoff.executor.time.sleep")
+@patch("geoff.executor.subprocess.run")
+class TestCheckpointedLoop:
+    def test_checkpoint_written_after_each_iteration(
+        self, mock_run, mock_sleep, tmp_path
+    ):
+        path = default_state_path(tmp_path)
+        seen = []
+
+        def run(cmd, cwd, check):
+            # The checkpoint reflects the iterations completed so far.
+            if path.exists():
+                seen.append(load_loop_state(path).iterations)
+            return MagicMock(returncode=0)
+
+        mock_run.side_effect = run
+        with patch("geoff.executor.compute_repo_hash", return_value="same"):
+            execute_opencode_loop(
+                "prompt", max_stuck=3, exec_dir=tmp_path, checkpoint_path=path
+            )
+
+        assert seen == [0, 1, 2]
+        state = load_loop_state(path)
+        assert state.iterations == 3
+        assert state.stuck_count == 3
+        assert state.last_hash == "same"
+        assert state.status == "stuck"
+
+    def test_interrupted_loop_resumes_with_counters(
+        self, mock_run, mock_sleep, tmp_path
+    ):
+        path = default_state_path(tmp_path)
+        calls = {"n": 0}
+
+        def run(cmd, cwd, check):
+            calls["n"] += 1
+            if calls["n"] == 3:
+                raise KeyboardInterrupt
+            return MagicMock(returncode=0)
+
+        mock_run.side_effect = run
+        hashes = iter(str(i) for i in range(100))
+        with patch(
+            "geoff.executor.compute_repo_hash", side_effect=lambda _: next(hashes)
+        ):
+            first = execute_opencode_loop(
+                "the prompt",
+                max_iterations=5,
+                max_stuck=2,
+                exec_dir=tmp_path,
+                model="x/y",
+                checkpoint_path=path,
+            )
+
+        assert first.stop_reason == "cancelled"
+        state = load_loop_state(path)
+        assert state.status == "cancelled"
+        assert state.iterations == 3
+
+        mock_run.side_effect = None
+        mock_run.return_value = MagicMock(returncode=0)
+        hashes = iter(str(i) for i in range(100))
+        with patch(
+            "geoff.executor.compute_repo_hash", side_effect=lambda _: next(hashes)
+        ):
+            summary = resume_opencode_loop(exec_dir=tmp_path)
+
+        # Iteration 3 died mid-run and is counted; 4 and 5 remain.
+        assert mock_run.call_count == 5
+        assert summary.iterations == 5
+        assert summary.stop_reason == "max_iterations"
+        cmd = mock_run.call_args[0][0]
+        assert "the prompt" in cmd
+        assert "x/y" in cmd
+        assert load_loop_state(path).status == "max_iterations"
+
+    def test_resume_keeps_stuck_count_when_repo_unchanged(
+        self, mock_run, mock_sleep, tmp_path
+    ):
+        path = default_state_path(tmp_path)
+        save_loop_state(
+            path,
+            LoopState(prompt="p", max_stuck=2, stuck_count=1, last_hash="h1"),
+        )
+        mock_run.return_value = MagicMock(returncode=0)
+
+        with patch("geoff.executor.compute_repo_hash", return_value="h1"):
+            summary = resume_opencode_loop(exec_dir=tmp_path)
+
+        assert summary.stop_reason == "stuck"
+        assert mock_run.call_count == 1
+
+    def test_resume_resets_stuck_count_when_repo_changed(
+        self, mock_run, mock_sleep, tmp_path, capsys
+    ):
+        path = default_state_path(tmp_path)
+        save_loop_state(
+            path,
+            LoopState(prompt="p", max_stuck=2, stuck_count=1, last_hash="h1"),
+        )
+        mock_run.return_value = MagicMock(returncode=0)
+
+        with patch("geoff.executor.compute_repo_hash", return_value="h2"):
+            summary = resume_opencode_loop(exec_dir=tmp_path)
+
+        assert summary.stop_reason == "stuck"
+        assert mock_run.call_count == 2
+        assert "stuck count reset" in capsys.readouterr().out
+
+    def test_resume_refuses_finished_loop(self, mock_run, mock_sleep, tmp_path):
+        path = default_state_path(tmp_path)
+        save_loop_state(path, LoopState(prompt="p", status="stuck"))
+
+        with pytest.raises(SystemExit) as exc_info:
+            resume_opencode_loop(exec_dir=tmp_path)
+
+        assert exc_info.value.code == 1
+        mock_run.assert_not_called()
+
+    def test_resume_without_checkpoint_exits(self, mock_run, mock_sleep, tmp_path):
+        with pytest.raises(SystemExit) as exc_info:
+            resume_opencode_loop(exec_dir=tmp_path)
+
+        assert exc_info.value.code == 1
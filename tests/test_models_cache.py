@@ -0,0 +1,53 @@
+import json
+import time
+
+from geoff.models_cache import CachedModels, ModelsCache
+
+
+class TestModelsCache:
+    def test_missing_cache_loads_none(self, tmp_path):
+        assert ModelsCache(tmp_path / "models.json").load() is None
+
+    def test_round_trip(self, tmp_path):
+        cache = ModelsCache(tmp_path / "cache" / "models.json")
+        cache.store(["openai/gpt-4o", "anthropic/claude"], now=1000.0)
+
+        cached = cache.load()
+        assert cached == CachedModels(["openai/gpt-4o", "anthropic/claude"], 1000.0)
+
+    def test_corrupt_cache_loads_none(self, tmp_path):
+        path = tmp_path / "models.json"
+        path.write_text("{not json")
+        assert ModelsCache(path).load() is None
+
+        path.write_text(json.dumps({"models": [1, 2], "fetched_at": 0}))
+        assert ModelsCache(path).load() is None
+
+    def test_other_geoff_version_loads_none(self, tmp_path):
+        path = tmp_path / "models.json"
+        cache = ModelsCache(path)
+        cache.store(["openai/gpt-4o"])
+        data = json.loads(path.read_text())
+        data["geoff_version"] = "0.0.0"
+        path.write_text(json.dumps(data))
+
+        assert cache.load() is None
+
+    def test_store_ignores_unwritable_location(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        ModelsCache(blocker / "models.json").store(["openai/gpt-4o"])
+
+
+class TestCachedModels:
+    def test_fresh_within_ttl(self):
+        cached = CachedModels(["a/b"], fetched_at=time.time())
+        assert cached.is_fresh(60)
+
+    def test_stale_after_ttl(self):
+        cached = CachedModels(["a/b"], fetched_at=1000.0)
+        assert not cached.is_fresh(60, now=1061.0)
+
+    def test_future_timestamp_is_stale(self):
+        cached = CachedModels(["a/b"], fetched_at=2000.0)
+        assert not cached.is_fresh(60, now=1000.0)
@@ -0,0 +1,99 @@
+import random
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from geoff.config import PromptConfig
+from geoff.executor import execute_opencode_loop
+from geoff.pacing import (
+    AdaptivePacing,
+    FixedPacing,
+    PacingPolicy,
+    pacing_from_config,
+)
+
+
+class TestPacingPolicy:
+    def test_is_abstract(self):
+        with pytest.raises(TypeError):
+            PacingPolicy()
+
+
+class TestFixedPacing:
+    def test_always_same_delay(self):
+        pacing = FixedPacing(3.0)
+        assert pacing.delay(changed=True, failed=False) == 3.0
+        assert pacing.delay(changed=False, failed=True) == 3.0
+
+
+class TestAdaptivePacing:
+    def test_no_delay_after_productive_iteration(self):
+        pacing = AdaptivePacing(base_delay=2.0, jitter=0.0)
+        assert pacing.delay(changed=True, failed=False) == 0.0
+
+    def test_backs_off_exponentially_and_caps(self):
+        pacing = AdaptivePacing(base_delay=1.0, max_delay=5.0, jitter=0.0)
+        delays = [pacing.delay(changed=False, failed=False) for _ in range(5)]
+        assert delays == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+    def test_long_failure_streak_does_not_overflow(self):
+        pacing = AdaptivePacing(base_delay=1.0, max_delay=60.0, jitter=0.0)
+        pacing.failures = 5000
+
+        assert pacing.delay(changed=False, failed=True) == 60.0
+
+    def test_failure_backs_off_even_with_changes(self):
+        pacing = AdaptivePacing(base_delay=1.0, jitter=0.0)
+        assert pacing.delay(changed=True, failed=True) == 1.0
+
+    def test_productive_iteration_resets_backoff(self):
+        pacing = AdaptivePacing(base_delay=1.0, jitter=0.0)
+        pacing.delay(changed=False, failed=False)
+        pacing.delay(changed=False, failed=False)
+        pacing.delay(changed=True, failed=False)
+        assert pacing.delay(changed=False, failed=False) == 1.0
+
+    def test_jitter_stays_within_bounds(self):
+        pacing = AdaptivePacing(
+            base_delay=10.0, max_delay=10.0, jitter=0.5, rng=random.Random(1)
+        )
+        for _ in range(50):
+            assert 5.0 <= pacing.delay(changed=False, failed=True) <= 10.0
+
+    def test_clone_has_fresh_state(self):
+        pacing = AdaptivePacing(base_delay=1.0, jitter=0.0)
+        pacing.delay(changed=False, failed=False)
+        assert pacing.clone().failures == 0
+
+
+class TestPacingFromConfig:
+    def test_adaptive_by_default(self):
+        pacing = pacing_from_config(PromptConfig())
+        assert isinstance(pacing, AdaptivePacing)
+        assert pacing.base_delay == 2.0
+        assert pacing.max_delay == 300.0
+
+    def test_fixed(self):
+        pacing = pacing_from_config(PromptConfig(pacing="fixed", pacing_base_delay=7))
+        assert isinstance(pacing, FixedPacing)
+        assert pacing.seconds == 7
+
+
+class TestLoopPacing:
+    @patch("geoff.executor.time.sleep")
+    @patch("geoff.executor.compute_repo_hash")
+    @patch("geoff.executor.subprocess.run")
+    def test_loop_uses_policy_delay(self, mock_run, mock_hash, mock_sleep, tmp_path):
+        mock_run.return_value = MagicMock(returncode=0)
+        # Iteration 1 changes the repo, 2 and 3 do not.
+        mock_hash.side_effect = ["a", "b", "b", "b", "b", "b"]
+
+        execute_opencode_loop(
+            "prompt",
+            max_stuck=2,
+            exec_dir=tmp_path,
+            pacing=AdaptivePacing(base_delay=4.0, jitter=0.0),
+        )
+
+        # No pause after the productive iteration, backoff after the stuck one.
+        mock_sleep.assert_called_once_with(4.0)
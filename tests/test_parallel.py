@@ -0,0 +1,216 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from geoff.parallel import (
+    WorktreeError,
+    create_worktrees,
+    execute_opencode_parallel,
+)
+from geoff.executor import ProcessResult, resume_opencode_loop
+from geoff.loop_state import default_state_path, load_loop_state
+from geoff.run_lock import RunLock, default_lock_path
+from tests.conftest import git, interrupted
+
+
+class TestCreateWorktrees:
+    def test_creates_one_worktree_per_worker(self, git_repo):
+        paths = create_worktrees(git_repo, 2)
+
+        assert paths == [
+            git_repo / ".geoff" / "worktrees" / "worker-1",
+            git_repo / ".geoff" / "worktrees" / "worker-2",
+        ]
+        for path in paths:
+            assert (path / "README.md").read_text() == "hello"
+
+    def test_each_worker_gets_its_own_branch(self, git_repo):
+        paths = create_worktrees(git_repo, 2)
+
+        branches = [git(path, "rev-parse", "--abbrev-ref", "HEAD") for path in paths]
+        assert branches == ["geoff/worker-1", "geoff/worker-2"]
+
+    def test_reuses_existing_worktrees(self, git_repo):
+        first = create_worktrees(git_repo, 1)
+        (first[0] / "scratch.txt").write_text("keep me")
+
+        second = create_worktrees(git_repo, 1)
+
+        assert second == first
+        assert (second[0] / "scratch.txt").read_text() == "keep me"
+
+    def test_raises_outside_git_repo(self, tmp_path):
+        with pytest.raises(WorktreeError):
+            create_worktrees(tmp_path, 2)
+
+
+class TestExecuteOpencodeParallel:
+    @patch("geoff.executor.compute_repo_hash", return_value="same")
+    @patch("geoff.async_executor.run_opencode_async")
+    def test_runs_independent_loop_per_worker(
+        self, mock_run, mock_hash, git_repo, capsys
+    ):
+        results = execute_opencode_parallel(
+            "prompt", workers=3, max_iterations=2, max_stuck=5, exec_dir=git_repo
+        )
+
+        assert [r.worker for r in results] == [1, 2, 3]
+        assert all(r.summary.iterations == 2 for r in results)
+        assert all(r.summary.stop_reason == "max_iterations" for r in results)
+        assert mock_run.call_count == 6
+
+        used_dirs = {call.kwargs["cwd"] for call in mock_run.call_args_list}
+        assert used_dirs == {r.worktree for r in results}
+
+        out = capsys.readouterr().out
+        assert "Total iterations: 6" in out
+
+    @patch("geoff.executor.compute_repo_hash", return_value="same")
+    @patch("geoff.async_executor.run_opencode_async")
+    def test_tracks_stuck_state_per_worker(self, mock_run, mock_hash, git_repo):
+        results = execute_opencode_parallel(
+            "prompt", workers=2, max_iterations=0, max_stuck=1, exec_dir=git_repo
+        )
+
+        assert all(r.summary.stop_reason == "stuck" for r in results)
+        assert all(r.summary.stuck_count == 1 for r in results)
+
+    @patch("geoff.async_executor.run_opencode_async")
+    def test_records_missing_opencode_per_worker(self, mock_run, git_repo):
+        mock_run.side_effect = FileNotFoundError()
+
+        results = execute_opencode_parallel(
+            "prompt", workers=2, max_iterations=1, exec_dir=git_repo
+        )
+
+        assert all(r.error == "'opencode' command not found" for r in results)
+
+    @patch("geoff.executor.compute_repo_hash", return_value="same")
+    @patch("geoff.async_executor.run_opencode_async")
+    def test_skips_worktree_locked_by_another_loop(
+        self, mock_run, mock_hash, git_repo
+    ):
+        busy = create_worktrees(git_repo, 2)[1]
+
+        with RunLock(default_lock_path(busy)):
+            results = execute_opencode_parallel(
+                "prompt", workers=2, max_iterations=1, exec_dir=git_repo
+            )
+
+        assert results[0].summary.stop_reason == "max_iterations"
+        assert results[1].summary.stop_reason == "error"
+        assert results[1].summary.iterations == 0
+        assert "already running" in results[1].error
+        assert {call.kwargs["cwd"] for call in mock_run.call_args_list} == {
+            results[0].worktree
+        }
+
+    @patch("geoff.executor.compute_repo_hash", return_value="same")
+    @patch("geoff.async_executor.run_opencode_async")
+    def test_releases_worktree_locks(self, mock_run, mock_hash, git_repo):
+        results = execute_opencode_parallel(
+            "prompt", workers=1, max_iterations=1, exec_dir=git_repo
+        )
+
+        lock = RunLock(default_lock_path(results[0].worktree))
+        lock.acquire()
+        lock.release()
+
+    @patch("geoff.executor.compute_repo_hash", return_value="same")
+    @patch("geoff.async_executor.run_opencode_async")
+    def test_checkpoints_each_worker_in_its_worktree(
+        self, mock_run, mock_hash, git_repo
+    ):
+        mock_run.return_value = ProcessResult(returncode=0)
+        results = execute_opencode_parallel(
+            "prompt",
+            workers=2,
+            max_iterations=2,
+            max_stuck=5,
+            exec_dir=git_repo,
+            checkpoint=True,
+        )
+
+        assert not default_state_path(git_repo).exists()
+        for result in results:
+            state = load_loop_state(default_state_path(result.worktree))
+            assert state.prompt == "prompt"
+            assert state.iterations == 2
+            assert state.status == "max_iterations"
+
+    @patch("geoff.executor.time.sleep")
+    @patch("geoff.executor.compute_repo_hash", return_value="same")
+    @patch("geoff.async_executor.run_opencode_async")
+    def test_failed_worker_resumes_from_its_worktree(
+        self, mock_run, mock_hash, mock_sleep, git_repo
+    ):
+        mock_run.side_effect = RuntimeError("boom")
+        results = execute_opencode_parallel(
+            "prompt",
+            workers=1,
+            max_iterations=3,
+            max_stuck=5,
+            exec_dir=git_repo,
+            checkpoint=True,
+        )
+        worktree = results[0].worktree
+        assert load_loop_state(default_state_path(worktree)).status == "error"
+
+        with patch("geoff.executor.subprocess.run") as mock_subprocess:
+            mock_subprocess.return_value = MagicMock(returncode=0)
+            summary = resume_opencode_loop(exec_dir=worktree)
+
+        assert summary.iterations == 3
+        assert summary.stop_reason == "max_iterations"
+        assert mock_subprocess.call_count == 2
+        assert mock_subprocess.call_args.kwargs["cwd"] == worktree
+
+    @patch("geoff.executor.compute_repo_hash", return_value="same")
+    @patch("geoff.async_executor.run_opencode_async")
+    def test_ctrl_c_cancels_every_worker(self, mock_run, mock_hash, git_repo, capsys):
+        mock_run.side_effect = interrupted
+        results = execute_opencode_parallel(
+            "prompt", workers=2, max_iterations=3, exec_dir=git_repo, checkpoint=True
+        )
+
+        assert [r.summary.stop_reason for r in results] == ["cancelled"] * 2
+        assert "Parallel loop cancelled by user" in capsys.readouterr().out
+        for result in results:
+            state = load_loop_state(default_state_path(result.worktree))
+            assert state.status == "cancelled"
+            assert state.resumable
+        lock = RunLock(default_lock_path(results[0].worktree))
+        lock.acquire()
+        lock.release()
+
+    @patch("geoff.executor.compute_repo_hash", return_value="same")
+    @patch("geoff.async_executor.run_opencode_async")
+    def test_copies_missing_shared_files_into_worktrees(
+        self, mock_run, mock_hash, git_repo
+    ):
+        (git_repo / "docs").mkdir()
+        for name in ("SPEC.md", "PLAN.md", "BREADCRUMBS.md"):
+            (git_repo / "docs" / name).write_text(f"root {name}")
+        kept = create_worktrees(git_repo, 2)[1] / "docs" / "PLAN.md"
+        kept.parent.mkdir()
+        kept.write_text("edited by worker 2")
+
+        results = execute_opencode_parallel(
+            "prompt",
+            workers=2,
+            max_iterations=1,
+            exec_dir=git_repo,
+            shared_files=["docs/SPEC.md", "docs/PLAN.md", "docs/BREADCRUMBS.md"],
+        )
+
+        docs = results[0].worktree / "docs"
+        assert (docs / "SPEC.md").read_text() == "root SPEC.md"
+        assert (docs / "PLAN.md").read_text() == "root PLAN.md"
+        assert (docs / "BREADCRUMBS.md").read_text() == "root BREADCRUMBS.md"
+        assert kept.read_text() == "edited by worker 2"
+
+    def test_exits_outside_git_repo(self, tmp_path):
+        with pytest.raises(SystemExit) as exc_info:
+            execute_opencode_parallel("prompt", workers=2, exec_dir=tmp_path)
+
+        assert exc_info.value.code == 1
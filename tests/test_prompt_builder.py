@@ -1,5 +1,5 @@
 from geoff.config import PromptConfig
-from geoff.prompt_builder import build_prompt
+from geoff.prompt_builder import PromptCompiler, build_prompt, prompt_files
 
 
 def test_build_prompt_defaults():
@@ -156,3 +156,53 @@ def test_custom_empty_backpressure_lines():
     assert "IMPORTANT:" in lines
     backpressure_idx = lines.index("IMPORTANT:")
     assert backpressure_idx < len(lines) - 1
+
+
+def test_prompt_files_defaults():
+    assert prompt_files(PromptConfig()) == [
+        "docs/SPEC.md",
+        "docs/PLAN.md",
+        "docs/BREADCRUMBS.md",
+    ]
+
+
+def test_prompt_files_skips_unused_files():
+    config = PromptConfig(
+        study_docs=["docs/SPEC.md", " "],
+        task_mode="oneoff",
+        breadcrumb_enabled=False,
+    )
+
+    assert prompt_files(config) == ["docs/SPEC.md"]
+
+
+class TestPromptCompiler:
+    def test_unchanged_config_recomputes_nothing(self):
+        compiler = PromptCompiler()
+        config = PromptConfig()
+
+        first = compiler.compile(config)
+        assert len(compiler.recomputed) == 5
+
+        assert compiler.compile(config) == first
+        assert compiler.recomputed == ()
+
+    def test_only_edited_section_is_recomputed(self):
+        compiler = PromptCompiler()
+        config = PromptConfig(task_mode="oneoff", oneoff_prompt="one")
+        compiler.compile(config)
+
+        config.oneoff_prompt = "two"
+
+        assert compiler.compile(config) == build_prompt(config)
+        assert compiler.recomputed == ("task_source",)
+
+    def test_breadcrumb_toggle_touches_both_breadcrumb_sections(self):
+        compiler = PromptCompiler()
+        config = PromptConfig()
+        compiler.compile(config)
+
+        config.breadcrumb_enabled = False
+
+        assert compiler.compile(config) == build_prompt(config)
+        assert compiler.recomputed == ("study_docs", "breadcrumb")
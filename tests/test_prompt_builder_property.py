@@ -1,6 +1,6 @@
 from hypothesis import given, settings, strategies as st
 from geoff.config import PromptConfig
-from geoff.prompt_builder import build_prompt
+from geoff.prompt_builder import PromptCompiler, build_prompt
 
 
 def filepath_strategy(min_size=1, max_size=50):
@@ -407,3 +407,45 @@ def test_all_custom_strings_used_together(
     for line in prompt_backpressure_lines:
         assert line in prompt
     assert prompt_breadcrumb_instruction.format(breadcrumbs=breadcrumbs_file) in prompt
+
+
+def config_strategy():
+    return st.builds(
+        PromptConfig,
+        study_docs=st.lists(filepath_strategy(min_size=0), max_size=4),
+        breadcrumbs_file=filepath_strategy(min_size=0),
+        tasklist_file=filepath_strategy(min_size=0),
+        oneoff_prompt=text_strategy(min_size=0),
+        backpressure_enabled=st.booleans(),
+        breadcrumb_enabled=st.booleans(),
+        task_mode=st.sampled_from(["tasklist", "oneoff"]),
+        prompt_tasklist_study=st.sampled_from(["study {tasklist}", "{tasklist}!"]),
+        prompt_tasklist_update=st.sampled_from(["update {tasklist}", ""]),
+        prompt_backpressure_header=text_strategy(min_size=0, max_size=20),
+        prompt_backpressure_lines=st.lists(
+            text_strategy(min_size=0, max_size=20), max_size=3
+        ),
+        prompt_breadcrumb_instruction=st.sampled_from(
+            ["note {breadcrumbs}", "{breadcrumbs}"]
+        ),
+    )
+
+
+@given(configs=st.lists(config_strategy(), min_size=1, max_size=6))
+@settings(max_examples=100)
+def test_compiler_matches_build_prompt_across_edits(configs):
+    compiler = PromptCompiler()
+    for config in configs:
+        assert compiler.compile(config) == build_prompt(config)
+
+
+@given(config=config_strategy(), new_doc=filepath_strategy())
+@settings(max_examples=50)
+def test_compiler_tracks_in_place_edits(config, new_doc):
+    compiler = PromptCompiler()
+    compiler.compile(config)
+
+    config.study_docs.append(new_doc)
+
+    assert compiler.compile(config) == build_prompt(config)
+    assert compiler.recomputed == ("study_docs",)
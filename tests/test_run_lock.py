@@ -0,0 +1,59 @@
+import json
+import os
+
+import pytest
+
+from geoff.run_lock import LockHolder, RunLock, RunLockError, default_lock_path
+
+
+class TestRunLock:
+    def test_acquire_writes_holder(self, tmp_path):
+        path = default_lock_path(tmp_path)
+        with RunLock(path) as lock:
+            assert lock.held
+            holder = json.loads(path.read_text())
+            assert holder["pid"] == os.getpid()
+            assert holder["started_at"] > 0
+
+        assert not lock.held
+        assert path.exists()
+        assert path.read_text() == ""
+
+    def test_second_lock_fails_naming_holder(self, tmp_path):
+        path = default_lock_path(tmp_path)
+        with RunLock(path):
+            with pytest.raises(RunLockError) as exc_info:
+                RunLock(path).acquire()
+
+        message = str(exc_info.value)
+        assert f"pid {os.getpid()}" in message
+        assert "started" in message
+        assert str(path) in message
+
+    def test_release_allows_reacquire(self, tmp_path):
+        path = default_lock_path(tmp_path)
+        first = RunLock(path)
+        first.acquire()
+        first.release()
+
+        second = RunLock(path)
+        second.acquire()
+        assert second.held
+        second.release()
+
+    def test_release_is_idempotent(self, tmp_path):
+        lock = RunLock(default_lock_path(tmp_path))
+        lock.acquire()
+        lock.release()
+        lock.release()
+        assert not lock.held
+
+
+class TestLockHolder:
+    def test_describe_includes_host(self):
+        holder = LockHolder(pid=42, started_at=0.0, host="box")
+        assert holder.describe().startswith("pid 42 on box, started ")
+
+    def test_describe_without_host(self):
+        holder = LockHolder(pid=42, started_at=0.0)
+        assert holder.describe().startswith("pid 42, started ")
@@ -0,0 +1,202 @@
+import gzip
+import os
+import sys
+from unittest.mock import patch
+
+from geoff.executor import execute_opencode_loop
+from geoff.run_log import (
+    IterationLog,
+    IterationRecord,
+    RunRecorder,
+    create_run_dir,
+    enforce_run_size,
+    index_path_for,
+    iter_log_lines,
+    iteration_log_path,
+    prune_runs,
+    read_index,
+    read_telemetry,
+)
+
+
+class TestIterationLog:
+    """Tests for the gzip log writer and its line index."""
+
+    def test_round_trips_through_gzip(self, tmp_path):
+        path = tmp_path / "iter-0001.log.gz"
+        with IterationLog(path, flush_bytes=16) as log:
+            log.write(b"first line\nsecond ")
+            log.write(b"line\nthird line\n")
+
+        with gzip.open(path, "rb") as f:
+            assert f.read() == b"first line\nsecond line\nthird line\n"
+
+    def test_buffer_stays_bounded(self, tmp_path):
+        log = IterationLog(tmp_path / "iter-0001.log.gz", flush_bytes=1024)
+        for _ in range(100):
+            log.write(b"x" * 100 + b"\n")
+            assert len(log._buffer) < 1024
+        log.close()
+
+    def test_seeks_to_line_without_reading_from_start(self, tmp_path):
+        path = tmp_path / "iter-0001.log.gz"
+        with IterationLog(path, flush_bytes=4096) as log:
+            for i in range(5000):
+                log.write(f"line {i}\n".encode())
+
+        entries = read_index(path)
+        assert len(entries) > 1
+        assert entries[0] == (0, 0, 0)
+
+        lines = iter_log_lines(path, start_line=4321)
+        assert next(lines) == b"line 4321\n"
+        assert next(lines) == b"line 4322\n"
+
+    def test_index_handles_lines_longer_than_a_member(self, tmp_path):
+        path = tmp_path / "iter-0001.log.gz"
+        with IterationLog(path, flush_bytes=64) as log:
+            log.write(b"short\n" + b"y" * 500 + b"\nafter\nend\n")
+
+        assert list(iter_log_lines(path, start_line=2)) == [b"after\n", b"end\n"]
+        assert next(iter_log_lines(path, start_line=1)) == b"y" * 500 + b"\n"
+
+    def test_partial_final_line_is_kept(self, tmp_path):
+        path = tmp_path / "iter-0001.log.gz"
+        with IterationLog(path) as log:
+            log.write(b"done\nspinner")
+
+        assert list(iter_log_lines(path)) == [b"done\n", b"spinner"]
+
+
+class TestRunRetention:
+    """Tests for run directory retention and per-run rotation."""
+
+    def test_prune_runs_keeps_newest(self, tmp_path):
+        runs = [create_run_dir(tmp_path, f"run-{i}") for i in range(4)]
+        for i, run in enumerate(runs):
+            os.utime(run, ns=(i * 10**9, i * 10**9))
+
+        removed = prune_runs(tmp_path, keep=2)
+
+        assert removed == runs[:2]
+        assert [p.exists() for p in runs] == [False, False, True, True]
+
+    def test_prune_runs_zero_keeps_everything(self, tmp_path):
+        create_run_dir(tmp_path, "a")
+        create_run_dir(tmp_path, "b")
+
+        assert prune_runs(tmp_path, keep=0) == []
+
+    def test_enforce_run_size_drops_oldest_iterations(self, tmp_path):
+        run_dir = create_run_dir(tmp_path, "run")
+        for i in range(1, 4):
+            with IterationLog(iteration_log_path(run_dir, i)) as log:
+                log.write(os.urandom(2000))
+
+        removed = enforce_run_size(run_dir, max_bytes=3000)
+
+        assert removed == [
+            iteration_log_path(run_dir, 1),
+            iteration_log_path(run_dir, 2),
+        ]
+        assert not index_path_for(iteration_log_path(run_dir, 1)).exists()
+        assert iteration_log_path(run_dir, 3).exists()
+
+
+class TestLoopLogging:
+    """Tests for loop integration."""
+
+    @patch("geoff.executor.time.sleep")
+    @patch("geoff.executor.compute_repo_hash", return_value="same")
+    @patch("geoff.executor._build_opencode_command")
+    def test_loop_writes_one_log_per_iteration(
+        self, mock_cmd, mock_hash, mock_sleep, tmp_path, capsys
+    ):
+        mock_cmd.return_value = [sys.executable, "-c", "print('agent output')"]
+        run_dir = create_run_dir(tmp_path, "run")
+
+        execute_opencode_loop(
+            "prompt", max_stuck=2, exec_dir=tmp_path, recorder=RunRecorder(run_dir)
+        )
+
+        for i in (1, 2):
+            path = iteration_log_path(run_dir, i)
+            assert list(iter_log_lines(path)) == [b"agent output\n"]
+        assert "agent output" in capsys.readouterr().out
+
+    @patch("geoff.executor.time.sleep")
+    @patch("geoff.executor.compute_repo_hash")
+    @patch("geoff.executor._build_opencode_command")
+    def test_loop_writes_telemetry_record_per_iteration(
+        self, mock_cmd, mock_hash, mock_sleep, tmp_path
+    ):
+        mock_cmd.return_value = [
+            sys.executable,
+            "-c",
+            "print('12345'); raise SystemExit(4)",
+        ]
+        mock_hash.side_effect = ["a", "b", "b", "b"]
+        recorder = RunRecorder(create_run_dir(tmp_path, "run"), log_output=False)
+
+        execute_opencode_loop(
+            "prompt", max_stuck=1, exec_dir=tmp_path, recorder=recorder
+        )
+
+        records = read_telemetry(recorder.telemetry_path)
+        assert [r.iteration for r in records] == [1, 2]
+        assert [r.changed for r in records] == [True, False]
+        assert [r.stuck_count for r in records] == [0, 1]
+        first = records[0]
+        assert first.exit_code == 4
+        assert first.output_bytes == 6
+        assert first.frozen is False
+        assert first.changed_paths is None
+        assert first.ended_at >= first.started_at
+        assert first.agent_seconds > 0
+        assert first.hash_seconds >= 0
+        assert first.delay_seconds == 2.0
+        assert records[1].delay_seconds == 0.0
+        assert not list(recorder.run_dir.glob("iter-*.log.gz"))
+
+
+class TestTelemetry:
+    """Tests for the iterations.jsonl stream."""
+
+    def test_read_telemetry_skips_torn_final_line(self, tmp_path):
+        recorder = RunRecorder(tmp_path / "run")
+        recorder.record(
+            IterationRecord(
+                iteration=1,
+                started_at=1.0,
+                ended_at=2.0,
+                agent_seconds=0.9,
+                hash_seconds=0.1,
+                output_bytes=10,
+                exit_code=0,
+                frozen=False,
+                stuck_count=0,
+                changed=True,
+                changed_paths=["a.py"],
+            )
+        )
+        with open(recorder.telemetry_path, "a", encoding="utf-8") as f:
+            f.write('{"iteration": 2, "start')
+
+        records = read_telemetry(recorder.telemetry_path)
+
+        assert len(records) == 1
+        assert records[0].changed_paths == ["a.py"]
+
+    def test_disabled_telemetry_writes_nothing(self, tmp_path):
+        recorder = RunRecorder(tmp_path / "run", telemetry=False)
+        recorder.record(IterationRecord(1, 1.0, 2.0, 1.0, 0.0, 0, 0, False, 0, False))
+
+        assert not recorder.telemetry_path.exists()
+
+    def test_worker_recorders_use_subdirectories(self, tmp_path):
+        recorder = RunRecorder(tmp_path / "run", log_max_run_bytes=5)
+        worker = recorder.for_worker(2)
+
+        assert worker.run_dir == tmp_path / "run" / "worker-2"
+        assert worker.run_dir.is_dir()
+        assert worker.log_max_run_bytes == 5
@@ -0,0 +1,51 @@
+import subprocess
+import sys
+
+# Modules the TUI must not load before its first frame.
+DEFERRED_MODULES = (
+    "geoff.executor",
+    "geoff.clipboard",
+    "geoff.widgets.error_modal",
+    "pyperclip",
+    "yaml",
+)
+
+# Whole-import budget for `geoff.main` + `geoff.app` (Textual included), and
+# the share of it spent in geoff's own modules.
+STARTUP_BUDGET_US = 1_500_000
+GEOFF_SELF_BUDGET_US = 100_000
+
+
+def _import_times(code):
+    """Run ``code`` under ``-X importtime``; map module -> (self, cumulative)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        self_us = int(parts[0].rsplit(":", 1)[1])
+        times[parts[2].strip()] = (self_us, int(parts[1]))
+    return times
+
+
+def test_tui_startup_defers_heavy_modules():
+    times = _import_times("import geoff.main, geoff.app")
+
+    loaded = [name for name in DEFERRED_MODULES if name in times]
+    assert loaded == []
+
+
+def test_tui_startup_import_budget():
+    times = _import_times("import geoff.main, geoff.app")
+
+    total = times["geoff.main"][1] + times["geoff.app"][1]
+    own = sum(s for name, (s, _) in times.items() if name.split(".")[0] == "geoff")
+
+    assert total < STARTUP_BUDGET_US, f"TUI imports took {total} us"
+    assert own < GEOFF_SELF_BUDGET_US, f"geoff modules took {own} us"
@@ -0,0 +1,75 @@
+from unittest.mock import patch
+
+from geoff.config import PromptConfig
+from geoff.config_manager import ConfigManager
+from geoff.executor import ProcessResult, execute_opencode_loop
+from geoff.loop_state import default_state_path
+from geoff.run_log import RunRecorder, create_run_dir
+from geoff.state_dir import STATE_GITIGNORE, ensure_state_dir
+from tests.conftest import git
+
+
+class TestEnsureStateDir:
+    def test_creates_directory_and_gitignore(self, tmp_path):
+        state_dir = ensure_state_dir(tmp_path)
+
+        assert state_dir == tmp_path / ".geoff"
+        assert (state_dir / ".gitignore").read_text() == STATE_GITIGNORE
+
+    def test_keeps_existing_gitignore(self, tmp_path):
+        (tmp_path / ".geoff").mkdir()
+        (tmp_path / ".geoff" / ".gitignore").write_text("custom\n")
+
+        ensure_state_dir(tmp_path)
+
+        assert (tmp_path / ".geoff" / ".gitignore").read_text() == "custom\n"
+
+    def test_git_ignores_local_state_but_not_config(self, git_repo):
+        ensure_state_dir(git_repo)
+        state_files = [
+            "runs/20260101-000000-1/iter-0001.log.gz",
+            "cache/config.json",
+            "worktrees/worker-1/README.md",
+            "loop-state",
+            "run.lock",
+            "geoff.yaml.lock",
+            ".geoff.yaml.1.0.tmp",
+        ]
+        for name in state_files:
+            path = git_repo / ".geoff" / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("x")
+        (git_repo / ".geoff" / "geoff.yaml").write_text("max_stuck: 3\n")
+
+        assert git(git_repo, "status", "--porcelain", "--untracked-files=all") == (
+            "?? .geoff/.gitignore\n?? .geoff/geoff.yaml"
+        )
+
+
+class TestStateDirWriters:
+    @patch("geoff.executor.compute_repo_hash", return_value="same")
+    @patch("geoff.executor._run_opencode_with_frozen_timeout")
+    def test_loop_leaves_only_the_gitignore_untracked(
+        self, mock_run, mock_hash, git_repo
+    ):
+        mock_run.return_value = ProcessResult(returncode=0)
+        recorder = RunRecorder(create_run_dir(git_repo))
+        execute_opencode_loop(
+            "prompt",
+            max_iterations=1,
+            exec_dir=git_repo,
+            recorder=recorder,
+            checkpoint_path=default_state_path(git_repo),
+        )
+
+        assert (git_repo / ".geoff" / "run.lock").exists()
+        assert (git_repo / ".geoff" / "loop-state").exists()
+        assert git(git_repo, "status", "--porcelain", "--untracked-files=all") == (
+            "?? .geoff/.gitignore"
+        )
+
+    def test_config_manager_writes_gitignore(self, tmp_path):
+        manager = ConfigManager(tmp_path)
+        manager.save_repo_config(PromptConfig())
+
+        assert (tmp_path / ".geoff" / ".gitignore").read_text() == STATE_GITIGNORE
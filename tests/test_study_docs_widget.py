@@ -1,9 +1,13 @@
+import time
+from unittest.mock import patch
+
 import pytest
 from hypothesis import given, settings, strategies as st
 from textual.app import App, ComposeResult
 from textual.widgets import Input, Checkbox, Select
 from textual.containers import Vertical
 from geoff.config import PromptConfig
+from geoff.models_cache import ModelsCache
 from geoff.widgets.study_docs import StudyDocsWidget, DocRow
 
 
@@ -34,6 +38,20 @@ class StudyDocsApp(App):
         yield StudyDocsWidget(self.config_obj)
 
 
+class CachedModelsApp(App):
+    def __init__(self, config, models_cache):
+        super().__init__()
+        self.config_obj = config
+        self.models_cache = models_cache
+
+    def compose(self) -> ComposeResult:
+        yield StudyDocsWidget(self.config_obj, models_cache=self.models_cache)
+
+
+def _option_values(select):
+    return [value for _, value in select._options]
+
+
 @given(
     study_docs=st.lists(filepath_strategy(), max_size=5),
     model=model_strategy(),
@@ -107,11 +125,9 @@ async def test_study_docs_update_from_config(
         )
         await widget.update_from_config(new_config)
 
-        assert len(widget.query(DocRow)) == len(new_docs)
-
-        for i, expected_doc in enumerate(new_docs):
-            input_widget = widget.query_one(f"#doc-input-{i}", Input)
-            assert input_widget.value == expected_doc
+        rows = list(widget.query(DocRow))
+        assert [row.query_one(Input).value for row in rows] == new_docs
+        assert [row.index for row in rows] == list(range(len(new_docs)))
 
         model_select = widget.query_one("#model-select", Select)
         assert model_select.value == new_model
@@ -246,3 +262,223 @@ async def test_breadcrumb_toggle_property(initial_enabled, toggle_times):
             expected = not expected
             assert checkbox.value == expected
             assert config.breadcrumb_enabled == expected
+
+
+@pytest.mark.asyncio
+async def test_fresh_model_cache_is_served_without_fetching(tmp_path):
+    cache = ModelsCache(tmp_path / "models.json")
+    cache.store(["openai/gpt-4o", "anthropic/claude"])
+
+    with patch.object(StudyDocsWidget, "_fetch_opencode_models") as mock_fetch:
+        app = CachedModelsApp(PromptConfig(model="default"), cache)
+        async with app.run_test() as pilot:
+            select = app.query_one("#model-select", Select)
+            await pilot.click("#model-select")
+            await pilot.pause()
+
+            assert _option_values(select) == [
+                "default",
+                "openai/gpt-4o",
+                "anthropic/claude",
+            ]
+
+    mock_fetch.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_stale_model_cache_is_refreshed_in_background(tmp_path):
+    cache = ModelsCache(tmp_path / "models.json", ttl=60)
+    cache.store(["openai/old"], now=time.time() - 120)
+
+    with patch.object(
+        StudyDocsWidget,
+        "_fetch_opencode_models",
+        return_value=(["openai/new"], None),
+    ) as mock_fetch:
+        app = CachedModelsApp(PromptConfig(model="openai/old"), cache)
+        async with app.run_test() as pilot:
+            widget = app.query_one(StudyDocsWidget)
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            select = widget.query_one("#model-select", Select)
+            # The configured model stays selectable after the swap.
+            assert _option_values(select) == ["default", "openai/new", "openai/old"]
+            assert select.value == "openai/old"
+
+    mock_fetch.assert_called_once()
+    cached = cache.load()
+    assert cached.models == ["openai/new"]
+    assert cached.is_fresh(cache.ttl)
+
+
+@pytest.mark.asyncio
+async def test_background_refresh_failure_keeps_cached_models(tmp_path):
+    cache = ModelsCache(tmp_path / "models.json", ttl=60)
+    cache.store(["openai/old"], now=time.time() - 120)
+
+    with patch.object(
+        StudyDocsWidget,
+        "_fetch_opencode_models",
+        return_value=([], "Opencode command not found"),
+    ):
+        app = CachedModelsApp(PromptConfig(), cache)
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            select = app.query_one("#model-select", Select)
+            assert _option_values(select) == ["default", "openai/old"]
+            assert not app._notifications
+
+
+@pytest.mark.asyncio
+async def test_removing_a_doc_keeps_other_rows_and_focus():
+    config = PromptConfig(study_docs=["a.md", "b.md", "c.md"])
+    app = StudyDocsApp(config)
+
+    async with app.run_test() as pilot:
+        widget = app.query_one(StudyDocsWidget)
+        kept = [widget.query_one(f"#doc-input-{i}", Input) for i in (1, 2)]
+        kept[1].focus()
+        await pilot.pause()
+
+        await widget.remove_doc_row(widget.query_one("#doc-row-0", DocRow))
+        await pilot.pause()
+
+        assert config.study_docs == ["b.md", "c.md"]
+        assert [row.index for row in widget.query(DocRow)] == [0, 1]
+        assert [row.query_one(Input) for row in widget.query(DocRow)] == kept
+        assert app.focused is kept[1]
+
+        # Edits still land on the doc's current position.
+        kept[1].post_message(Input.Changed(kept[1], "z.md"))
+        await pilot.pause()
+        assert config.study_docs == ["b.md", "z.md"]
+
+
+@pytest.mark.asyncio
+async def test_added_row_takes_smallest_free_key():
+    config = PromptConfig(study_docs=["a.md", "b.md"])
+    app = StudyDocsApp(config)
+
+    async with app.run_test() as pilot:
+        widget = app.query_one(StudyDocsWidget)
+        await pilot.click("#remove-doc-0")
+        await pilot.pause()
+        await pilot.click("#add-doc-btn")
+        await pilot.pause()
+
+        rows = list(widget.query(DocRow))
+        assert [row.key for row in rows] == [1, 0]
+        assert [row.index for row in rows] == [0, 1]
+        assert widget.query_one("#doc-input-0", Input).value == "docs/SPEC.md"
+        assert config.study_docs == ["b.md", "docs/SPEC.md"]
+
+
+@pytest.mark.asyncio
+async def test_added_row_is_mounted_after_the_last_row():
+    config = PromptConfig(study_docs=[])
+    app = StudyDocsApp(config)
+
+    async with app.run_test() as pilot:
+        widget = app.query_one(StudyDocsWidget)
+        docs_list = widget.query_one("#docs-list")
+        await widget.add_doc()
+        await widget.add_doc()
+        await pilot.pause()
+
+        first, second = widget.query(DocRow)
+        assert list(docs_list.children) == [
+            first,
+            second,
+            widget.query_one("#add-doc-btn"),
+        ]
+
+
+@pytest.mark.asyncio
+async def test_update_from_config_reuses_rows():
+    config = PromptConfig(study_docs=["a.md", "b.md", "c.md"])
+    app = StudyDocsApp(config)
+
+    async with app.run_test() as pilot:
+        widget = app.query_one(StudyDocsWidget)
+        before = list(widget.query(DocRow))
+
+        await widget.update_from_config(PromptConfig(study_docs=["a.md", "x.md"]))
+        await pilot.pause()
+
+        rows = list(widget.query(DocRow))
+        assert rows == before[:2]
+        assert [row.query_one(Input).value for row in rows] == ["a.md", "x.md"]
+
+
+@pytest.mark.asyncio
+async def test_update_from_config_keys_rows_by_doc():
+    config = PromptConfig(study_docs=["a.md", "b.md", "c.md"])
+    app = StudyDocsApp(config)
+
+    async with app.run_test() as pilot:
+        widget = app.query_one(StudyDocsWidget)
+        a, b, c = widget.query(DocRow)
+        c.query_one(Input).focus()
+        await pilot.pause()
+
+        # Dropping the first doc removes its row; the others keep theirs.
+        with patch.object(Input, "_watch_value") as mock_watch:
+            await widget.update_from_config(PromptConfig(study_docs=["b.md", "c.md"]))
+            await pilot.pause()
+        mock_watch.assert_not_called()
+        assert list(widget.query(DocRow)) == [b, c]
+        assert [row.index for row in (b, c)] == [0, 1]
+        assert app.focused is c.query_one(Input)
+
+        # Inserting and reordering moves rows rather than rewriting them.
+        await widget.update_from_config(
+            PromptConfig(study_docs=["c.md", "new.md", "b.md"])
+        )
+        await pilot.pause()
+        rows = list(widget.query(DocRow))
+        assert rows[0] is c and rows[2] is b
+        assert [row.query_one(Input).value for row in rows] == [
+            "c.md",
+            "new.md",
+            "b.md",
+        ]
+        assert [row.index for row in rows] == [0, 1, 2]
+        assert app.focused is c.query_one(Input)
+
+
+@pytest.mark.asyncio
+async def test_input_changes_queued_during_sync_use_final_positions():
+    config = PromptConfig(study_docs=["q.md", "m.md", "m.md"])
+    app = StudyDocsApp(config)
+
+    async with app.run_test() as pilot:
+        widget = app.query_one(StudyDocsWidget)
+        new_config = PromptConfig(study_docs=["m.md", "x.md"])
+
+        # The q.md row is reused for x.md and moved below the m.md row
+        # while the input's change event is still queued.
+        await widget.update_from_config(new_config)
+        await pilot.pause()
+
+        assert new_config.study_docs == ["m.md", "x.md"]
+        rows = list(widget.query(DocRow))
+        assert [row.query_one(Input).value for row in rows] == ["m.md", "x.md"]
+
+
+@pytest.mark.asyncio
+async def test_update_from_config_handles_duplicate_docs():
+    config = PromptConfig(study_docs=["a.md", "a.md", "b.md"])
+    app = StudyDocsApp(config)
+
+    async with app.run_test() as pilot:
+        widget = app.query_one(StudyDocsWidget)
+        first, second, b = widget.query(DocRow)
+
+        await widget.update_from_config(PromptConfig(study_docs=["b.md", "a.md"]))
+        await pilot.pause()
+
+        assert list(widget.query(DocRow)) == [b, first]
+        assert [row.query_one(Input).value for row in (b, first)] == ["b.md", "a.md"]
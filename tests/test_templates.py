@@ -0,0 +1,69 @@
+import pytest
+from hypothesis import given, settings, strategies as st
+
+from geoff.config import PromptConfig
+from geoff.templates import (
+    TemplateError,
+    compile_template,
+    render_template,
+    template_errors,
+)
+
+
+class TestCompileTemplate:
+    def test_segments(self):
+        template = compile_template("follow {tasklist} now", "tasklist")
+
+        assert [(s.literal, s.field) for s in template.segments] == [
+            ("follow ", "tasklist"),
+            (" now", None),
+        ]
+
+    def test_is_cached(self):
+        assert compile_template("a {tasklist}", "tasklist") is compile_template(
+            "a {tasklist}", "tasklist"
+        )
+
+    def test_escaped_braces_are_literal(self):
+        template = compile_template("{{x}} {tasklist}", "tasklist")
+        assert template.render("P") == "{x} P"
+
+    def test_format_spec_and_conversion(self):
+        template = compile_template("[{tasklist!r:>6}]", "tasklist")
+        assert template.render("P") == "[{tasklist!r:>6}]".format(tasklist="P")
+
+    @pytest.mark.parametrize(
+        "source", ["{taskilst}", "{}", "{0}", "{tasklist.x}", "{tasklist!z}", "{", "}"]
+    )
+    def test_invalid(self, source):
+        with pytest.raises(TemplateError):
+            compile_template(source, "tasklist")
+
+
+def test_render_template_returns_broken_template_verbatim():
+    assert render_template("see {breadcrumb}", "breadcrumbs", "B.md") == (
+        "see {breadcrumb}"
+    )
+
+
+def test_template_errors_for_defaults():
+    assert template_errors(PromptConfig()) == []
+
+
+@given(
+    literals=st.lists(
+        st.text(alphabet="ab {}\n", max_size=8).map(
+            lambda t: t.replace("{", "{{").replace("}", "}}")
+        ),
+        min_size=1,
+        max_size=4,
+    ),
+    value=st.text(max_size=20),
+)
+@settings(max_examples=100)
+def test_render_matches_str_format(literals, value):
+    source = "{tasklist}".join(literals)
+
+    assert compile_template(source, "tasklist").render(value) == source.format(
+        tasklist=value
+    )
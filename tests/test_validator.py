@@ -3,7 +3,7 @@ from hypothesis import given, settings, strategies as st, HealthCheck
 from pathlib import Path
 
 from geoff.config import PromptConfig
-from geoff.validator import PromptValidator
+from geoff.validator import LiveValidator, PathCache, PromptValidator
 
 
 @pytest.fixture
@@ -202,6 +202,66 @@ class TestValidateFrozen:
         assert not any("frozen" in e.lower() for e in errors)
 
 
+class TestValidateParallelWorkers:
+    def test_zero_workers(self, validator):
+        config = PromptConfig(parallel_workers=0)
+        errors = validator.validate(config)
+        assert "Parallel workers must be >= 1" in errors
+
+    def test_multiple_workers_allowed(self, validator):
+        config = PromptConfig(parallel_workers=4)
+        errors = validator.validate(config)
+        assert not any("parallel workers" in e.lower() for e in errors)
+
+
+class TestValidateBatchConcurrency:
+    def test_zero_concurrency(self, validator):
+        config = PromptConfig(batch_concurrency=0)
+        errors = validator.validate(config)
+        assert "Batch concurrency must be >= 1" in errors
+
+
+class TestValidateLogSettings:
+    def test_negative_retention(self, validator):
+        config = PromptConfig(log_retain_runs=-1)
+        errors = validator.validate(config)
+        assert "Log retention must be >= 0" in errors
+
+    def test_negative_size_limit(self, validator):
+        config = PromptConfig(log_max_run_mb=-1)
+        errors = validator.validate(config)
+        assert "Log size limit must be >= 0" in errors
+
+
+class TestValidatePacing:
+    def test_negative_base_delay(self, validator):
+        config = PromptConfig(pacing_base_delay=-1)
+        errors = validator.validate(config)
+        assert "Pacing base delay must be >= 0" in errors
+
+    def test_max_below_base(self, validator):
+        config = PromptConfig(pacing_base_delay=10, pacing_max_delay=5)
+        errors = validator.validate(config)
+        assert "Pacing max delay must be >= base delay" in errors
+
+    def test_jitter_out_of_range(self, validator):
+        config = PromptConfig(pacing_jitter=1.5)
+        errors = validator.validate(config)
+        assert "Pacing jitter must be between 0 and 1" in errors
+
+    def test_unknown_policy(self, validator):
+        config = PromptConfig(pacing="sometimes")
+        errors = validator.validate(config)
+        assert "Unknown pacing policy: sometimes" in errors
+
+
+class TestValidateConfigSaveDebounce:
+    def test_negative_debounce(self, validator):
+        config = PromptConfig(config_save_debounce=-0.1)
+        errors = validator.validate(config)
+        assert "Config save debounce must be >= 0" in errors
+
+
 class TestIsValid:
     def test_valid_config(self, validator):
         config = PromptConfig(
@@ -603,3 +663,148 @@ class TestValidatorPropertyBased:
             )
             errors = validator.validate(config)
             assert not any("Study doc" in e for e in errors)
+
+
+class TestValidateTemplates:
+    def test_default_templates_are_valid(self, tmp_path):
+        validator = PromptValidator(execution_dir=tmp_path)
+        errors = validator.validate(PromptConfig(breadcrumb_enabled=False))
+        assert not any("template" in e for e in errors)
+
+    def test_unknown_placeholder_is_reported(self, tmp_path):
+        validator = PromptValidator(execution_dir=tmp_path)
+        config = PromptConfig(
+            breadcrumb_enabled=False, prompt_tasklist_update="update {taskilst}"
+        )
+
+        errors = validator.validate(config)
+
+        assert (
+            "Invalid template prompt_tasklist_update: unknown placeholder "
+            "{taskilst} (expected {tasklist})" in errors
+        )
+
+    def test_malformed_template_is_reported(self, tmp_path):
+        validator = PromptValidator(execution_dir=tmp_path)
+        config = PromptConfig(
+            breadcrumb_enabled=False, prompt_breadcrumb_instruction="see {breadcrumbs"
+        )
+
+        errors = validator.validate(config)
+
+        assert any(e.startswith("Invalid template prompt_breadcrumb_") for e in errors)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestPathCache:
+    def test_caches_until_ttl(self, tmp_path):
+        clock = FakeClock()
+        cache = PathCache(ttl=1.0, clock=clock)
+        path = tmp_path / "doc.md"
+
+        assert cache.exists(path) is False
+        path.write_text("")
+        assert cache.exists(path) is False
+
+        clock.now = 1.0
+        assert cache.exists(path) is True
+
+    def test_invalidate(self, tmp_path):
+        cache = PathCache(ttl=60)
+        path = tmp_path / "doc.md"
+        assert cache.exists(path) is False
+
+        path.write_text("")
+        cache.invalidate(path)
+        assert cache.exists(path) is True
+
+
+class TestLiveValidator:
+    def _config(self, tmp_path, **overrides):
+        (tmp_path / "SPEC.md").write_text("")
+        (tmp_path / "PLAN.md").write_text("")
+        values = dict(
+            study_docs=["SPEC.md", "missing.md"],
+            tasklist_file="PLAN.md",
+            breadcrumbs_file="crumbs/BREADCRUMBS.md",
+        )
+        values.update(overrides)
+        return PromptConfig(**values)
+
+    def test_errors_match_validate_without_creating_breadcrumbs(self, tmp_path):
+        config = self._config(tmp_path, max_stuck=-1)
+        live = LiveValidator(tmp_path)
+
+        live.update(config)
+
+        assert not (tmp_path / "crumbs").exists()
+        assert live.errors == PromptValidator(tmp_path).validate(config)
+        assert live.errors == [
+            "Study doc file not found: missing.md",
+            "Max stuck must be >= 0",
+        ]
+
+    def test_rechecks_only_changed_fields(self, tmp_path):
+        config = self._config(tmp_path)
+        live = LiveValidator(tmp_path, ttl=60)
+        live.update(config)
+
+        config.study_docs[1] = "SPEC.md"
+        changed = live.update(config)
+
+        assert live.rechecked == ("study_doc:1",)
+        assert changed == {"study_doc:1"}
+        assert live.errors == []
+
+    def test_unchanged_config_rechecks_nothing(self, tmp_path):
+        config = self._config(tmp_path)
+        live = LiveValidator(tmp_path, ttl=60)
+        live.update(config)
+
+        assert live.update(config) == set()
+        assert live.rechecked == ()
+
+    def test_file_checks_expire(self, tmp_path):
+        config = self._config(tmp_path)
+        live = LiveValidator(tmp_path, ttl=1.0)
+        clock = FakeClock()
+        live.path_cache.clock = clock
+        live.update(config)
+
+        (tmp_path / "missing.md").write_text("")
+        assert live.update(config) == set()
+
+        clock.now = 1.0
+        assert live.update(config) == {"study_doc:1"}
+        assert "settings" not in live.rechecked
+        assert live.field_errors("study_doc:1") == []
+
+    def test_removed_doc_is_reported_changed(self, tmp_path):
+        config = self._config(tmp_path)
+        live = LiveValidator(tmp_path, ttl=60)
+        live.update(config)
+
+        config.study_docs.pop()
+        assert live.update(config) == {"study_doc:1"}
+        assert live.field_errors("study_doc:1") == []
+        assert live.errors == []
+
+    def test_uncreatable_breadcrumbs_path(self, tmp_path):
+        (tmp_path / "file").write_text("")
+        config = self._config(
+            tmp_path, study_docs=[], breadcrumbs_file="file/BREADCRUMBS.md"
+        )
+        live = LiveValidator(tmp_path)
+
+        live.update(config)
+
+        assert live.field_errors("breadcrumbs") == [
+            "Invalid breadcrumbs file path: file/BREADCRUMBS.md"
+        ]
@@ -0,0 +1,85 @@
+"""Benchmark YAML config parse/dump with libyaml against pure Python.
+
+Builds a large repo config (``--docs`` study docs and ``--lines``
+backpressure lines, plus the normal scalar fields) and times loading and
+dumping it with PyYAML's pure-Python ``SafeLoader``/``SafeDumper`` and with
+the loader/dumper ``geoff.config_io`` selects (``CSafeLoader``/
+``CSafeDumper`` when PyYAML was built with libyaml).
+
+Usage:
+    python utils/bench_config_yaml.py [--docs 500] [--lines 200]
+"""
+
+import argparse
+import sys
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from geoff.config import PromptConfig  # noqa: E402
+from geoff.config_io import yaml_codec  # noqa: E402
+
+
+def build_config(docs: int, lines: int) -> dict:
+    config = PromptConfig(
+        study_docs=[f"docs/area-{i // 50:02d}/spec-{i:04d}.md" for i in range(docs)],
+        prompt_backpressure_lines=[
+            f"- Rule {i}: run the checks for component {i} and fix every failure "
+            "before moving on to the next item."
+            for i in range(lines)
+        ],
+    )
+    return asdict(config)
+
+
+def timed(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=500)
+    parser.add_argument("--lines", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    data = build_config(args.docs, args.lines)
+    _, loader, dumper = yaml_codec()
+    text = yaml.safe_dump(data, default_flow_style=False)
+    fast_text = yaml.dump(data, Dumper=dumper, default_flow_style=False)
+    assert yaml.load(fast_text, Loader=loader) == data
+    assert fast_text == text, "libyaml output differs from pure Python"
+
+    print(f"Config: {args.docs} study docs, {args.lines} lines, {len(text)} bytes")
+    print(f"Selected: {loader.__name__} / {dumper.__name__}")
+
+    rows = [
+        ("parse, SafeLoader", lambda: yaml.load(text, Loader=yaml.SafeLoader)),
+        (f"parse, {loader.__name__}", lambda: yaml.load(text, Loader=loader)),
+        (
+            "dump, SafeDumper",
+            lambda: yaml.dump(data, Dumper=yaml.SafeDumper, default_flow_style=False),
+        ),
+        (
+            f"dump, {dumper.__name__}",
+            lambda: yaml.dump(data, Dumper=dumper, default_flow_style=False),
+        ),
+    ]
+    results = [(label, timed(fn, args.repeat)) for label, fn in rows]
+    for label, seconds in results:
+        print(f"{label + ':':<24}{seconds * 1000:8.1f} ms")
+    print(f"parse speedup: {results[0][1] / results[1][1]:5.1f}x")
+    print(f"dump speedup:  {results[2][1] / results[3][1]:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Benchmark adding and removing study docs in the TUI with Pilot.
+
+Mounts ``StudyDocsWidget`` headless with ``--sizes`` study docs and times,
+per list size:
+
+- adding one doc (mounts one row after the last one),
+- removing the first doc (unmounts one row, reindexes the rest in place),
+- reloading a config that drops the first doc (keyed reconciliation:
+  unmounts one row, touches no other input),
+- rebuilding the whole list, as the widget did before keyed rows
+  (``remove_children`` and remounting every row plus the Add button).
+
+Each time is reported twice: the widget update alone, and including the
+layout pass that follows it. Only the rebuild does work per row in the
+DOM. Add is not constant-time: awaiting the mount waits for Textual to
+compose the new row, and a screen layout pass that runs meanwhile lays
+out every child of the docs list. Remove and reload unmount without
+waiting for layout, so their widget update stays nearly flat. The layout pass
+itself re-arranges the whole screen, so it grows with the number of
+rows either way.
+
+Usage:
+    python utils/bench_doc_rows.py [--sizes 10 50 200] [--repeat 5]
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from dataclasses import replace
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from textual.app import App, ComposeResult  # noqa: E402
+from textual.containers import Vertical  # noqa: E402
+from textual.widgets import Button  # noqa: E402
+
+from geoff.config import PromptConfig  # noqa: E402
+from geoff.models_cache import ModelsCache  # noqa: E402
+from geoff.widgets.study_docs import DocRow, StudyDocsWidget  # noqa: E402
+
+
+class DocsApp(App):
+    def __init__(self, docs: int, cache_dir: Path):
+        super().__init__()
+        self.config = PromptConfig(
+            study_docs=[f"docs/spec-{i:04d}.md" for i in range(docs)]
+        )
+        self.models_cache = ModelsCache(cache_dir / "models.json")
+
+    def compose(self) -> ComposeResult:
+        yield StudyDocsWidget(self.config, models_cache=self.models_cache)
+
+
+async def timed(step, pilot, repeat: int, undo=None) -> tuple:
+    """Best time of ``step`` itself, and of ``step`` plus the layout pass.
+
+    ``undo``, if given, runs untimed after each repeat.
+    """
+    best_step = best_total = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await step()
+        stepped = time.perf_counter()
+        await pilot.pause()
+        best_step = min(best_step, stepped - start)
+        best_total = min(best_total, time.perf_counter() - start)
+        if undo is not None:
+            await undo()
+            await pilot.pause()
+    return best_step, best_total
+
+
+async def bench_size(docs: int, repeat: int, cache_dir: Path) -> tuple:
+    app = DocsApp(docs, cache_dir)
+    async with app.run_test(size=(120, 40)) as pilot:
+        widget = app.query_one(StudyDocsWidget)
+
+        add = await timed(widget.add_doc, pilot, repeat)
+        remove = await timed(
+            lambda: widget.remove_doc_row(widget.query(DocRow).first()), pilot, repeat
+        )
+        assert len(widget.query(DocRow)) == docs
+
+        study_docs = list(app.config.study_docs)
+
+        async def reload(docs: list) -> None:
+            await widget.update_from_config(
+                replace(app.config, study_docs=list(docs))
+            )
+
+        reloaded = await timed(
+            lambda: reload(study_docs[1:]),
+            pilot,
+            repeat,
+            undo=lambda: reload(study_docs),
+        )
+        assert len(widget.query(DocRow)) == docs
+
+        async def rebuild() -> None:
+            docs_list = widget.query_one("#docs-list", Vertical)
+            await docs_list.remove_children()
+            await docs_list.mount_all(
+                [DocRow(doc, i) for i, doc in enumerate(app.config.study_docs)]
+                + [Button("+ Add Doc", id="add-doc-btn", variant="primary")]
+            )
+
+        full = await timed(rebuild, pilot, repeat)
+    return add, remove, reloaded, full
+
+
+async def run(sizes: list, repeat: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        print("per operation: widget update / including Textual's layout pass")
+        print(
+            f"{'docs':>6}{'add':>22}{'remove':>22}{'reload':>22}{'rebuild':>22}"
+        )
+        for docs in sizes:
+            results = await bench_size(docs, repeat, Path(tmp))
+            cells = "".join(
+                f"{step * 1000:>9.1f} /{total * 1000:>7.1f} ms"
+                for step, total in results
+            )
+            print(f"{docs:>6}{cells}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args.sizes, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
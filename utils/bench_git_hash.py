@@ -0,0 +1,136 @@
+"""Benchmark git change-detection hashing on a synthetic repository.
+
+Builds and commits a repository of ``--files`` tracked files, then adds
+``--untracked`` untracked files and an ignored ``build`` tree of
+``--ignored`` files, and times:
+
+- the previous hash: ``git rev-parse`` twice, then ``git status``,
+- ``compute_repo_hash``: HEAD read in-process, then ``git status``,
+- HEAD and the index read in-process, a stat of every index entry, and
+  ``git ls-files --others`` for untracked files.
+
+The last one loses to ``git status`` at every repository size, because
+parsing the index in Python costs more than git's whole status run, so
+only HEAD is read in-process.
+
+Usage:
+    python utils/bench_git_hash.py [--files 40000] [--untracked 200]
+"""
+
+import argparse
+import hashlib
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from geoff.executor import compute_repo_hash  # noqa: E402
+from geoff.git_reader import GitReader  # noqa: E402
+
+
+def git(cwd: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=bench", "-c", "user.email=bench@example.com", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+    )
+
+
+def run(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        list(args), cwd=cwd, capture_output=True, text=True, check=True
+    ).stdout
+
+
+def legacy_hash(cwd: Path) -> str:
+    run(cwd, "git", "rev-parse", "--is-inside-work-tree")
+    head = run(cwd, "git", "rev-parse", "HEAD").strip()
+    status = run(cwd, "git", "status", "--porcelain", "-z", "--", ":(exclude).geoff")
+    hash_input = [head, status]
+    for part in status.split("\x00"):
+        if len(part) > 3 and (cwd / part[3:]).exists():
+            st = (cwd / part[3:]).stat()
+            hash_input.append(f"{part[3:]}:{st.st_mtime}:{st.st_size}")
+    return hashlib.sha256("\n".join(hash_input).encode()).hexdigest()[:16]
+
+
+def index_hash(cwd: Path) -> str:
+    reader = GitReader(cwd)
+    hash_input = [reader.read_head() or "no-head"]
+    root = str(cwd)
+    for entry in reader.read_index().entries:
+        hash_input.append(f"{entry.path}:{entry.mode:o}:{entry.sha}:{entry.stage}")
+        try:
+            st = os.lstat(f"{root}/{entry.path}")
+        except OSError:
+            hash_input.append(f"{entry.path}:deleted")
+            continue
+        if st.st_mtime_ns // 1_000_000_000 != entry.mtime_s:
+            hash_input.append(f"{entry.path}:{st.st_mtime_ns}:{st.st_size}")
+    others = run(cwd, "git", "ls-files", "--others", "--exclude-standard", "-z")
+    for rel in sorted(filter(None, others.split("\x00"))):
+        st = os.lstat(f"{root}/{rel}")
+        hash_input.append(f"{rel}:{st.st_mtime_ns}:{st.st_size}")
+    return hashlib.sha256("\n".join(hash_input).encode()).hexdigest()[:16]
+
+
+def populate(base: Path, count: int, per_dir: int = 100) -> None:
+    for i in range(count):
+        directory = base / f"d{i // per_dir // 10:03d}" / f"s{i // per_dir:04d}"
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / f"f{i:06d}.txt").write_bytes(b"x" * (i % 64))
+
+
+def build_repo(root: Path, files: int, untracked: int, ignored: int) -> None:
+    git(root, "init", "-q")
+    (root / ".gitignore").write_text("build/\n")
+    populate(root / "src", files)
+    git(root, "add", ".")
+    git(root, "commit", "-q", "-m", "initial")
+    populate(root / "new", untracked)
+    populate(root / "build", ignored)
+    # A warm git status refreshes the index stat data, as a real repo's is.
+    git(root, "status")
+
+
+def timed(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=40_000)
+    parser.add_argument("--untracked", type=int, default=200)
+    parser.add_argument("--ignored", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        print(
+            f"Building repo: {args.files} tracked, {args.untracked} untracked, "
+            f"{args.ignored} ignored files"
+        )
+        build_repo(root, args.files, args.untracked, args.ignored)
+
+        legacy = timed(lambda: legacy_hash(root), args.repeat)
+        current = timed(lambda: compute_repo_hash(root), args.repeat)
+        index = timed(lambda: index_hash(root), args.repeat)
+
+        print(f"rev-parse x2 + git status:     {legacy * 1000:8.1f} ms")
+        print(f"compute_repo_hash:             {current * 1000:8.1f} ms")
+        print(f"index reader + ls-files:       {index * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()